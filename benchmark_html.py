@@ -0,0 +1,159 @@
+"""Times index.html rendering of MealPlanTemplate against a copy of the former generate_html
+
+The template is not faster than the old string concatenation, CPython already extends a string in
+place. What it adds is HTML escaping of all names, rendering from a WeekPlan without Tk variables
+and batch rendering of many weeks; this script shows that these cost no noticeable time.
+
+    python benchmark_html.py
+"""
+import time
+
+from essensplaner_app import MEAL_PLAN_TEMPLATE, DishSlot, WeekPlan
+
+
+SIZES = ((8, 10, 20), (40, 40, 5))  # (categories, rows, weeks): a typical plan and a very large one
+
+
+def legacy_page_html(plan):
+    """Copy of the former generate_html, the Tk variables are replaced by the plan fields
+    
+    Appends to one string cell by cell and does not escape anything.
+    """
+    week_range = f"Woche: {plan.week_start} - {plan.week_end}"
+    days = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
+    
+    html = f'''<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Essensplan {week_range}</title>
+    <link rel="stylesheet" href="styles.css">
+</head>
+<body>
+    <header>
+        <h1>{week_range}</h1>
+    </header>
+    <main>
+        <table>
+            <thead>
+                <tr>
+                    <th></th>'''
+    
+    for day in days:
+        html += f'\n                    <th>{day}</th>'
+        
+    html += '''
+                </tr>
+            </thead>
+            <tbody>'''
+    
+    total_categories = sum(row_count for _, row_count in plan.categories)
+    
+    category_row_counter = 0
+    
+    for category_name, row_count in plan.categories:
+        for row in range(row_count):
+            if row == 0:
+                category_display = category_name
+            else:
+                category_display = ""
+                
+            html += f'''
+                <tr>
+                    <th>{category_display}</th>'''
+            
+            for day_idx in range(7):
+                dish_counter = (day_idx * total_categories) + category_row_counter + 1
+                
+                day_name = days[day_idx]
+                slot = plan.slots.get(dish_counter, DishSlot(f"Gericht {dish_counter}"))
+                dish_name = slot.name
+                
+                if slot.empty:
+                    if plan.empty_cell_display == "-":
+                        html += '''
+                    <td class="empty-cell">
+                        <span class="no-food">-</span>
+                    </td>'''
+                    else:
+                        html += '''
+                    <td class="empty-cell">
+                        <span class="dish-name"></span>
+                    </td>'''
+                else:
+                    html += f'''
+                    <td>
+                        <span class="dish-name">{dish_name}</span>'''
+                    
+                    photo_path = slot.photo
+                    pdf_path = slot.pdf
+                    
+                    if plan.show_photos and photo_path != "/":
+                        photo_name = plan.photo_names.get(dish_counter, f"photo{dish_counter}.jpg")
+                        html += f'''
+                        <img src="media/photos/{photo_name}" alt="{category_name} {day_name}">'''
+                    
+                    if pdf_path != "/":
+                        pdf_name = plan.pdf_names.get(dish_counter, f"recipe{dish_counter}.pdf")
+                        html += f'''
+                        <a href="media/pdfs/{pdf_name}" target="_blank">Rezept PDF</a>'''
+                    
+                    html += '''
+                    </td>'''
+                
+            html += '''
+                </tr>'''
+            
+            category_row_counter += 1
+    
+    html += '''
+            </tbody>
+        </table>'''
+    
+    if plan.show_sources_box:
+        html += f'''
+
+    <div class="pdf-links-container">
+        <h2>Download Links:</h2>
+        <a href="media/pdfs/ingredients-full-list.pdf" target="_blank" class="pdf-link">{plan.source_names[0]}</a>
+        <a href="media/pdfs/ingredients-separated-by-dish.pdf" target="_blank" class="pdf-link">{plan.source_names[1]}</a>
+    </div>'''
+    
+    html += '''
+
+    </main>
+</body>
+</html>'''
+    
+    return html
+
+
+def benchmark_html_rendering(sizes=SIZES):
+    """Time the template and the former generate_html on synthetic plans"""
+    for categories, rows, weeks in sizes:
+        category_list = [(f"Kategorie {i + 1}", rows) for i in range(categories)]
+        total = 7 * categories * rows
+        plans = [WeekPlan(
+            f"{week:02d}.01.25", f"{week:02d}.01.25", category_list,
+            {n: DishSlot(f"Gericht {n} mit Äpfeln & Birnen", empty=n % 11 == 0) for n in range(1, total + 1)},
+            show_sources_box=True, source_names=("Zutaten", "Zutaten nach Gericht"),
+        ) for week in range(weeks)]
+        
+        start = time.perf_counter()
+        for plan in plans:
+            legacy_page_html(plan)
+        concat_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        pages = MEAL_PLAN_TEMPLATE.render_batch(plans)
+        render_time = time.perf_counter() - start
+        
+        print(f"{weeks} Wochen, {categories} Kategorien x {rows} Zeilen "
+              f"({total} Gerichte, {len(pages[0]) // 1024} KB pro Seite)")
+        print(f"  Bisheriges generate_html (ohne Escaping, ohne Tk-Variablen): {concat_time * 1000:.1f} ms")
+        print(f"  MealPlanTemplate (mit Escaping): {render_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    benchmark_html_rendering()
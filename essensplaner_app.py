@@ -0,0 +1,5355 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import os
+import shutil
+from datetime import datetime, timedelta
+import zlib
+import struct
+import argparse
+import time
+import sys
+import importlib
+import atexit
+from html import escape
+import io
+import base64
+import re
+import json
+import uuid
+import hashlib
+import threading
+import queue
+import itertools
+import errno
+from concurrent.futures import ThreadPoolExecutor
+import unicodedata
+import math
+import heapq
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)  # Thread-safe, workers may be the first users
+        return self._module
+    
+    def __getattr__(self, attr):
+        return getattr(self._module or self._load(), attr)
+
+
+# Heavy or rarely needed modules are deferred so the first window appears sooner,
+# they load on first use or from preload_modules once the window is up
+Image = LazyModule("PIL.Image")
+ImageOps = LazyModule("PIL.ImageOps")
+ImageTk = LazyModule("PIL.ImageTk")
+ImageDraw = LazyModule("PIL.ImageDraw")
+ImageFont = LazyModule("PIL.ImageFont")
+zipfile = LazyModule("zipfile")
+gzip = LazyModule("gzip")
+sqlite3 = LazyModule("sqlite3")
+webbrowser = LazyModule("webbrowser")
+subprocess = LazyModule("subprocess")
+platform = LazyModule("platform")
+tempfile = LazyModule("tempfile")
+multiprocessing = LazyModule("multiprocessing")
+PRELOAD_MODULES = ("PIL.Image", "PIL.ImageOps", "PIL.ImageTk", "PIL.ImageDraw", "PIL.ImageFont",
+                   "concurrent.futures.process", "sqlite3", "zipfile", "gzip", "platform", "subprocess", "webbrowser",
+                   "tempfile")
+PRELOAD_DELAY_MS = 200  # Start preloading after the first window has been drawn
+PRELOAD_INTERVAL_MS = 20  # One module per callback keeps the window responsive
+
+# Thumbnail settings for the meal library
+THUMBNAIL_SIZE = (150, 150)
+THUMBNAIL_CACHE_MAX_BYTES = 100 * 1024 * 1024  # Disk cache size cap
+THUMBNAIL_MEMORY_ITEMS = 300  # Max PhotoImages kept in memory
+
+# Background image decoding
+DECODE_WORKERS = min(4, os.cpu_count() or 1)
+DECODE_POLL_MS = 30  # Interval for handing decoded images to Tk
+
+# Staging of recipe PDFs and photos into the website folder
+COPY_WORKERS = 8  # I/O bound, network shares benefit from several requests in flight
+COPY_POLL_MS = 50
+COPY_BUFFER_SIZE = 1024 * 1024
+MEDIA_HASH_LENGTH = 16  # Hex digits of the content hash used for deduplicated media names
+BUILD_MANIFEST_FILE = ".build_manifest.json"  # Sources of the staged media, stored in the website folder
+
+# Optimization of published photos (the page shows them at 80px, 60px on small screens)
+PHOTO_MAX_DIMENSION = 320
+PHOTO_SRCSET_WIDTHS = (80, 160)  # Smaller variants next to the full-size photo
+PHOTO_SIZES = "(max-width: 768px) 60px, 80px"
+PHOTO_QUALITY = 82
+PHOTO_WORKERS = os.cpu_count() or 1
+OPTIMIZABLE_PHOTO_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.webp', '.tif', '.tiff', '.gif')
+ANIMATED_PHOTO_EXTENSIONS = ('.gif', '.png', '.webp')  # Checked for animation, animated files are published unchanged
+PROCESS_START_METHODS = ("forkserver", "spawn")  # Worker processes never fork the running app and its threads
+# ZIP export
+ZIP_WORKERS = os.cpu_count() or 1
+ZIP_STORED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.zip', '.gz', '.br', '.mp4')
+ZIP_DEFLATED_EXTENSIONS = ('.html', '.css', '.js', '.json', '.txt', '.svg')
+ZIP_SAMPLE_SIZE = 64 * 1024  # Other files (e.g. PDFs) are deflated only if a sample compresses well
+ZIP_MIN_RATIO = 0.9
+ZIP_POLL_MS = 50
+
+# Precompressed sidecars (.gz/.br) for hosts that serve them directly
+PRECOMPRESSED_FILES = ("index.html", "styles.css")
+PRECOMPRESSED_FORMATS = ("gz", "br")
+
+INLINE_PHOTO_WIDTH = 160  # Width of thumbnails embedded as data URIs (2x the displayed size)
+INLINE_PHOTO_QUALITY = 60
+
+# Website screenshots through a reused headless Chrome
+SCREENSHOT_WINDOW_SIZE = (1920, 1080)
+SCREENSHOT_TIMEOUT = 10  # Seconds to wait for the page
+SCREENSHOT_MIN_WIDTH = 800  # Full-page captures stay above the mobile layout breakpoint
+SCREENSHOT_MAX_HEIGHT = 16384  # Chrome can't capture taller images in one piece, longer pages are tiled
+SCREENSHOT_SUFFIX = ".png"  # Batch screenshots are saved as "<website folder>.png"
+
+# Plan images drawn with Pillow from the plan data, no browser needed
+PLAN_IMAGE_WIDTH = 1400
+PLAN_IMAGE_SUFFIX = " Bild.png"  # Batch images get their own name, so a screenshot of the same week can't replace them
+PLAN_IMAGE_PHOTO_WIDTH = 80  # td img max-width of the stylesheet
+PLAN_IMAGE_FONTS = {  # Tried in order, Pillow searches the system font folders
+    False: ("arial.ttf", "Arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf"),
+    True: ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf"),
+}
+
+# Layout of the virtualized meal library grid
+MEAL_GRID_COLUMNS = 3
+MEAL_CARD_HEIGHT = 270  # Row height in pixels, including padding
+MEAL_GRID_OVERSCAN_ROWS = 1  # Extra rows rendered above and below the visible area
+
+# Meal library storage
+MEALS_LIBRARY_FILE = "meals_library.json"
+MEALS_JOURNAL_FILE = "meals_library.journal"  # Append-only change log next to the JSON snapshot
+JOURNAL_COMPACT_THRESHOLD = 200  # Journal records before folding them into the snapshot
+MEALS_DATABASE_FILE = "meals_library.db"
+MEALS_STORAGE_BACKEND = "json"  # "json" or "sqlite"; an existing meals_library.db is always used
+MEALS_HEAD_FILE = "meals_library.head.json"  # First meals of the library for a fast first screen
+LAZY_LIBRARY_LOAD = True  # Show the first meals immediately and load the rest in the background
+LAZY_HEAD_SIZE = 30  # Meals in the head file, enough for the first screen of cards
+LAZY_BATCH_SIZE = 2000  # Meals handed to the UI per batch while streaming
+LAZY_POLL_MS = 100  # Interval for merging streamed meals into the UI
+MEAL_COLUMNS = ("name", "image_path", "pdf_path", "additional_info", "created", "last_used", "use_count")
+
+# Search settings
+SEARCH_DEBOUNCE_MS = 150  # Wait time after the last keystroke before searching
+SEARCH_CHUNK_SIZE = 2000  # Meals checked per event loop step, keeps the UI responsive
+SEARCH_INDEX_FILE = "meals_search_index.json"  # Stored next to the meal library
+SEARCH_INDEX_VERSION = 1
+TRIGRAM_LENGTH = 3  # Queries shorter than this can't use the index and check every meal
+
+# Ranked fuzzy matching in the meal selection dialog
+FUZZY_RESULT_LIMIT = 200  # Max ranked results shown
+FUZZY_FULL_SCAN_LIMIT = 5000  # Smaller libraries score every meal, larger ones use trigram candidates
+
+UMLAUT_FOLDING = str.maketrans({"ä": "a", "ö": "o", "ü": "u", "ß": "ss"})
+
+
+def fold_search_text(text):
+    """Lowercase text and fold umlauts, ß and accents ("Kase" finds "Käse")"""
+    text = text.lower().translate(UMLAUT_FOLDING)
+    if text.isascii():
+        return text
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def edit_distance(a, b, max_distance):
+    """Damerau-Levenshtein distance (optimal string alignment), capped at max_distance + 1"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous_row = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before_row, previous_row = previous_row, row
+        row = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], before_row[j - 2] + 1)
+        if min(row) > max_distance:
+            return max_distance + 1
+    return min(row[-1], max_distance + 1)
+
+
+def typo_tolerance(word):
+    """Number of typos allowed for a search word of this length"""
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 6:
+        return 1
+    return 2
+
+
+def trigrams(text):
+    """Set of all 3-character substrings of a text"""
+    return {text[i:i + TRIGRAM_LENGTH] for i in range(len(text) - TRIGRAM_LENGTH + 1)}
+
+
+class ThumbnailCache:
+    """Disk and memory cache for meal thumbnails (LRU, size-capped)"""
+    
+    def __init__(self, cache_dir, size=THUMBNAIL_SIZE, max_bytes=THUMBNAIL_CACHE_MAX_BYTES,
+                 max_photos=THUMBNAIL_MEMORY_ITEMS):
+        self.cache_dir = cache_dir
+        self.size = size
+        self.max_bytes = max_bytes
+        self.max_photos = max_photos
+        self.photos = OrderedDict()  # cache key -> PhotoImage
+        self.total_bytes = None  # Size of the disk cache, scanned on first write
+        self.lock = threading.Lock()  # Disk cache is also filled from background threads
+    
+    def cache_key(self, image_path):
+        """Build cache key from path, modification time and file size"""
+        stat = os.stat(image_path)
+        raw = f"{os.path.abspath(image_path)}|{stat.st_mtime_ns}|{stat.st_size}|{self.size[0]}x{self.size[1]}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    
+    def get_photo(self, image_path):
+        """Return a PhotoImage thumbnail, decoding only if it is missing or stale"""
+        key, photo = self.cached_photo(image_path)
+        if photo is None:
+            photo = self.add_photo(key, self.load_thumbnail(image_path, key))
+        return photo
+    
+    def cached_photo(self, image_path):
+        """Return (cache key, PhotoImage) from memory, the PhotoImage is None on a miss"""
+        key = self.cache_key(image_path)
+        photo = self.photos.get(key)
+        if photo is not None:
+            self.photos.move_to_end(key)
+        return key, photo
+    
+    def add_photo(self, key, img):
+        """Create a PhotoImage from a thumbnail and keep it in memory (Tk thread only)"""
+        photo = ImageTk.PhotoImage(img)
+        self.photos[key] = photo
+        while len(self.photos) > self.max_photos:
+            self.photos.popitem(last=False)
+        return photo
+    
+    def load_thumbnail(self, image_path, key=None):
+        """Return thumbnail as PIL image, using the disk cache when possible"""
+        key = key or self.cache_key(image_path)
+        for ext in (".jpg", ".png"):
+            cached_path = os.path.join(self.cache_dir, key + ext)
+            if os.path.exists(cached_path):
+                try:
+                    img = Image.open(cached_path)
+                    img.load()
+                    os.utime(cached_path)  # Mark as recently used for LRU eviction
+                    return img
+                except (OSError, ValueError):
+                    self.remove_file(cached_path)
+        
+        img = open_preview(image_path, self.size)
+        img.thumbnail(self.size, Image.Resampling.LANCZOS)
+        self.store(key, img)
+        return img
+    
+    def ensure_cached(self, image_path):
+        """Create the disk thumbnail if it doesn't exist yet, without decoding cached ones"""
+        key = self.cache_key(image_path)
+        if not any(os.path.exists(os.path.join(self.cache_dir, key + ext)) for ext in (".jpg", ".png")):
+            self.load_thumbnail(image_path, key)
+    
+    def store(self, key, img):
+        """Write thumbnail to disk cache and evict old entries if over the size cap"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+                cached_path = os.path.join(self.cache_dir, key + ".png")
+                fmt, save_img = "PNG", img
+            else:
+                cached_path = os.path.join(self.cache_dir, key + ".jpg")
+                fmt, save_img = "JPEG", img if img.mode == 'RGB' else img.convert('RGB')
+            temp_path = f"{cached_path}.{threading.get_ident()}.tmp"
+            save_img.save(temp_path, fmt)
+            os.replace(temp_path, cached_path)
+        except OSError as e:
+            print(f"Warning: Could not write thumbnail cache: {e}")
+            return
+        
+        with self.lock:
+            if self.total_bytes is None:
+                self.total_bytes = sum(size for _, size, _ in self.scan())
+            else:
+                self.total_bytes += os.path.getsize(cached_path)
+            if self.total_bytes > self.max_bytes:
+                self.evict()
+    
+    def scan(self):
+        """List cached thumbnails as (path, size, last used) tuples"""
+        entries = []
+        if os.path.exists(self.cache_dir):
+            for filename in os.listdir(self.cache_dir):
+                if filename.endswith((".jpg", ".png")):
+                    path = os.path.join(self.cache_dir, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+    
+    def evict(self):
+        """Remove least recently used thumbnails until the cache is below 90% of its cap"""
+        entries = sorted(self.scan(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            if self.remove_file(path):
+                total -= size
+        self.total_bytes = total
+    
+    def remove_file(self, path):
+        """Delete a cache file, ignoring files that are already gone"""
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+    
+    def clear_memory(self):
+        """Drop all in-memory PhotoImages"""
+        self.photos.clear()
+
+
+def write_json_atomic(path, data, **dump_options):
+    """Write JSON to a temp file and move it into place, so a crash can't truncate the target"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **dump_options)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class JsonMealStore:
+    """Meal library stored as a JSON snapshot plus an append-only journal of changes"""
+    
+    def __init__(self, meals_data_path, read_only=False):
+        self.read_only = read_only  # Raise on a broken snapshot instead of moving it aside
+        self.library_file = os.path.join(meals_data_path, MEALS_LIBRARY_FILE)
+        self.head_file = os.path.join(meals_data_path, MEALS_HEAD_FILE)
+        self.journal_file = os.path.join(meals_data_path, MEALS_JOURNAL_FILE)
+        self.compacting_file = self.journal_file + ".compacting"  # Journal being folded into the snapshot
+        self.journal_records = 0
+        self.load_error = None  # Set if the snapshot couldn't be read
+        self.lock = threading.Lock()  # Guards snapshot writes
+        self.head_lock = threading.Lock()  # The loader and compaction both write the head file
+        self.snapshot_generation = 0  # Incremented by full saves, outdated compactions are discarded
+        self.compaction_thread = None
+    
+    def load(self):
+        """Load the snapshot and replay journaled changes"""
+        meals_library = {}
+        if os.path.exists(self.library_file):
+            try:
+                with open(self.library_file, 'r', encoding='utf-8') as f:
+                    meals_library = json.load(f)
+            except (OSError, ValueError) as e:
+                if self.read_only:
+                    raise ValueError(f"{self.library_file}: {e}") from e
+                # Keep the broken file for manual recovery instead of silently overwriting it
+                backup_file = f"{self.library_file}.corrupt-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+                try:
+                    os.replace(self.library_file, backup_file)
+                except OSError:
+                    backup_file = self.library_file
+                self.load_error = f"{e}\nDie beschädigte Datei wurde gesichert unter:\n{backup_file}"
+        
+        self.journal_records = 0
+        for journal_file in (self.compacting_file, self.journal_file):
+            self.journal_records += self.replay_journal(journal_file, meals_library)
+        return meals_library
+    
+    def load_head(self, limit):
+        """First meals of the library from the head file, None if it is missing"""
+        try:
+            with open(self.head_file, 'r', encoding='utf-8') as f:
+                meals = json.load(f)["meals"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return dict(itertools.islice(meals.items(), limit))
+    
+    def write_head(self, meals_library):
+        """Store the first meals separately so lazy loading can show them without parsing the library"""
+        head = dict(itertools.islice(meals_library.items(), LAZY_HEAD_SIZE))
+        with self.head_lock:
+            write_json_atomic(self.head_file, {"count": len(meals_library), "meals": head})
+    
+    def replay_journal(self, journal_file, meals_library):
+        """Apply journal records to the library, returns the number of records"""
+        if not os.path.exists(journal_file):
+            return 0
+        count = 0
+        with open(journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Incomplete record from an interrupted write
+                if record.get("op") == "upsert":
+                    meals_library[record["id"]] = record["meal"]
+                elif record.get("op") == "delete":
+                    meals_library.pop(record["id"], None)
+                count += 1
+        return count
+    
+    def save_meal(self, meals_library, meal_id, complete=True):
+        """Append a single added, changed or deleted meal to the journal
+        
+        complete is False while meals_library only holds the head of a lazy load, the journal is then
+        not compacted (which would write the partial library as snapshot) until compact_due is called.
+        """
+        if meal_id in meals_library:
+            record = {"op": "upsert", "id": meal_id, "meal": meals_library[meal_id]}
+        else:
+            record = {"op": "delete", "id": meal_id}
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        
+        self.journal_records += 1
+        if complete:
+            self.compact_due(meals_library)
+    
+    def compact_due(self, meals_library):
+        """Compact once the journal has grown past the threshold, meals_library must be the whole library"""
+        if self.journal_records >= JOURNAL_COMPACT_THRESHOLD:
+            self.compact(meals_library)
+    
+    def compact(self, meals_library):
+        """Fold the journal into the snapshot on a background thread"""
+        if self.compaction_thread is not None and self.compaction_thread.is_alive():
+            return
+        # New changes go to a fresh journal while the old one is folded in
+        if os.path.exists(self.compacting_file):
+            # Left over from an interrupted compaction, append the current journal to it
+            with open(self.journal_file, 'rb') as src, open(self.compacting_file, 'ab') as dst:
+                dst.write(b"\n")
+                shutil.copyfileobj(src, dst)
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.remove(self.journal_file)
+        else:
+            os.replace(self.journal_file, self.compacting_file)
+        self.journal_records = 0
+        snapshot = {meal_id: dict(meal_data) for meal_id, meal_data in meals_library.items()}
+        generation = self.snapshot_generation
+        
+        def run():
+            try:
+                with self.lock:
+                    if generation != self.snapshot_generation:
+                        return  # A full save already wrote a newer snapshot
+                    write_json_atomic(self.library_file, snapshot, indent=2)
+                    self.write_head(snapshot)
+                    os.remove(self.compacting_file)
+            except OSError as e:
+                print(f"Warning: Could not compact meal library journal: {e}")
+        
+        self.compaction_thread = threading.Thread(target=run, daemon=True)
+        self.compaction_thread.start()
+    
+    def save_all(self, meals_library):
+        """Write the whole library as a new snapshot and clear the journal"""
+        with self.lock:
+            self.snapshot_generation += 1
+            write_json_atomic(self.library_file, meals_library, indent=2)
+            self.write_head(meals_library)
+            for journal_file in (self.compacting_file, self.journal_file):
+                if os.path.exists(journal_file):
+                    os.remove(journal_file)
+            self.journal_records = 0
+    
+    def archive(self, suffix):
+        """Rename snapshot and journals, e.g. after migrating to another backend"""
+        for path in (self.library_file, self.compacting_file, self.journal_file):
+            if os.path.exists(path):
+                os.replace(path, path + suffix)
+        if os.path.exists(self.head_file):
+            os.remove(self.head_file)
+    
+    def close(self):
+        """Wait for a running compaction to finish"""
+        if self.compaction_thread is not None:
+            self.compaction_thread.join()
+
+
+class SQLiteMealStore:
+    """Meal library stored in SQLite (WAL mode), written one row at a time"""
+    
+    def __init__(self, meals_data_path, read_only=False):
+        self.db_file = os.path.join(meals_data_path, MEALS_DATABASE_FILE)
+        self.load_error = None
+        self.owner_thread = threading.current_thread()
+        if read_only:
+            # No schema changes or migration, the database must already exist
+            self.conn = sqlite3.connect(f"file:{self.db_file}?mode=ro", uri=True)
+            return
+        is_new = not os.path.exists(self.db_file)
+        self.conn = sqlite3.connect(self.db_file)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute("""CREATE TABLE IF NOT EXISTS meals (
+                meal_id TEXT PRIMARY KEY,
+                position INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                image_path TEXT NOT NULL DEFAULT '',
+                pdf_path TEXT NOT NULL DEFAULT '',
+                additional_info TEXT NOT NULL DEFAULT '',
+                created TEXT,
+                last_used TEXT,
+                use_count INTEGER,
+                extra TEXT
+            )""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_meals_position ON meals(position)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_meals_name ON meals(name)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_meals_last_used ON meals(last_used)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_meals_created ON meals(created)")
+        
+        if is_new:
+            self.migrate_from_json(meals_data_path)
+    
+    def migrate_from_json(self, meals_data_path):
+        """Import an existing JSON library (snapshot and journal) into the new database"""
+        json_store = JsonMealStore(meals_data_path)
+        meals_library = json_store.load()
+        if meals_library:
+            self.save_all(meals_library)
+        # Keep the old files as backup, but don't let them shadow the database
+        json_store.archive(".migrated")
+    
+    def load(self):
+        """Load all meals in creation order"""
+        return self.query_meals("")
+    
+    def load_head(self, limit):
+        """First meals in creation order"""
+        return self.query_meals(" LIMIT ?", (limit,))
+    
+    def write_head(self, meals_library):
+        pass  # The database can read its first rows directly
+    
+    def query_meals(self, suffix, params=()):
+        """Read meal rows, using a separate connection when called from a background thread"""
+        same_thread = threading.current_thread() is self.owner_thread
+        conn = self.conn if same_thread else sqlite3.connect(self.db_file)
+        try:
+            meals_library = {}
+            rows = conn.execute(
+                "SELECT meal_id, name, image_path, pdf_path, additional_info, created, last_used, use_count, extra "
+                "FROM meals ORDER BY position" + suffix, params)
+            for meal_id, name, image_path, pdf_path, additional_info, created, last_used, use_count, extra in rows:
+                meal_data = {
+                    'name': name,
+                    'image_path': image_path,
+                    'pdf_path': pdf_path,
+                    'additional_info': additional_info
+                }
+                if created is not None:
+                    meal_data['created'] = created
+                if last_used is not None:
+                    meal_data['last_used'] = last_used
+                if use_count is not None:
+                    meal_data['use_count'] = use_count
+                if extra:
+                    meal_data.update(json.loads(extra))
+                meals_library[meal_id] = meal_data
+            return meals_library
+        finally:
+            if not same_thread:
+                conn.close()
+    
+    def row_values(self, meal_id, meal_data):
+        """Column values for a meal, unknown keys go into the extra JSON column"""
+        extra = {key: value for key, value in meal_data.items() if key not in MEAL_COLUMNS}
+        return (meal_id, meal_data.get('name', ''), meal_data.get('image_path', ''),
+                meal_data.get('pdf_path', ''), meal_data.get('additional_info', ''),
+                meal_data.get('created'), meal_data.get('last_used'), meal_data.get('use_count'),
+                json.dumps(extra, ensure_ascii=False) if extra else None)
+    
+    def save_meal(self, meals_library, meal_id, complete=True):
+        """Insert, update or delete a single meal row"""
+        with self.conn:
+            if meal_id in meals_library:
+                self.conn.execute(
+                    """INSERT INTO meals (meal_id, position, name, image_path, pdf_path, additional_info,
+                                          created, last_used, use_count, extra)
+                       VALUES (?1, (SELECT COALESCE(MAX(position), 0) + 1 FROM meals), ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9)
+                       ON CONFLICT(meal_id) DO UPDATE SET
+                           name = excluded.name, image_path = excluded.image_path, pdf_path = excluded.pdf_path,
+                           additional_info = excluded.additional_info, created = excluded.created,
+                           last_used = excluded.last_used, use_count = excluded.use_count, extra = excluded.extra""",
+                    self.row_values(meal_id, meals_library[meal_id]))
+            else:
+                self.conn.execute("DELETE FROM meals WHERE meal_id = ?", (meal_id,))
+    
+    def compact_due(self, meals_library):
+        pass  # Rows are written in place, there is no journal
+    
+    def save_all(self, meals_library):
+        """Replace all rows with the given library"""
+        with self.conn:
+            self.conn.execute("DELETE FROM meals")
+            self.conn.executemany(
+                "INSERT INTO meals (meal_id, name, image_path, pdf_path, additional_info, created, last_used, "
+                "use_count, extra, position) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.row_values(meal_id, meal_data) + (position,)
+                 for position, (meal_id, meal_data) in enumerate(meals_library.items(), 1)))
+    
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+
+def read_meal_library(meals_data_path):
+    """Load the meal library without changing anything in the data folder, raises if it can't be read"""
+    if os.path.exists(os.path.join(meals_data_path, MEALS_DATABASE_FILE)):
+        store = SQLiteMealStore(meals_data_path, read_only=True)
+    else:
+        store = JsonMealStore(meals_data_path, read_only=True)
+    try:
+        return store.load()
+    finally:
+        store.close()
+
+
+def open_meal_store(meals_data_path):
+    """Open the configured storage backend, preferring an existing SQLite database"""
+    if MEALS_STORAGE_BACKEND == "sqlite" or os.path.exists(os.path.join(meals_data_path, MEALS_DATABASE_FILE)):
+        return SQLiteMealStore(meals_data_path)
+    return JsonMealStore(meals_data_path)
+
+
+def open_preview(image_path, size):
+    """Open an image decoded close to the requested size instead of at full resolution"""
+    img = Image.open(image_path)
+    if img.format == "JPEG":
+        # JPEG can decode directly at 1/2, 1/4 or 1/8 scale, never below the requested size
+        img.draft("RGB", size)
+        return img
+    
+    # Other formats: cheap box reduction by an integer factor before the final resampling
+    factor = min(img.width // size[0], img.height // size[1])
+    if factor >= 2 and img.mode in ("L", "LA", "RGB", "RGBA", "CMYK", "I", "F"):
+        img = img.reduce(factor)
+    return img
+
+
+def save_clipboard_image(img, base_path):
+    """Save a clipboard image as PNG (transparency) or JPEG, returns the file path"""
+    os.makedirs(os.path.dirname(base_path), exist_ok=True)
+    if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+        # Save as PNG to preserve transparency
+        path = base_path + ".png"
+        img.save(path, "PNG")
+    else:
+        # Save as JPEG for better file size (JPEG doesn't support RGBA)
+        path = base_path + ".jpg"
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        img.save(path, "JPEG", quality=90)
+    return path
+
+
+class ImageDecodeService:
+    """Runs image work on a thread pool and hands results to Tk through a polled queue"""
+    
+    def __init__(self, root, workers=DECODE_WORKERS):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-decode")
+        self.results = queue.Queue()
+        self.pending = {}  # token -> (future, callback, error_callback)
+        self.next_token = 0
+        self.polling = False
+    
+    def submit(self, func, *args, callback=None, error_callback=None):
+        """Run func(*args) in the background, callbacks are called on the Tk thread"""
+        self.next_token += 1
+        token = self.next_token
+        future = self.executor.submit(self.run, token, func, args)
+        self.pending[token] = (future, callback, error_callback)
+        if not self.polling:
+            self.polling = True
+            self.root.after(DECODE_POLL_MS, self.poll)
+        return token
+    
+    def run(self, token, func, args):
+        """Worker side: never touches Tk, only puts the result into the queue"""
+        try:
+            self.results.put((token, func(*args), None))
+        except Exception as e:
+            self.results.put((token, None, e))
+    
+    def cancel(self, token):
+        """Drop a request, e.g. when its card scrolled away; running work is discarded"""
+        entry = self.pending.pop(token, None)
+        if entry is not None:
+            entry[0].cancel()
+    
+    def poll(self):
+        """Deliver finished results on the Tk thread"""
+        try:
+            while True:
+                token, result, error = self.results.get_nowait()
+                entry = self.pending.pop(token, None)
+                if entry is None:
+                    continue  # Cancelled
+                _, callback, error_callback = entry
+                if error is not None:
+                    if error_callback is not None:
+                        error_callback(error)
+                    else:
+                        print(f"Warning: Background image task failed: {error}")
+                elif callback is not None:
+                    callback(result)
+        except queue.Empty:
+            pass
+        
+        if self.pending:
+            self.root.after(DECODE_POLL_MS, self.poll)
+        else:
+            self.polling = False
+    
+    def shutdown(self):
+        """Stop workers, pending requests are cancelled"""
+        self.pending.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def kernel_copy(src_fd, dst_fd, size):
+    """Copy inside the kernel via copy_file_range or sendfile, returns False if unsupported
+    
+    Some network and virtual file systems report 0 bytes instead of an error. A copy that ends
+    short is discarded and the next method (finally the caller's read/write copy) is used.
+    """
+    for method in ("copy_file_range", "sendfile"):
+        copy = getattr(os, method, None)
+        if copy is None:
+            continue
+        offset = 0
+        try:
+            while offset < size:
+                if method == "copy_file_range":
+                    sent = copy(src_fd, dst_fd, size - offset)
+                else:
+                    sent = copy(dst_fd, src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            if offset >= size:
+                return True
+        except OSError as e:
+            # Unsupported for this file system or fd type, try the next method unless data was written
+            if offset == 0 and e.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP,
+                                           errno.EOPNOTSUPP, errno.EBADF, errno.ENOTSOCK, errno.EPERM):
+                continue
+            raise
+        # Short copy, start over from the beginning of both files
+        os.ftruncate(dst_fd, 0)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.lseek(src_fd, 0, os.SEEK_SET)
+    return False
+
+
+def fast_copy_file(src, dst):
+    """Copy file contents and metadata, using zero-copy system calls where available"""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        if not kernel_copy(fsrc.fileno(), fdst.fileno(), size):
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
+
+
+def stage_file(src, dst, move=False):
+    """Copy or move a file into the website folder"""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    if move:
+        try:
+            os.replace(src, dst)  # Same file system: just a rename
+            return
+        except OSError:
+            pass
+    fast_copy_file(src, dst)
+    if move:
+        os.remove(src)
+
+
+def file_content_hash(path):
+    """Return the SHA-256 hex digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stage_deduplicated_file(src, directory, move=False):
+    """Store a file once under its content hash in directory, returns (destination path, hash)"""
+    _, ext = os.path.splitext(src)
+    content_hash = file_content_hash(src)
+    dst = os.path.join(directory, content_hash[:MEDIA_HASH_LENGTH] + ext.lower())
+    if os.path.exists(dst):
+        if move:
+            os.remove(src)
+        return dst, content_hash
+    
+    # Stage under a temporary name so concurrent jobs with the same content never see partial files
+    temp_path = f"{dst}.{threading.get_ident()}.tmp"
+    stage_file(src, temp_path, move)
+    os.replace(temp_path, dst)
+    return dst, content_hash
+
+
+def save_optimized_photo(img, path, fmt):
+    """Encode a photo as progressive JPEG or WebP without metadata"""
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if fmt == "webp":
+        img.save(temp_path, "WEBP", quality=PHOTO_QUALITY, method=4)
+    else:
+        img.save(temp_path, "JPEG", quality=PHOTO_QUALITY, optimize=True, progressive=True)
+    os.replace(temp_path, path)
+
+
+def optimize_photo(src, directory, base_name, max_dimension=PHOTO_MAX_DIMENSION, fmt="jpeg",
+                   widths=PHOTO_SRCSET_WIDTHS):
+    """Resize and re-encode a photo plus smaller srcset variants, EXIF is dropped
+    
+    Runs in a worker process. Returns the main file and the srcset as (path, width) pairs.
+    """
+    with Image.open(src) as img:
+        if img.format == "JPEG":
+            img.draft("RGB", (max_dimension, max_dimension))
+        img = ImageOps.exif_transpose(img)  # Apply the camera rotation before the EXIF data is dropped
+    
+    has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+    if has_alpha and fmt == "webp":
+        img = img.convert("RGBA")
+    elif has_alpha:
+        # JPEG has no transparency, flatten onto white like the page background
+        rgba = img.convert("RGBA")
+        img = Image.new("RGB", rgba.size, "white")
+        img.paste(rgba, mask=rgba.getchannel("A"))
+    elif img.mode != "RGB":
+        img = img.convert("RGB")
+    img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    
+    os.makedirs(directory, exist_ok=True)
+    ext = ".webp" if fmt == "webp" else ".jpg"
+    main_path = os.path.join(directory, base_name + ext)
+    save_optimized_photo(img, main_path, fmt)
+    
+    srcset = []
+    for width in sorted(widths):
+        if width < img.width:
+            variant = img.resize((width, max(1, round(img.height * width / img.width))), Image.Resampling.LANCZOS)
+            variant_path = os.path.join(directory, f"{base_name}-{width}w{ext}")
+            save_optimized_photo(variant, variant_path, fmt)
+            srcset.append((variant_path, width))
+    srcset.append((main_path, img.width))
+    return {"dst": main_path, "srcset": srcset, "dimensions": img.size}
+
+
+def minify_css(css):
+    """Remove comments and whitespace from a stylesheet"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def photo_data_uri(path, width=INLINE_PHOTO_WIDTH):
+    """Small JPEG thumbnail of a photo as data URI for single-file pages"""
+    with Image.open(path) as img:
+        if img.format == "JPEG":
+            img.draft("RGB", (width, width))
+        img = ImageOps.exif_transpose(img)
+        if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, "white")
+            img.paste(rgba, mask=rgba.getchannel("A"))
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+        img.thumbnail((width, width * 4), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, "JPEG", quality=INLINE_PHOTO_QUALITY, optimize=True, progressive=True)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def image_dimensions(path):
+    """Displayed (width, height) of an image from its header, None if it can't be read"""
+    try:
+        with Image.open(path) as img:  # Only the header is parsed, pixels stay undecoded
+            width, height = img.size
+            if img.getexif().get(0x0112) in (5, 6, 7, 8):
+                width, height = height, width  # Browsers apply the EXIF rotation
+            return width, height
+    except (OSError, ValueError, SyntaxError):
+        return None
+
+
+def zip_dos_time(timestamp):
+    """ZIP (DOS) time and date fields of a timestamp"""
+    t = datetime.fromtimestamp(max(timestamp, 315532800))  # DOS dates start in 1980
+    return (t.hour << 11) | (t.minute << 5) | (t.second // 2), ((t.year - 1980) << 9) | (t.month << 5) | t.day
+
+
+def zip_should_deflate(path):
+    """Store already-compressed media, deflate text, sample everything else"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ZIP_STORED_EXTENSIONS:
+        return False
+    if ext in ZIP_DEFLATED_EXTENSIONS:
+        return True
+    with open(path, "rb") as f:
+        sample = f.read(ZIP_SAMPLE_SIZE)
+    return not sample or len(zlib.compress(sample, 6)) < len(sample) * ZIP_MIN_RATIO
+
+
+def zip_prepare_entry(path):
+    """Worker side: deflate a file in memory (zlib releases the GIL), or mark it as stored"""
+    if not zip_should_deflate(path):
+        return zipfile.ZIP_STORED, None, None, os.path.getsize(path)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    crc, size, chunks = 0, 0, []
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            chunks.append(compressor.compress(chunk))
+    chunks.append(compressor.flush())
+    return zipfile.ZIP_DEFLATED, crc, b"".join(chunks), size
+
+
+def write_site_zip(website_dir, zip_path, skip=(), progress=None):
+    """Write a ZIP of the website folder, deflating files in parallel and streaming stored ones
+    
+    progress(done, total, name) is called from the writing thread.
+    """
+    entries = []
+    for root, dirs, files in os.walk(website_dir):
+        for file in sorted(files):
+            if file in skip or file.endswith(".tmp"):
+                continue
+            path = os.path.join(root, file)
+            entries.append((path, os.path.relpath(path, website_dir).replace(os.sep, "/")))
+    
+    # Sizes and offsets above 4 GB need ZIP64, leave those rare cases to zipfile
+    if sum(os.path.getsize(path) for path, _ in entries) >= 0xFFFFFFFF - 0xFFFF:
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as zipf:
+            for done, (path, arc_name) in enumerate(entries, 1):
+                zipf.write(path, arc_name, zipfile.ZIP_DEFLATED if zip_should_deflate(path) else zipfile.ZIP_STORED)
+                if progress:
+                    progress(done, len(entries), arc_name)
+        return
+    
+    temp_path = zip_path + ".tmp"
+    central = []
+    with ThreadPoolExecutor(max_workers=ZIP_WORKERS, thread_name_prefix="zip") as executor, \
+            open(temp_path, "wb") as out:
+        # Keep a bounded window of files in flight, entries are written in order
+        pending = []
+        next_entry = iter(entries)
+        for path, arc_name in itertools.islice(next_entry, ZIP_WORKERS * 2):
+            pending.append((path, arc_name, executor.submit(zip_prepare_entry, path)))
+        
+        done = 0
+        while pending:
+            path, arc_name, future = pending.pop(0)
+            for path_next, arc_next in itertools.islice(next_entry, 1):
+                pending.append((path_next, arc_next, executor.submit(zip_prepare_entry, path_next)))
+            method, crc, data, size = future.result()
+            
+            name = arc_name.encode("utf-8")
+            dos_time, dos_date = zip_dos_time(os.path.getmtime(path))
+            offset = out.tell()
+            header = struct.pack("<IHHHHHIIIHH", 0x04034b50, 20, 0x0800, method, dos_time, dos_date,
+                                 crc or 0, len(data) if data is not None else size, size, len(name), 0)
+            out.write(header + name)
+            if data is None:
+                # Stored: stream the file, then patch CRC and sizes into the local header
+                crc, size = 0, 0
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+                        crc = zlib.crc32(chunk, crc)
+                        size += len(chunk)
+                        out.write(chunk)
+                compressed_size = size
+                end = out.tell()
+                out.seek(offset + 14)
+                out.write(struct.pack("<III", crc, compressed_size, size))
+                out.seek(end)
+            else:
+                out.write(data)
+                compressed_size = len(data)
+            central.append(struct.pack("<IHHHHHHIIIHHHHHII", 0x02014b50, 20, 20, 0x0800, method, dos_time, dos_date,
+                                       crc, compressed_size, size, len(name), 0, 0, 0, 0, 0, offset) + name)
+            done += 1
+            if progress:
+                progress(done, len(entries), arc_name)
+        
+        central_offset = out.tell()
+        central_data = b"".join(central)
+        out.write(central_data)
+        out.write(struct.pack("<IHHHHIIH", 0x06054b50, 0, 0, len(central), len(central),
+                              len(central_data), central_offset, 0))
+    os.replace(temp_path, zip_path)
+
+
+def compress_sidecar(path, fmt):
+    """Write path.gz or path.br next to a file"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if fmt == "br":
+        import brotli
+        compressed = brotli.compress(data, quality=11)
+    else:
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)  # mtime=0 keeps the output reproducible
+    temp_path = f"{path}.{fmt}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(compressed)
+    os.replace(temp_path, f"{path}.{fmt}")
+
+
+def precompress_files(paths, manifest):
+    """Write .gz (and .br if brotli is installed) sidecars in parallel, skipping unchanged files
+    
+    Returns the number of sidecars written.
+    """
+    formats = ["gz"]
+    try:
+        import brotli  # noqa: F401 - optional
+        formats.append("br")
+    except ImportError:
+        pass
+    
+    tasks = []
+    for path in paths:
+        if not os.path.exists(path):
+            remove_precompressed(manifest, [path])  # e.g. styles.css of a single-file page
+            continue
+        rel_path = manifest.relative(path)
+        content_hash = file_content_hash(path)
+        record = manifest.compressed.get(rel_path, {})
+        for fmt in record.get("formats", []):
+            if fmt not in formats:
+                remove_sidecar(path, fmt)  # brotli was uninstalled, the old .br would be outdated
+        for fmt in formats:
+            if record.get("hash") != content_hash or fmt not in record.get("formats", []) \
+                    or not os.path.exists(f"{path}.{fmt}"):
+                tasks.append((path, fmt))
+        manifest.compressed[rel_path] = {"hash": content_hash, "formats": formats}
+    
+    if tasks:
+        with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="precompress") as executor:
+            # zlib and brotli release the GIL, so the files compress in parallel
+            for future in [executor.submit(compress_sidecar, path, fmt) for path, fmt in tasks]:
+                future.result()
+    return len(tasks)
+
+
+def remove_sidecar(path, fmt):
+    """Delete path.gz or path.br if it exists"""
+    try:
+        os.remove(f"{path}.{fmt}")
+    except FileNotFoundError:
+        pass
+
+
+def remove_precompressed(manifest, paths=()):
+    """Delete the sidecars of the given files and of all files recorded in the manifest
+    
+    Used when precompression is off, so hosts serving .gz/.br directly can't send outdated pages.
+    """
+    paths = set(paths) | {manifest.absolute(rel_path) for rel_path in manifest.compressed}
+    for path in paths:
+        for fmt in PRECOMPRESSED_FORMATS:
+            remove_sidecar(path, fmt)
+        manifest.compressed.pop(manifest.relative(path), None)
+
+
+class BackgroundTask:
+    """Runs a function on a worker thread, progress and result are delivered on the Tk thread"""
+    
+    def __init__(self, root, func, on_progress, on_done, poll_ms=ZIP_POLL_MS):
+        self.root = root
+        self.func = func  # func(progress), progress(*args) may be called from the worker thread
+        self.on_progress = on_progress
+        self.on_done = on_done  # on_done(result, error)
+        self.poll_ms = poll_ms
+        self.messages = queue.Queue()
+    
+    def start(self):
+        """Start the worker thread and polling"""
+        threading.Thread(target=self.run, daemon=True).start()
+        self.root.after(self.poll_ms, self.poll)
+    
+    def run(self):
+        """Worker side"""
+        try:
+            result = self.func(lambda *args: self.messages.put(("progress", args)))
+            self.messages.put(("done", (result, None)))
+        except Exception as e:
+            self.messages.put(("done", (None, e)))
+    
+    def poll(self):
+        """Deliver progress and the final result"""
+        try:
+            while True:
+                kind, args = self.messages.get_nowait()
+                if kind == "done":
+                    self.on_done(*args)
+                    return
+                self.on_progress(*args)
+        except queue.Empty:
+            pass
+        self.root.after(self.poll_ms, self.poll)
+
+
+def stack_png_tiles(tiles):
+    """Join PNG images from top to bottom into one PNG"""
+    images = [Image.open(io.BytesIO(tile)) for tile in tiles]
+    page = Image.new("RGB", (max(img.width for img in images), sum(img.height for img in images)), "white")
+    top = 0
+    for img in images:
+        page.paste(img, (0, top))
+        top += img.height
+    return image_png_bytes(page)
+
+
+class ScreenshotSession:
+    """Headless Chrome that is started on first use and reused for every screenshot
+    
+    Starting the browser takes seconds, so screenshots of many weeks share one session.
+    """
+    
+    def __init__(self, window_size=SCREENSHOT_WINDOW_SIZE):
+        self.window_size = window_size
+        self.driver = None
+        self.lock = threading.Lock()  # The browser renders one page at a time
+    
+    def start(self):
+        """Launch Chrome, raises ImportError if selenium is not installed"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
+        self.driver = webdriver.Chrome(options=chrome_options)
+        atexit.register(self.close)  # Don't leave Chrome running if the app exits without closing the session
+        return self.driver
+    
+    def capture(self, html_path, full_page=False):
+        """Render a page and return the screenshot as PNG bytes
+        
+        full_page sizes the image to the table and the whole page height instead of the window.
+        """
+        from selenium.common.exceptions import WebDriverException
+        
+        with self.lock:
+            if self.driver is not None:
+                try:
+                    return self.render(self.driver, html_path, full_page)
+                except WebDriverException:
+                    self.quit_driver()  # Crashed or closed, retry once with a fresh browser
+            return self.render(self.start(), html_path, full_page)
+    
+    def render(self, driver, html_path, full_page):
+        """Load the page and take the screenshot"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        driver.get(f"file://{os.path.abspath(html_path)}")
+        WebDriverWait(driver, SCREENSHOT_TIMEOUT).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        if not full_page:
+            return driver.get_screenshot_as_png()
+        
+        # Natural width of the table plus the page padding, the table itself is 100% wide
+        width = driver.execute_script("""
+            const table = document.querySelector('table');
+            const main = document.querySelector('main');
+            if (!table || !main) return document.documentElement.scrollWidth;
+            table.style.width = 'max-content';
+            const width = table.getBoundingClientRect().width;
+            table.style.width = '';
+            const style = getComputedStyle(main);
+            return Math.ceil(width + parseFloat(style.paddingLeft) + parseFloat(style.paddingRight));
+        """)
+        width = max(int(width), SCREENSHOT_MIN_WIDTH)
+        driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+            "width": width, "height": self.window_size[1], "deviceScaleFactor": 1, "mobile": False})
+        try:
+            height = max(int(driver.execute_script("return document.documentElement.scrollHeight")), 1)
+            tiles = []
+            for top in range(0, height, SCREENSHOT_MAX_HEIGHT):
+                result = driver.execute_cdp_cmd("Page.captureScreenshot", {
+                    "format": "png", "captureBeyondViewport": True,
+                    "clip": {"x": 0, "y": top, "width": width, "height": min(SCREENSHOT_MAX_HEIGHT, height - top),
+                             "scale": 1}})
+                tiles.append(base64.b64decode(result["data"]))
+        finally:
+            driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+        return tiles[0] if len(tiles) == 1 else stack_png_tiles(tiles)
+    
+    def quit_driver(self):
+        """Quit the browser, ignoring errors of an already dead session"""
+        driver, self.driver = self.driver, None
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Warning: Could not quit the screenshot browser: {e}")
+    
+    def close(self):
+        """Shut the browser down, the session can be started again later"""
+        with self.lock:
+            self.quit_driver()
+        atexit.unregister(self.close)
+
+
+class BuildManifest:
+    """Records which source (path, size, mtime, hash) each staged website file came from"""
+    
+    def __init__(self, website_dir):
+        self.website_dir = website_dir
+        self.path = os.path.join(website_dir, BUILD_MANIFEST_FILE)
+        self.outputs = {}  # Output path relative to website_dir -> source record
+        self.compressed = {}  # Path relative to website_dir -> {"hash", "formats"} of its sidecars
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.outputs = data.get("outputs", {})
+            self.compressed = data.get("compressed", {})
+        except (OSError, ValueError, AttributeError):
+            self.outputs, self.compressed = {}, {}
+        self.by_source = {}
+        for rel_path, record in self.outputs.items():
+            self.by_source.setdefault(record.get("source"), []).append(rel_path)
+    
+    def relative(self, output_path):
+        """Manifest key of an output file"""
+        return os.path.relpath(output_path, self.website_dir).replace(os.sep, "/")
+    
+    def absolute(self, rel_path):
+        """Output file path of a manifest key"""
+        return os.path.join(self.website_dir, *rel_path.split("/"))
+    
+    def source_state(self, source_path):
+        """Current record for a source file, without hash"""
+        st = os.stat(source_path)
+        return {"source": os.path.abspath(source_path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    
+    def unchanged_output(self, state, output_path=None):
+        """Return an existing output that is up to date for the source, or None
+        
+        Without output_path any output built from the source qualifies (content-hash names).
+        """
+        if output_path is not None:
+            candidates = [self.relative(output_path)]
+        else:
+            candidates = self.by_source.get(state["source"], [])
+        for rel_path in candidates:
+            record = self.outputs.get(rel_path)
+            if not record or record.get("source") != state["source"] or record.get("size") != state["size"]:
+                continue
+            if record.get("options") != state.get("options"):
+                continue  # Photo optimization settings changed
+            if output_path is None and not record.get("shared"):
+                continue  # Only content-hash named outputs can be shared
+            output = self.absolute(rel_path)
+            try:
+                if os.path.getsize(output) != record.get("output_size", record["size"]):
+                    continue
+            except OSError:
+                continue
+            if not all(os.path.exists(self.absolute(variant)) for variant, _ in record.get("srcset", [])):
+                continue
+            # Touched but identical files are recognized by their hash
+            if record.get("mtime_ns") == state["mtime_ns"] or (
+                    record.get("hash") and file_content_hash(state["source"]) == record["hash"]):
+                return output
+        return None
+    
+    def srcset(self, output_path):
+        """Recorded srcset of an output as (path, width) pairs"""
+        record = self.outputs.get(self.relative(output_path), {})
+        return [(self.absolute(variant), width) for variant, width in record.get("srcset", [])]
+    
+    def dimensions(self, output_path):
+        """Recorded (width, height) of a photo output, read from the file if missing"""
+        dimensions = self.outputs.get(self.relative(output_path), {}).get("dimensions")
+        return tuple(dimensions) if dimensions else image_dimensions(output_path)
+    
+    def previous_outputs(self, source_path):
+        """Outputs that were built from a source, e.g. one that has been moved away since"""
+        return [self.absolute(rel_path) for rel_path in self.by_source.get(os.path.abspath(source_path), [])
+                if os.path.exists(self.absolute(rel_path))]
+    
+    def update(self, output_path, record):
+        """Record the source of a freshly staged or verified output"""
+        self.outputs[self.relative(output_path)] = record
+    
+    def prune(self, live_outputs):
+        """Delete outputs from earlier builds that this build no longer uses, returns their count"""
+        live = {self.relative(path) for path in live_outputs}
+        live_files = set(live)
+        for rel_path in live:
+            live_files.update(variant for variant, _ in self.outputs.get(rel_path, {}).get("srcset", []))
+        
+        removed = 0
+        for rel_path in list(self.outputs):
+            if rel_path in live:
+                continue
+            record = self.outputs.pop(rel_path)
+            for path in [rel_path] + [variant for variant, _ in record.get("srcset", [])]:
+                if path in live_files:
+                    continue
+                try:
+                    os.remove(self.absolute(path))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"Warning: Could not remove outdated file {path}: {e}")
+        return removed
+    
+    def save(self):
+        """Write the manifest next to the website files"""
+        try:
+            write_json_atomic(self.path, {"version": 1, "outputs": self.outputs, "compressed": self.compressed},
+                              indent=1)
+        except OSError as e:
+            print(f"Warning: Could not write build manifest: {e}")
+
+
+def start_process_pool(max_workers, **kwargs):
+    """ProcessPoolExecutor whose workers don't fork this process
+    
+    Forking while other threads hold locks (Tk, copy workers) can deadlock the child.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    available = multiprocessing.get_all_start_methods()
+    method = next(method for method in PROCESS_START_METHODS if method in available)
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method), **kwargs)
+
+
+def is_animated_image(path):
+    """Whether an image file has several frames, False if it can't be read"""
+    try:
+        with Image.open(path) as img:
+            return getattr(img, "is_animated", False)
+    except (OSError, ValueError, SyntaxError):
+        return False
+
+
+class FileCopyBatch:
+    """Stages files on a bounded thread pool and reports progress on the Tk thread"""
+    
+    def __init__(self, root, jobs, on_progress, on_done, workers=COPY_WORKERS, manifest=None, photo_pool=None):
+        self.root = root
+        self.manifest = manifest  # Optional BuildManifest, unchanged outputs are not copied again
+        self.photo_pool = photo_pool  # Optional process pool for photo optimization
+        # Dicts with "label", "src", "dst" and "move"; "dedupe" makes "dst" a folder,
+        # "optimize" holds optimize_photo settings for photos that are re-encoded
+        self.jobs = jobs
+        self.on_progress = on_progress  # on_progress(done, total, job, error)
+        self.on_done = on_done  # on_done(errors), errors is a list of (job, exception)
+        self.workers = workers
+        self.results = queue.Queue()
+        self.errors = []
+        self.done = 0
+    
+    def start(self):
+        """Submit all jobs and start polling for results"""
+        if not self.jobs:
+            self.on_done(self.errors)
+            return
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="file-copy")
+        for job in self.jobs:
+            self.executor.submit(self.run, job)
+        self.root.after(COPY_POLL_MS, self.poll)
+    
+    def run(self, job):
+        """Worker side: stage one file and queue the outcome"""
+        try:
+            self.stage(job)
+            self.results.put((job, None))
+        except Exception as e:
+            self.results.put((job, e))
+    
+    def stage(self, job):
+        """Copy, move or optimize a file unless the manifest has an up-to-date output"""
+        manifest = self.manifest
+        options = job.get("optimize")
+        is_photo = any(kind == "photo" for kind, _ in job.get("slots", []))
+        if manifest is not None:
+            state = manifest.source_state(job["src"])
+            if options:
+                state["options"] = json.dumps(options, sort_keys=True)
+            output = manifest.unchanged_output(state, None if job.get("dedupe") else job["dst"])
+            if output is not None:
+                job["dst"], job["skipped"] = output, True
+                job["srcset"] = manifest.srcset(output)
+                job["dimensions"] = manifest.dimensions(output) if is_photo else None
+                self.embed(job)
+                if job["move"]:
+                    os.remove(job["src"])
+                job["record"] = dict(manifest.outputs[manifest.relative(output)], **state)
+                return
+        
+        content_hash = None
+        if options:
+            if job.get("dedupe"):
+                # Name by source content and settings, so identical photos share their files
+                content_hash = file_content_hash(job["src"])
+                directory = job["dst"]
+                base_name = hashlib.sha256(f"{content_hash}{options}".encode()).hexdigest()[:MEDIA_HASH_LENGTH]
+            else:
+                content_hash = file_content_hash(job["src"]) if manifest is not None else None
+                directory, base_name = os.path.split(os.path.splitext(job["dst"])[0])
+            args = (job["src"], directory, base_name, options["max_dimension"], options["format"], options["widths"])
+            if self.photo_pool is not None:
+                result = self.photo_pool.submit(optimize_photo, *args).result()
+            else:
+                result = optimize_photo(*args)
+            job["dst"], job["srcset"], job["dimensions"] = result["dst"], result["srcset"], result["dimensions"]
+            if job["move"]:
+                os.remove(job["src"])
+        elif job.get("dedupe"):
+            job["dst"], content_hash = stage_deduplicated_file(job["src"], job["dst"], job["move"])
+        else:
+            stage_file(job["src"], job["dst"], job["move"])
+            content_hash = file_content_hash(job["dst"]) if manifest is not None else None
+        if is_photo and not options:
+            job["dimensions"] = image_dimensions(job["dst"])
+        self.embed(job)
+        
+        if manifest is not None:
+            job["record"] = dict(state, hash=content_hash, output_size=os.path.getsize(job["dst"]),
+                                 shared=bool(job.get("dedupe")),
+                                 srcset=[[manifest.relative(path), width] for path, width in job.get("srcset", [])],
+                                 dimensions=job.get("dimensions"))
+    
+    def run_all(self):
+        """Stage all jobs without Tk and return the errors as (job, exception)"""
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="file-copy") as executor:
+            list(executor.map(self.run, self.jobs))
+        while not self.results.empty():
+            job, error = self.results.get_nowait()
+            if error is not None:
+                self.errors.append((job, error))
+        return self.errors
+    
+    def embed(self, job):
+        """Create the data URI thumbnail for photos of single-file pages"""
+        if not job.get("embed"):
+            return
+        if self.photo_pool is not None:
+            job["data_uri"] = self.photo_pool.submit(photo_data_uri, job["dst"]).result()
+        else:
+            job["data_uri"] = photo_data_uri(job["dst"])
+    
+    def poll(self):
+        """Report finished files and call on_done once every job is through"""
+        try:
+            while True:
+                job, error = self.results.get_nowait()
+                self.done += 1
+                if error is not None:
+                    self.errors.append((job, error))
+                self.on_progress(self.done, len(self.jobs), job, error)
+        except queue.Empty:
+            pass
+        
+        if self.done < len(self.jobs):
+            self.root.after(COPY_POLL_MS, self.poll)
+        else:
+            self.executor.shutdown(wait=False)
+            self.on_done(self.errors)
+
+
+class MealSearchIndex:
+    """Inverted trigram index over meal name, additional info and meal ID"""
+    
+    def __init__(self, index_file):
+        self.index_file = index_file
+        self.texts = {}  # meal_id -> folded searchable text, in library order
+        self.names = {}  # meal_id -> folded name
+        self.tokens = {}  # meal_id -> words of the folded name, precomputed for fuzzy matching
+        self.order = {}  # meal_id -> position for creation order results
+        self.postings = {}  # trigram -> set of meal_ids (list until first use after loading)
+        self.next_position = 0
+        self.dirty = False  # Changed since the last save
+    
+    def posting(self, gram):
+        """Meal IDs containing a trigram, converting loaded lists to sets on first use"""
+        ids = self.postings.get(gram)
+        if isinstance(ids, list):
+            ids = self.postings[gram] = set(ids)
+        return ids
+    
+    def signature(self, meals_library):
+        """Fingerprint of the indexed fields, used to detect outdated index files"""
+        digest = hashlib.sha1()
+        for meal_id, meal_data in meals_library.items():
+            digest.update(f"{meal_id}\0{meal_data.get('name', '')}\0{meal_data.get('additional_info', '')}\0".encode("utf-8"))
+        return digest.hexdigest()
+    
+    def load_or_build(self, meals_library):
+        """Load the persisted index, rebuilding it if it doesn't match the library"""
+        signature = self.signature(meals_library)
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == SEARCH_INDEX_VERSION and data.get("signature") == signature:
+                self.clear()
+                for meal_id, (name, text) in data["meals"].items():
+                    self.names[meal_id] = name
+                    self.tokens[meal_id] = tuple(name.split())
+                    self.texts[meal_id] = text
+                    self.order[meal_id] = self.next_position
+                    self.next_position += 1
+                self.postings = data["postings"]
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing or broken index file, rebuild below
+        
+        self.build(meals_library)
+        self.save(meals_library)
+    
+    def clear(self):
+        """Remove all entries"""
+        self.texts.clear()
+        self.names.clear()
+        self.tokens.clear()
+        self.order.clear()
+        self.postings = {}
+        self.next_position = 0
+    
+    def build(self, meals_library):
+        """Index all meals from scratch"""
+        self.clear()
+        postings = self.postings
+        for meal_id, meal_data in meals_library.items():
+            name, text = self.fold_fields(meal_id, meal_data)
+            for gram in trigrams(text):
+                ids = postings.get(gram)
+                if ids is None:
+                    postings[gram] = {meal_id}
+                else:
+                    ids.add(meal_id)
+            self.names[meal_id] = name
+            self.tokens[meal_id] = tuple(name.split())
+            self.texts[meal_id] = text
+            self.order[meal_id] = self.next_position
+            self.next_position += 1
+    
+    def fold_fields(self, meal_id, meal_data):
+        """Folded name and combined searchable text of a meal"""
+        name = fold_search_text(meal_data.get('name', ''))
+        text = "\n".join((name, fold_search_text(meal_data.get('additional_info', '')), fold_search_text(meal_id)))
+        return name, text
+    
+    def update(self, meal_id, meal_data):
+        """Add or re-index a single meal"""
+        name, text = self.fold_fields(meal_id, meal_data)
+        
+        old_text = self.texts.get(meal_id)
+        old_grams = trigrams(old_text) if old_text is not None else set()
+        new_grams = trigrams(text)
+        for gram in old_grams - new_grams:
+            ids = self.posting(gram)
+            if ids is not None:
+                ids.discard(meal_id)
+                if not ids:
+                    del self.postings[gram]
+        for gram in new_grams - old_grams:
+            ids = self.posting(gram)
+            if ids is None:
+                self.postings[gram] = {meal_id}
+            else:
+                ids.add(meal_id)
+        
+        if meal_id not in self.order:
+            self.order[meal_id] = self.next_position
+            self.next_position += 1
+        self.dirty = True
+        self.names[meal_id] = name
+        self.tokens[meal_id] = tuple(name.split())
+        self.texts[meal_id] = text
+    
+    def remove(self, meal_id):
+        """Remove a meal from the index"""
+        text = self.texts.pop(meal_id, None)
+        if text is None:
+            return
+        for gram in trigrams(text):
+            ids = self.posting(gram)
+            if ids is not None:
+                ids.discard(meal_id)
+                if not ids:
+                    del self.postings[gram]
+        self.names.pop(meal_id, None)
+        self.tokens.pop(meal_id, None)
+        self.order.pop(meal_id, None)
+        self.dirty = True
+    
+    def candidates(self, query):
+        """Meal IDs that may contain the (folded) query, in creation order"""
+        grams = trigrams(query)
+        if not grams:
+            return list(self.texts)  # Too short for trigrams, check every meal
+        
+        posting_sets = []
+        for gram in grams:
+            ids = self.posting(gram)
+            if not ids:
+                return []
+            posting_sets.append(ids)
+        posting_sets.sort(key=len)
+        result = set(posting_sets[0])
+        for ids in posting_sets[1:]:
+            result &= ids
+            if not result:
+                return []
+        return sorted(result, key=self.order.__getitem__)
+    
+    def matches(self, query, meal_id):
+        """Check if the (folded) query is a substring of the meal's indexed fields"""
+        return query in self.texts.get(meal_id, "")
+    
+    def name_matches(self, query, meal_id):
+        """Check if the (folded) query is a substring of the meal's name"""
+        return query in self.names.get(meal_id, "")
+    
+    def rank(self, query, meals_library, limit=FUZZY_RESULT_LIMIT):
+        """Meals ranked by fuzzy name match plus recency/frequency of use"""
+        words = query.split()
+        scored = []
+        token_scores = {}
+        for meal_id in self.fuzzy_candidates(query, words):
+            meal_data = meals_library.get(meal_id)
+            if meal_data is None:
+                continue
+            score = self.match_score(query, words, meal_id, token_scores) if words else 0
+            if score is None:
+                continue
+            scored.append((score + self.usage_boost(meal_data), meal_id))
+        
+        # Best score first, ties in creation order
+        best = heapq.nlargest(limit, scored, key=lambda item: (item[0], -self.order[item[1]]))
+        return [(meal_id, meals_library[meal_id]) for _, meal_id in best]
+    
+    def fuzzy_candidates(self, query, words):
+        """Meal IDs worth scoring; large libraries only score meals sharing a trigram"""
+        if len(self.texts) <= FUZZY_FULL_SCAN_LIMIT or not words:
+            return list(self.texts)
+        
+        grams = set()
+        for word in words:
+            grams |= trigrams(word)
+        if not grams:
+            return self.candidates(query)
+        
+        result = set()
+        for gram in grams:
+            ids = self.posting(gram)
+            if ids:
+                result |= ids
+        return result
+    
+    def match_score(self, query, words, meal_id, token_scores):
+        """Score how well the query matches a meal name, None if a word doesn't match"""
+        name = self.names[meal_id]
+        tokens = self.tokens[meal_id]
+        
+        total = 0
+        for word in words:
+            best = None
+            for token in tokens:
+                # Names share most words, so each word/token pair is scored once per search
+                key = (word, token)
+                if key in token_scores:
+                    score = token_scores[key]
+                else:
+                    score = token_scores[key] = self.token_score(word, token)
+                if score is not None and (best is None or score > best):
+                    best = score
+            if best is None:
+                return None
+            total += best
+        score = total / len(words)
+        
+        # Boost whole-name matches, especially at the start of the name
+        if name == query:
+            score += 50
+        elif name.startswith(query):
+            score += 30
+        elif query in name:
+            score += 10
+        return score
+    
+    def token_score(self, word, token):
+        """Score a single search word against a single name word"""
+        if token == word:
+            return 30
+        if token.startswith(word):
+            return 25
+        if word in token:
+            return 15
+        tolerance = typo_tolerance(word)
+        if tolerance:
+            # Compare with the token and its prefix, so typos while typing still match
+            distance = min(edit_distance(word, token[:len(word)], tolerance),
+                           edit_distance(word, token, tolerance))
+            if distance <= tolerance:
+                return 12 - 4 * distance
+        return None
+    
+    def usage_boost(self, meal_data):
+        """Bonus for frequently and recently used meals"""
+        boost = min(10, 3 * math.log1p(meal_data.get('use_count', 0)))
+        last_used = meal_data.get('last_used')
+        if last_used:
+            try:
+                days = (datetime.now() - datetime.fromisoformat(last_used)).days
+            except ValueError:
+                days = None
+            if days is not None:
+                if days <= 7:
+                    boost += 5
+                elif days <= 30:
+                    boost += 2
+        return boost
+    
+    def save(self, meals_library):
+        """Persist the index next to the meal library"""
+        data = {
+            "version": SEARCH_INDEX_VERSION,
+            "signature": self.signature(meals_library),
+            "meals": {meal_id: [self.names[meal_id], text] for meal_id, text in self.texts.items()},
+            "postings": {gram: list(ids) for gram, ids in self.postings.items()}
+        }
+        try:
+            write_json_atomic(self.index_file, data, separators=(",", ":"))
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: Could not save search index: {e}")
+
+
+class IncrementalSearch:
+    """Debounced, cancellable search that refines previous results when the query grows"""
+    
+    def __init__(self, root, get_items, matches, on_results, delay=SEARCH_DEBOUNCE_MS, refine=True,
+                 min_refine_length=0):
+        self.root = root
+        self.get_items = get_items  # query -> candidate list of (meal_id, meal_data)
+        self.matches = matches  # (query, meal_id, meal_data) -> bool, None if candidates are final
+        self.refine = refine  # Filter previous results when the query grows
+        # Results of shorter queries are not refined, get_items narrows better (e.g. the trigram index)
+        self.min_refine_length = min_refine_length
+        self.on_results = on_results  # Called with (query, results) when a search completes
+        self.delay = delay
+        self.after_id = None
+        self.generation = 0  # Incremented on cancel so running scans notice they are stale
+        self.last_query = None
+        self.last_results = None
+    
+    def schedule(self, query):
+        """Restart the debounce timer for a new query"""
+        self.cancel()
+        self.after_id = self.root.after(self.delay, lambda: self.run(query))
+    
+    def cancel(self):
+        """Cancel pending and running searches"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.generation += 1
+    
+    def invalidate(self):
+        """Forget previous results, e.g. after the library changed"""
+        self.last_query = None
+        self.last_results = None
+    
+    def run(self, query):
+        """Search immediately, reusing the previous result set if possible"""
+        self.cancel()
+        
+        # A longer query can only match a subset of the previous results
+        if (self.refine and self.last_results is not None and query.startswith(self.last_query)
+                and len(self.last_query) >= self.min_refine_length):
+            candidates = self.last_results
+        else:
+            candidates = self.get_items(query)
+        
+        if not query or self.matches is None:
+            self.finish(query, list(candidates))
+        else:
+            self.scan(query, candidates, 0, [], self.generation)
+    
+    def scan(self, query, candidates, start, results, generation):
+        """Check one chunk of candidates and schedule the next one"""
+        self.after_id = None
+        if generation != self.generation:
+            return  # Superseded by a newer search
+        
+        end = min(start + SEARCH_CHUNK_SIZE, len(candidates))
+        for meal_id, meal_data in candidates[start:end]:
+            if self.matches(query, meal_id, meal_data):
+                results.append((meal_id, meal_data))
+        
+        if end < len(candidates):
+            self.after_id = self.root.after(
+                1, lambda: self.scan(query, candidates, end, results, generation))
+        else:
+            self.finish(query, results)
+    
+    def finish(self, query, results):
+        """Store results for later refinement and report them"""
+        self.last_query = query
+        self.last_results = results
+        self.on_results(query, results)
+
+
+WEEK_DAYS = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
+DEFAULT_SOURCE_NAMES = ("Ganze Zutaten Liste", "Nach Gericht getrennte Zutaten Liste")
+
+
+@dataclass(slots=True)
+class DishSlot:
+    """One cell of the week table, "/" as PDF or photo means the dish has none"""
+    name: str
+    pdf: str = ""  # Source path of the recipe PDF
+    photo: str = ""  # Source path of the photo
+    empty: bool = False
+
+
+@dataclass(slots=True)
+class WeekPlan:
+    """Plain data of one week, edited by the GUI and consumed by the template, exporter and batch builds
+    
+    Holds no Tk state, so plans can be pickled to worker processes.
+    """
+    week_start: str
+    week_end: str
+    categories: list  # [(name, rows)]
+    slots: dict = field(default_factory=dict)  # dish_num -> DishSlot, column-wise numbering
+    empty_cell_display: str = "-"
+    show_photos: bool = True
+    show_sources_box: bool = False
+    source_names: tuple = DEFAULT_SOURCE_NAMES
+    source_files: dict = field(default_factory=dict)  # "pdf1"/"pdf2" -> source path of the download PDFs
+    inline_css: str | None = None  # Minified stylesheet for single-file pages
+    # Final media files after staging, see SiteMedia.plan_fields
+    photo_names: dict = field(default_factory=dict)
+    pdf_names: dict = field(default_factory=dict)
+    photo_srcsets: dict = field(default_factory=dict)
+    photo_dimensions: dict = field(default_factory=dict)
+    photo_data_uris: dict = field(default_factory=dict)
+    
+    @classmethod
+    def for_week(cls, week_start, week_end, categories, **settings):
+        """New plan with a default slot for every dish of the week"""
+        total_dishes = sum(row_count for _, row_count in categories) * 7
+        slots = {dish_num: DishSlot(f"Gericht {dish_num}") for dish_num in range(1, total_dishes + 1)}
+        return cls(week_start, week_end, list(categories), slots, **settings)
+
+
+class MealPlanTemplate:
+    """Precompiled renderer for index.html, builds the page from fragments joined once
+    
+    A plan is a WeekPlan, so many weeks can be rendered without any Tk state.
+    All user data is HTML-escaped.
+    """
+    
+    HEAD = ('''<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Essensplan {week_range}</title>
+    {stylesheet}
+</head>
+<body>
+    <header>
+        <h1>{week_range}</h1>
+    </header>
+    <main>
+        <table>
+            <thead>
+                <tr>
+                    <th></th>''')
+    DAY_HEADER = '\n                    <th>{day}</th>'
+    BODY_START = '''
+                </tr>
+            </thead>
+            <tbody>'''
+    ROW_START = '''
+                <tr>
+                    <th>{category}</th>'''
+    EMPTY_CELL = {
+        "-": '''
+                    <td class="empty-cell">
+                        <span class="no-food">-</span>
+                    </td>''',
+        "nothing": '''
+                    <td class="empty-cell">
+                        <span class="dish-name"></span>
+                    </td>''',
+    }
+    CELL_START = '''
+                    <td>
+                        <span class="dish-name">{dish_name}</span>'''
+    PHOTO = '''
+                        <img src="{photo_src}"{photo_attributes} alt="{alt}" loading="lazy" decoding="async">'''
+    PDF = '''
+                        <a href="media/pdfs/{pdf_name}" target="_blank">Rezept PDF</a>'''
+    CELL_END = '''
+                    </td>'''
+    ROW_END = '''
+                </tr>'''
+    TABLE_END = '''
+            </tbody>
+        </table>'''
+    SOURCES = '''
+
+    <div class="pdf-links-container">
+        <h2>Download Links:</h2>
+        <a href="media/pdfs/ingredients-full-list.pdf" target="_blank" class="pdf-link">{pdf1}</a>
+        <a href="media/pdfs/ingredients-separated-by-dish.pdf" target="_blank" class="pdf-link">{pdf2}</a>
+    </div>'''
+    FOOT = '''
+
+    </main>
+</body>
+</html>'''
+    
+    def __init__(self):
+        # Static parts that don't depend on the plan are rendered only once
+        self.day_headers = "".join(self.DAY_HEADER.format(day=day) for day in WEEK_DAYS) + self.BODY_START
+        # Cells are concatenated from the constant parts around their fields, which is cheaper than
+        # a format call with keyword arguments per cell
+        self.cell_start, self.cell_name_end = self.CELL_START.split("{dish_name}")
+        self.photo_start, photo_rest = self.PHOTO.split("{photo_src}")
+        self.photo_src_end, self.photo_end = photo_rest.split("{photo_attributes}")
+        self.pdf_start, self.pdf_end = self.PDF.split("{pdf_name}")
+    
+    def fragments(self, plan):
+        """Yield the page in fragments - column-wise dish numbering"""
+        week_range = escape(f"Woche: {plan.week_start} - {plan.week_end}")
+        inline_css = plan.inline_css
+        stylesheet = f"<style>{inline_css}</style>" if inline_css else '<link rel="stylesheet" href="styles.css">'
+        yield self.HEAD.format(week_range=week_range, stylesheet=stylesheet)
+        yield self.day_headers
+        
+        categories = plan.categories
+        slots = plan.slots
+        empty_cell = self.EMPTY_CELL.get(plan.empty_cell_display, self.EMPTY_CELL["nothing"])
+        show_photos = plan.show_photos
+        photo_names = plan.photo_names
+        photo_srcsets = plan.photo_srcsets
+        photo_dimensions = plan.photo_dimensions
+        photo_data_uris = plan.photo_data_uris
+        pdf_names = plan.pdf_names
+        total_categories = sum(row_count for _, row_count in categories)
+        
+        cell_start, cell_name_end, cell_end = self.cell_start, self.cell_name_end, self.CELL_END
+        photo_start, photo_src_end = self.photo_start, self.photo_src_end
+        pdf_start, pdf_end = self.pdf_start, self.pdf_end
+        
+        category_row_counter = 0  # Track current category row across all categories
+        for category_name, row_count in categories:
+            category_html = escape(category_name)
+            photo_ends = [self.photo_end.format(alt=f"{category_html} {day_name}") for day_name in WEEK_DAYS]
+            for row in range(row_count):
+                # Only show category name in first row, leave others empty
+                parts = [self.ROW_START.format(category=category_html if row == 0 else "")]
+                append = parts.append
+                
+                for day_idx in range(7):
+                    # Calculate dish number column-wise (by day first, then by category)
+                    dish_counter = (day_idx * total_categories) + category_row_counter + 1
+                    
+                    # Dishes without a slot are empty as well
+                    slot = slots.get(dish_counter)
+                    if slot is None or slot.empty:
+                        append(empty_cell)
+                        continue
+                    
+                    append(cell_start)
+                    append(escape(slot.name))
+                    append(cell_name_end)
+                    if show_photos and slot.photo != "/":
+                        append(photo_start)
+                        append(self.photo_src(dish_counter, photo_names, photo_data_uris))
+                        append(photo_src_end)
+                        if dish_counter in photo_dimensions or dish_counter in photo_srcsets:
+                            append(self.photo_attributes(
+                                None if dish_counter in photo_data_uris else photo_srcsets.get(dish_counter),
+                                photo_dimensions.get(dish_counter)))
+                        append(photo_ends[day_idx])
+                    if slot.pdf != "/":
+                        append(pdf_start)
+                        if dish_counter in pdf_names:
+                            append(escape(pdf_names[dish_counter]))
+                        else:
+                            append(f"recipe{dish_counter}.pdf")
+                        append(pdf_end)
+                    append(cell_end)
+                
+                append(self.ROW_END)
+                yield "".join(parts)  # One fragment per table row
+                category_row_counter += 1  # Increment for next category row
+        
+        yield self.TABLE_END
+        
+        # Add sources box if enabled
+        if plan.show_sources_box:
+            pdf1, pdf2 = plan.source_names
+            yield self.SOURCES.format(pdf1=escape(pdf1), pdf2=escape(pdf2))
+        
+        yield self.FOOT
+    
+    def photo_src(self, dish_num, photo_names, photo_data_uris):
+        """Embedded data URI or link to the published photo"""
+        if dish_num in photo_data_uris:
+            return photo_data_uris[dish_num]
+        if dish_num in photo_names:
+            return "media/photos/" + escape(photo_names[dish_num])
+        return f"media/photos/photo{dish_num}.jpg"
+    
+    def photo_attributes(self, srcset, dimensions):
+        """srcset/sizes for photos with resized variants, width/height to reserve the space before loading"""
+        attributes = ""
+        if srcset:
+            candidates = ", ".join(f"media/photos/{escape(name)} {width}w" for name, width in srcset)
+            attributes += f' srcset="{candidates}" sizes="{PHOTO_SIZES}"'
+        if dimensions:
+            attributes += f' width="{dimensions[0]}" height="{dimensions[1]}"'
+        return attributes
+    
+    def render(self, plan):
+        """Return the page as a string"""
+        return "".join(self.fragments(plan))
+    
+    def render_to_file(self, plan, path):
+        """Stream the page into a file"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(self.fragments(plan))
+    
+    def render_batch(self, plans):
+        """Render several weeks, returns the pages in order"""
+        return [self.render(plan) for plan in plans]
+
+
+MEAL_PLAN_TEMPLATE = MealPlanTemplate()
+
+
+def site_css():
+    """Stylesheet of the generated website"""
+    return '''body {
+    font-family: Arial, sans-serif;
+    margin: 0;
+    padding: 0;
+    background-color: #f0f0f5;
+    color: #333;
+}
+
+header {
+    background-color: #444;
+    color: #fff;
+    text-align: center;
+    padding: 15px 0;
+}
+
+h1 {
+    margin: 0;
+    font-size: 24px;
+}
+
+main {
+    padding: 20px;
+}
+
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 20px 0;
+    background-color: #fff;
+    box-shadow: 0 0 10px rgba(0, 0, 0, 0.1);
+}
+
+th, td {
+    border: 1px solid #ddd;
+    text-align: center;
+    padding: 10px;
+}
+
+th {
+    background-color: #f8f8f8;
+    font-weight: bold;
+}
+
+td img {
+    max-width: 80px;
+    height: auto;
+    display: block;
+    margin: 10px auto;
+}
+
+.dish-name {
+    display: block;
+    text-decoration: underline;
+    margin-bottom: 8px;
+    font-weight: bold;
+    color: #555;
+}
+
+.empty-cell {
+    background-color: #f9f9f9;
+}
+
+.no-food {
+    font-size: 24px;
+    color: #ccc;
+    font-weight: bold;
+}
+
+a {
+    color: #007bff;
+    text-decoration: none;
+    display: inline-block;
+    margin-top: 5px;
+}
+
+a:hover {
+    text-decoration: underline;
+}
+
+.pdf-links-container {
+    border: 2px solid #007bff;
+    border-radius: 8px;
+    background-color: #fff;
+    padding: 20px;
+    margin-top: 20px;
+    box-shadow: 0 0 10px rgba(0, 0, 0, 0.1);
+}
+
+.pdf-links-container h2 {
+    margin-top: 0;
+    font-size: 20px;
+    color: #007bff;
+}
+
+.pdf-link {
+    display: block;
+    color: #007bff;
+    text-decoration: none;
+    font-size: 16px;
+    margin-bottom: 10px;
+}
+
+.pdf-link:hover {
+    text-decoration: underline;
+}
+
+@media (max-width: 768px) {
+    table, th, td {
+        font-size: 14px;
+    }
+
+    th, td {
+        padding: 8px;
+    }
+
+    td img {
+        max-width: 60px;
+    }
+}'''
+
+
+SOURCE_PDF_FILES = (("pdf1", "ingredients-full-list.pdf"), ("pdf2", "ingredients-separated-by-dish.pdf"))
+
+
+class SiteMedia:
+    """Plans the PDFs and photos of one website and collects their final names after staging"""
+    
+    def __init__(self, website_dir, move=False, dedupe=True, photo_options=None, embed_photos=False):
+        self.website_dir = website_dir
+        self.move = move
+        self.dedupe = dedupe
+        self.photo_options = photo_options  # optimize_photo settings, None publishes photos unchanged
+        self.embed_photos = embed_photos
+        self.manifest = BuildManifest(website_dir)
+        self.jobs = []
+        self.shared_jobs = {}  # (kind, source path) -> job, so a meal used on several days is staged once
+        self.kept_outputs = []  # Outputs of earlier builds whose source was moved into the website
+        self.media_names = {}  # ("pdf"|"photo", dish_num) -> file name in media/, if not the default
+        self.photo_srcsets = {}  # dish_num -> [(file name, width)] of optimized photos
+        self.photo_dimensions = {}  # dish_num -> (width, height) of the published photo
+        self.photo_data_uris = {}  # dish_num -> embedded thumbnail for single-file pages
+    
+    def add_plan(self, plan):
+        """Plan the media of every non-empty slot and the download-link PDFs of a WeekPlan"""
+        for dish_num, slot in plan.slots.items():
+            # Skip file copying for empty cells
+            if not slot.empty:
+                self.add_dish(dish_num, slot.pdf, slot.photo)
+        
+        # Copy source PDFs if enabled
+        if plan.show_sources_box:
+            for key, filename in SOURCE_PDF_FILES:
+                self.add_source_pdf(plan.source_files.get(key), filename)
+    
+    def add_dish(self, dish_num, pdf_path, photo_path):
+        """Plan the recipe PDF and photo of a dish, "/" or "" means none"""
+        # Handle special placeholder paths - only "/" now
+        if pdf_path and pdf_path != "/" and not os.path.exists(pdf_path):
+            self.keep_previous_output("pdf", dish_num, pdf_path)
+        elif pdf_path and pdf_path != "/":
+            self.add_job("pdf", dish_num, pdf_path)
+        
+        if photo_path and photo_path != "/" and not os.path.exists(photo_path):
+            self.keep_previous_output("photo", dish_num, photo_path)
+        elif photo_path and photo_path != "/":
+            # Animated images and other formats are published unchanged
+            optimize = self.photo_options if photo_path.lower().endswith(OPTIMIZABLE_PHOTO_EXTENSIONS) else None
+            if optimize and photo_path.lower().endswith(ANIMATED_PHOTO_EXTENSIONS) and is_animated_image(photo_path):
+                optimize = None
+            self.add_job("photo", dish_num, photo_path, optimize)
+    
+    def add_source_pdf(self, source_path, filename):
+        """Plan one of the download-link PDFs, which keep their fixed names"""
+        if source_path and os.path.exists(source_path):
+            self.jobs.append({"label": filename, "src": source_path, "move": self.move,
+                              "dst": os.path.join(self.website_dir, "media", "pdfs", filename)})
+        elif source_path:
+            self.kept_outputs.extend(self.manifest.previous_outputs(source_path))
+    
+    def keep_previous_output(self, kind, dish_num, source_path):
+        """Keep the output of a source that no longer exists (e.g. cut in an earlier build)"""
+        manifest = self.manifest
+        outputs = manifest.previous_outputs(source_path)
+        self.kept_outputs.extend(outputs)
+        if not self.dedupe:
+            # Prefer the file of this slot if the source was used by several slots
+            prefix = f"{'recipe' if kind == 'pdf' else 'photo'}{dish_num}."
+            outputs = sorted(outputs, key=lambda path: not os.path.basename(path).startswith(prefix))
+        if not outputs:
+            return
+        self.media_names[(kind, dish_num)] = os.path.basename(outputs[0])
+        if kind != "photo":
+            return
+        srcset = manifest.srcset(outputs[0])
+        if srcset:
+            self.photo_srcsets[dish_num] = [(os.path.basename(path), width) for path, width in srcset]
+        if manifest.dimensions(outputs[0]):
+            self.photo_dimensions[dish_num] = manifest.dimensions(outputs[0])
+        if self.embed_photos:
+            try:
+                self.photo_data_uris[dish_num] = photo_data_uri(outputs[0])
+            except OSError as e:
+                print(f"Warning: Could not embed photo {outputs[0]}: {e}")
+    
+    def add_job(self, kind, dish_num, source_path, optimize=None):
+        """Add a staging job for a dish's PDF or photo
+        
+        Deduplicated jobs are content-addressed, a source used by several dishes is staged once.
+        """
+        folder = os.path.join(self.website_dir, "media", "pdfs" if kind == "pdf" else "photos")
+        label = f"Rezept {dish_num}" if kind == "pdf" else f"Foto {dish_num}"
+        embed = self.embed_photos and kind == "photo"
+        if not self.dedupe:
+            if kind == "pdf":
+                filename = f"recipe{dish_num}.pdf"
+            elif optimize:
+                filename = f"photo{dish_num}{'.webp' if optimize['format'] == 'webp' else '.jpg'}"
+            else:
+                filename = f"photo{dish_num}{os.path.splitext(source_path)[1]}"
+            self.jobs.append({"label": label, "src": source_path, "move": self.move, "optimize": optimize,
+                              "embed": embed, "dst": os.path.join(folder, filename), "slots": [(kind, dish_num)]})
+            return
+        
+        job = self.shared_jobs.get((kind, os.path.abspath(source_path)))
+        if job is None:
+            job = {"label": label, "src": source_path, "move": self.move, "dedupe": True, "optimize": optimize,
+                   "embed": embed, "dst": folder, "slots": []}
+            self.shared_jobs[(kind, os.path.abspath(source_path))] = job
+            self.jobs.append(job)
+        job["slots"].append((kind, dish_num))
+    
+    def needs_photo_pool(self):
+        """Whether any job does CPU-heavy photo work"""
+        return any(job.get("optimize") or job.get("embed") for job in self.jobs)
+    
+    def finish(self, errors):
+        """Record staged files in the manifest and link every slot to its final file"""
+        failed = {id(job) for job, _ in errors}
+        
+        # Remember sources of the staged files; outputs no longer used are removed,
+        # unless something failed and an old output might still be the only copy
+        for job in self.jobs:
+            if id(job) not in failed:
+                self.manifest.update(job["dst"], job["record"])
+        if not errors:
+            self.manifest.prune([job["dst"] for job in self.jobs] + self.kept_outputs)
+        
+        # Link every slot to its final file (content-hash names, optimized formats) and srcset
+        for job in self.jobs:
+            if id(job) in failed:
+                continue
+            for kind, dish_num in job.get("slots", []):
+                self.media_names[(kind, dish_num)] = os.path.basename(job["dst"])
+                if kind == "photo" and job.get("srcset"):
+                    self.photo_srcsets[dish_num] = [(os.path.basename(path), width) for path, width in job["srcset"]]
+                if kind == "photo" and job.get("dimensions"):
+                    self.photo_dimensions[dish_num] = tuple(job["dimensions"])
+                if kind == "photo" and job.get("data_uri"):
+                    self.photo_data_uris[dish_num] = job["data_uri"]
+    
+    def plan_fields(self):
+        """Media fields of a WeekPlan"""
+        return {
+            "photo_names": {n: name for (kind, n), name in self.media_names.items() if kind == "photo"},
+            "pdf_names": {n: name for (kind, n), name in self.media_names.items() if kind == "pdf"},
+            "photo_srcsets": dict(self.photo_srcsets),
+            "photo_dimensions": dict(self.photo_dimensions),
+            "photo_data_uris": dict(self.photo_data_uris),
+        }
+
+
+def write_site_pages(website_dir, plan):
+    """Write index.html (and styles.css for the two-file layout)
+    
+    For single-file exports a size/time comparison with the two-file layout is returned.
+    """
+    start = time.perf_counter()
+    page = MEAL_PLAN_TEMPLATE.render(plan).encode("utf-8")
+    render_time = time.perf_counter() - start
+    with open(os.path.join(website_dir, "index.html"), "wb") as f:
+        f.write(page)
+    
+    css = site_css().encode("utf-8")
+    if not plan.inline_css:
+        with open(os.path.join(website_dir, "styles.css"), "wb") as f:
+            f.write(css)
+    if not plan.inline_css and not plan.photo_data_uris:
+        return None
+    
+    # Compare with the two-file layout: index.html + styles.css + one request per photo
+    start = time.perf_counter()
+    two_file_page = MEAL_PLAN_TEMPLATE.render(replace(plan, inline_css=None, photo_data_uris={}))
+    two_file_time = time.perf_counter() - start
+    photo_files = {}
+    for dish_num, name in plan.photo_names.items():
+        path = os.path.join(website_dir, "media", "photos", name)
+        slot = plan.slots.get(dish_num)
+        if os.path.exists(path) and plan.show_photos and slot is not None and not slot.empty:
+            photo_files[dish_num] = os.path.getsize(path)
+    two_file_bytes = len(two_file_page.encode("utf-8")) + len(css) + sum(photo_files.values())
+    single_bytes = len(page) + (0 if plan.inline_css else len(css)) + sum(
+        size for dish_num, size in photo_files.items() if dish_num not in plan.photo_data_uris)
+    two_file_requests = 2 + len(photo_files)
+    single_requests = 1 + (0 if plan.inline_css else 1) + len(
+        [dish_num for dish_num in photo_files if dish_num not in plan.photo_data_uris])
+    
+    return (f"Eingebettet: {single_bytes / 1024:.0f} KB in {single_requests} Anfrage(n), "
+            f"erzeugt in {render_time * 1000:.1f} ms\n"
+            f"Zwei Dateien: {two_file_bytes / 1024:.0f} KB in {two_file_requests} Anfragen, "
+            f"erzeugt in {two_file_time * 1000:.1f} ms")
+
+
+# Fonts of the plan image, (size, bold) -> ImageFont
+plan_image_fonts = {}
+
+
+def plan_image_font(size, bold=False):
+    """Arial-like TrueType font in the given pixel size, cached"""
+    key = (size, bold)
+    if key not in plan_image_fonts:
+        font = None
+        for name in PLAN_IMAGE_FONTS[bold]:
+            try:
+                font = ImageFont.truetype(name, size)
+                break
+            except OSError:
+                continue
+        plan_image_fonts[key] = font or ImageFont.load_default(size)
+    return plan_image_fonts[key]
+
+
+def wrap_text(text, font, width):
+    """Split text into lines that fit the width, like the browser does in table cells"""
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split():
+            candidate = f"{line} {word}" if line else word
+            if font.getlength(candidate) <= width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            # Words longer than the cell are broken anywhere
+            while font.getlength(word) > width and len(word) > 1:
+                cut = len(word) - 1
+                while cut > 1 and font.getlength(word[:cut]) > width:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+            line = word
+        lines.append(line)
+    return lines
+
+
+def plan_image_photo_paths(plan, dish_num, website_dir):
+    """Candidate files for a dish photo: the published one, else the source if not built yet"""
+    slot = plan.slots[dish_num]
+    paths = []
+    if website_dir and dish_num in plan.photo_names:
+        paths.append(os.path.join(website_dir, "media", "photos", plan.photo_names[dish_num]))
+    if slot.photo and slot.photo != "/":
+        paths.append(slot.photo)
+    return tuple(paths)
+
+
+def plan_image_photo(paths):
+    """Thumbnail for the plan image from the first readable file, None if there is none"""
+    for path in paths:
+        try:
+            with open_preview(path, (PLAN_IMAGE_PHOTO_WIDTH, PLAN_IMAGE_PHOTO_WIDTH)) as img:
+                img = ImageOps.exif_transpose(img).convert("RGB")
+        except (OSError, ValueError):
+            continue
+        # max-width: 80px; height: auto
+        if img.width > PLAN_IMAGE_PHOTO_WIDTH:
+            img = img.resize((PLAN_IMAGE_PHOTO_WIDTH, max(1, round(img.height * PLAN_IMAGE_PHOTO_WIDTH / img.width))),
+                             Image.Resampling.LANCZOS)
+        return img
+    return None
+
+
+def render_plan_image(plan, website_dir=None, width=PLAN_IMAGE_WIDTH):
+    """Draw the week table of a WeekPlan with Pillow, following the layout of the website stylesheet
+    
+    Photos come from the website folder once it is built, otherwise from the source files.
+    """
+    font = plan_image_font(16)
+    bold = plan_image_font(16, bold=True)
+    line_height = round(font.size * 1.2)
+    padding = 10  # th, td
+    table_x = 20  # main padding
+    table_width = width - 2 * table_x
+    categories = plan.categories
+    total_categories = sum(row_count for _, row_count in categories)
+    
+    # Column widths: the category column fits its names, the days share the rest
+    category_width = max([bold.getlength(name) for name, _ in categories] + [bold.getlength("")]) + 2 * padding
+    day_width = (table_width - category_width) / 7
+    text_width = day_width - 2 * padding
+    column_x = [table_x, table_x + category_width] + [table_x + category_width + day_width * (i + 1) for i in range(7)]
+    
+    # Each photo file is decoded once, in parallel since Pillow releases the GIL while decoding
+    photo_paths = {n: plan_image_photo_paths(plan, n, website_dir) for n, slot in plan.slots.items()
+                   if plan.show_photos and not slot.empty and slot.photo != "/"}
+    unique_paths = list(set(photo_paths.values()))
+    with ThreadPoolExecutor(max_workers=DECODE_WORKERS) as executor:
+        thumbnails = dict(zip(unique_paths, executor.map(plan_image_photo, unique_paths)))
+    photos = {n: thumbnails[paths] for n, paths in photo_paths.items()}
+    
+    # Measure every cell first, rows are as tall as their tallest cell
+    rows = []
+    category_row_counter = 0
+    for category_name, row_count in categories:
+        for row in range(row_count):
+            cells = []
+            for day_idx in range(7):
+                dish_num = (day_idx * total_categories) + category_row_counter + 1
+                slot = plan.slots.get(dish_num)
+                if slot is None or slot.empty:
+                    cells.append(None)
+                    continue
+                lines = wrap_text(slot.name, bold, text_width)
+                photo = photos.get(dish_num)
+                show_pdf = slot.pdf != "/"
+                height = len(lines) * line_height + 8  # .dish-name margin-bottom
+                if photo is not None:
+                    height += photo.height + 20  # td img margin
+                if show_pdf:
+                    height += line_height + 5  # a margin-top
+                cells.append((lines, photo, show_pdf, height))
+            content = max([cell[3] for cell in cells if cell] + [line_height])
+            if plan.empty_cell_display == "-" and None in cells:
+                content = max(content, round(24 * 1.2))
+            rows.append((category_name if row == 0 else "", cells, content + 2 * padding))
+            category_row_counter += 1
+    
+    header_height = 15 + round(24 * 1.2) + 15
+    head_row_height = line_height + 2 * padding
+    table_y = header_height + 20 + 20  # main padding, table margin
+    table_height = head_row_height + sum(row_height for _, _, row_height in rows)
+    height = table_y + table_height + 20
+    sources_height = 0
+    if plan.show_sources_box:
+        sources_height = 2 + 20 + round(20 * 1.2) + 19 + 2 * (line_height + 10) + 20 + 2
+        height += 20 + sources_height
+    height += 20  # main padding
+    
+    img = Image.new("RGB", (width, height), "#f0f0f5")
+    draw = ImageDraw.Draw(img)
+    
+    def centered(text, text_font, left, right, y, fill, underline=False):
+        x = left + (right - left - text_font.getlength(text)) / 2
+        draw.text((x, y), text, font=text_font, fill=fill)
+        if underline and text:
+            draw.line((x, y + text_font.size + 1, x + text_font.getlength(text), y + text_font.size + 1), fill=fill)
+    
+    # Header
+    draw.rectangle((0, 0, width, header_height), fill="#444")
+    title_font = plan_image_font(24, bold=True)
+    centered(f"Woche: {plan.week_start} - {plan.week_end}", title_font, 0, width, 15 + 2, "#fff")
+    
+    # Day header row
+    draw.rectangle((table_x, table_y, table_x + table_width, table_y + table_height), fill="#fff")
+    y = table_y
+    for column in range(8):
+        left, right = column_x[column], column_x[column + 1]
+        draw.rectangle((left, y, right, y + head_row_height), fill="#f8f8f8", outline="#ddd")
+        if column:
+            centered(WEEK_DAYS[column - 1], bold, left, right, y + padding, "#333")
+    y += head_row_height
+    
+    # Category rows, content is centered vertically like in the table
+    empty_font = plan_image_font(24, bold=True)
+    for category_name, cells, row_height in rows:
+        draw.rectangle((column_x[0], y, column_x[1], y + row_height), fill="#f8f8f8", outline="#ddd")
+        centered(category_name, bold, column_x[0], column_x[1], y + (row_height - line_height) / 2, "#333")
+        for day_idx, cell in enumerate(cells):
+            left, right = column_x[day_idx + 1], column_x[day_idx + 2]
+            if cell is None:
+                draw.rectangle((left, y, right, y + row_height), fill="#f9f9f9", outline="#ddd")
+                if plan.empty_cell_display == "-":
+                    centered("-", empty_font, left, right, y + (row_height - empty_font.size * 1.2) / 2, "#ccc")
+                continue
+            draw.rectangle((left, y, right, y + row_height), fill="#fff", outline="#ddd")
+            lines, photo, show_pdf, content_height = cell
+            cell_y = y + (row_height - content_height) / 2
+            for line in lines:
+                centered(line, bold, left, right, cell_y, "#555", underline=True)
+                cell_y += line_height
+            cell_y += 8
+            if photo is not None:
+                img.paste(photo, (round(left + (right - left - photo.width) / 2), round(cell_y + 10)))
+                cell_y += photo.height + 20
+            if show_pdf:
+                centered("Rezept PDF", font, left, right, cell_y + 5, "#007bff")
+        y += row_height
+    
+    # Sources box
+    if plan.show_sources_box:
+        box_y = y + 20 + 20
+        draw.rounded_rectangle((table_x, box_y, table_x + table_width, box_y + sources_height), radius=8,
+                               fill="#fff", outline="#007bff", width=2)
+        text_y = box_y + 2 + 20
+        draw.text((table_x + 22, text_y), "Download Links:", font=plan_image_font(20, bold=True), fill="#007bff")
+        text_y += round(20 * 1.2) + 19
+        for name in plan.source_names:
+            draw.text((table_x + 22, text_y), name, font=font, fill="#007bff")
+            text_y += line_height + 10
+    return img
+
+
+def save_plan_image(img, path):
+    """Save a plan image in the format of the file name"""
+    if path.lower().endswith((".jpg", ".jpeg")):
+        img.convert("RGB").save(path, "JPEG", quality=90, optimize=True)
+    else:
+        img.save(path)
+
+
+def image_png_bytes(img):
+    """Encode an image as PNG for the clipboard"""
+    output = io.BytesIO()
+    img.save(output, "PNG")
+    return output.getvalue()
+
+
+def copy_image_to_clipboard(img):
+    """Put an image on the system clipboard
+    
+    Windows uses win32clipboard, macOS osascript and Linux wl-copy or xclip.
+    """
+    if platform.system() == "Windows":
+        output = io.BytesIO()
+        img.convert("RGB").save(output, "BMP")
+        data = output.getvalue()[14:]
+        output.close()
+        
+        import win32clipboard
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32clipboard.CF_DIB, data)
+        finally:
+            win32clipboard.CloseClipboard()
+        return
+    
+    png = image_png_bytes(img)
+    if platform.system() == "Darwin":
+        temp_path = os.path.join(tempfile.gettempdir(), f"essensplan-{uuid.uuid4().hex}.png")
+        with open(temp_path, "wb") as f:
+            f.write(png)
+        try:
+            subprocess.run(["osascript", "-e", f'set the clipboard to (read (POSIX file "{temp_path}") as «class PNGf»)'],
+                           check=True, capture_output=True)
+        finally:
+            os.remove(temp_path)
+        return
+    
+    for command in (["wl-copy", "--type", "image/png"], ["xclip", "-selection", "clipboard", "-t", "image/png", "-i"]):
+        if shutil.which(command[0]):
+            subprocess.run(command, input=png, check=True)
+            return
+    raise Exception("Kein Zwischenablage-Programm gefunden (wl-copy oder xclip installieren)")
+
+
+def save_screenshot(png, path):
+    """Write PNG screenshot data, converted if the file name asks for another format"""
+    if path.lower().endswith(".png"):
+        with open(path, "wb") as f:
+            f.write(png)
+        return
+    with Image.open(io.BytesIO(png)) as img:
+        img.convert("RGB").save(path)
+
+
+def screenshot_sites(website_dirs, session=None):
+    """Full-page screenshots next to each website folder, one browser for all; returns the errors"""
+    session = session or ScreenshotSession()
+    errors = []
+    try:
+        for website_dir in website_dirs:
+            image_path = website_dir + SCREENSHOT_SUFFIX
+            try:
+                save_screenshot(session.capture(os.path.join(website_dir, "index.html"), full_page=True), image_path)
+                print(f"Screenshot: {image_path}")
+            except ImportError:
+                errors.append("Selenium ist nicht installiert (pip install selenium webdriver-manager)")
+                break
+            except Exception as e:
+                errors.append(f"Screenshot von {website_dir}: {e}")
+    finally:
+        session.close()
+    return errors
+
+
+def default_meals_data_path():
+    """meals_data folder next to the script"""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "meals_data")
+
+
+def parse_week_categories(categories):
+    """Categories of a plan file as [(name, rows)], accepts {"name": rows} or [[name, rows]]"""
+    items = categories.items() if isinstance(categories, dict) else categories
+    result = []
+    for name, rows in items:
+        if rows in ("/", None, 0):
+            continue  # Same as "/" in the GUI: category not shown
+        result.append((str(name), int(rows)))
+    if not result:
+        raise ValueError("Keine Kategorien angegeben")
+    return result
+
+
+def build_week_site(week, meals_library, output_root="."):
+    """Build the website of one week from a plan file entry without any Tk state
+    
+    week["dishes"] maps dish numbers (column-wise like in the GUI: Monday's categories first)
+    to a meal_id from the library, or to {"name", "photo", "pdf"}. Missing dishes stay empty.
+    Returns (website folder, list of error messages).
+    """
+    categories = parse_week_categories(week.get("categories", {"Mittag-/Abendessen": 1}))
+    week_start, week_end = week["week_start"], week["week_end"]
+    website_dir = os.path.join(output_root, week.get("output") or f"Essensplan {week_start} - {week_end}")
+    os.makedirs(os.path.join(website_dir, "media", "photos"), exist_ok=True)
+    os.makedirs(os.path.join(website_dir, "media", "pdfs"), exist_ok=True)
+    
+    photo_options = None
+    if week.get("optimize_photos", True):
+        max_dimension = int(week.get("photo_max_dimension", PHOTO_MAX_DIMENSION))
+        photo_options = {"max_dimension": max_dimension, "format": week.get("photo_format", "jpeg"),
+                         "widths": [width for width in PHOTO_SRCSET_WIDTHS if width < max_dimension]}
+    show_photos = week.get("show_photos", True)
+    media = SiteMedia(website_dir, move=False, dedupe=week.get("dedupe", True), photo_options=photo_options,
+                      embed_photos=week.get("embed_thumbnails", False) and show_photos)
+    
+    sources = week.get("sources") or {}
+    plan = WeekPlan.for_week(
+        week_start, week_end, categories,
+        empty_cell_display=week.get("empty_cell_display", "-"),
+        show_photos=show_photos,
+        show_sources_box=bool(sources),
+        source_names=tuple(week.get("source_names", DEFAULT_SOURCE_NAMES)),
+        source_files=sources,
+        inline_css=minify_css(site_css()) if week.get("inline_css") else None,
+    )
+    
+    errors = []
+    dishes = {int(n): dish for n, dish in week.get("dishes", {}).items()}
+    for dish_num, slot in plan.slots.items():
+        dish = dishes.get(dish_num)
+        if isinstance(dish, str):
+            dish = {"meal_id": dish}
+        if dish and dish.get("meal_id"):
+            meal = meals_library.get(dish["meal_id"])
+            if meal is None:
+                errors.append(f"Gericht {dish_num}: unbekannte meal_id {dish['meal_id']}")
+                dish = None
+            else:
+                dish = dict({"name": meal.get("name"), "photo": meal.get("image_path"), "pdf": meal.get("pdf_path")},
+                            **{key: value for key, value in dish.items() if key != "meal_id"})
+        if not dish:
+            slot.empty = True
+            continue
+        slot.name = dish.get("name") or slot.name
+        slot.pdf = dish.get("pdf") or "/"
+        slot.photo = dish.get("photo") or "/"
+    media.add_plan(plan)
+    
+    batch = FileCopyBatch(None, media.jobs, None, None, manifest=media.manifest)
+    staging_errors = batch.run_all()
+    errors.extend(f"{job['label']}: {error}" for job, error in staging_errors)
+    media.finish(staging_errors)
+    
+    plan = replace(plan, **media.plan_fields())
+    write_site_pages(website_dir, plan)
+    if week.get("image"):
+        save_plan_image(render_plan_image(plan, website_dir), website_dir + PLAN_IMAGE_SUFFIX)
+    precompressed_paths = [os.path.join(website_dir, name) for name in PRECOMPRESSED_FILES]
+    if week.get("precompress"):
+        precompress_files(precompressed_paths, media.manifest)
+    else:
+        remove_precompressed(media.manifest, precompressed_paths)
+    media.manifest.save()
+    return website_dir, errors
+
+
+# Meal library of a batch worker process, handed over once per process
+batch_meals_library = None
+
+
+def set_batch_library(meals_library):
+    """Process pool initializer: keep the meal library for all weeks built by this worker"""
+    global batch_meals_library
+    batch_meals_library = meals_library
+
+
+def build_batch_week(week, output_root):
+    """Worker side of build_plan_file, errors are returned instead of raised"""
+    try:
+        return build_week_site(week, batch_meals_library, output_root)
+    except Exception as e:
+        return None, [f"{week.get('week_start')} - {week.get('week_end')}: {e}"]
+
+
+def build_plan_file(plan_path, workers=None, screenshots=False, images=False):
+    """Build all weeks of a JSON plan file on a process pool, returns the number of errors
+    
+    With screenshots (browser, "<folder>.png") or images (drawn with Pillow, "<folder> Bild.png"),
+    a PNG of every week is saved next to its website folder.
+    
+    The file contains "weeks" (or a single week) plus optional "meals_data", "output_root"
+    and "defaults" that apply to every week. Relative paths are relative to the plan file.
+    """
+    with open(plan_path, "r", encoding="utf-8") as f:
+        plan_file = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(plan_path))
+    meals_data_path = os.path.join(base_dir, plan_file.get("meals_data") or default_meals_data_path())
+    output_root = os.path.join(base_dir, plan_file.get("output_root", "."))
+    defaults = plan_file.get("defaults", {})
+    if images:
+        defaults = dict(defaults, image=True)
+    weeks = [dict(defaults, **week) for week in plan_file.get("weeks", [plan_file])]
+    if not weeks:
+        print(f"Fehler: {plan_path} enthält keine Wochen")
+        return 1
+    for week in weeks:
+        week["dishes"] = {n: dict(dish, **{key: os.path.join(base_dir, dish[key]) for key in ("photo", "pdf")
+                                           if dish.get(key)}) if isinstance(dish, dict) else dish
+                          for n, dish in week.get("dishes", {}).items()}
+        week["sources"] = {key: os.path.join(base_dir, source) for key, source in (week.get("sources") or {}).items()
+                           if source}
+    
+    # Read once up front, so every worker builds against the same library and a broken one is reported
+    try:
+        meals_library = read_meal_library(meals_data_path)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Fehler: Die Gerichte-Datenbank konnte nicht gelesen werden: {e}")
+        return 1
+    
+    error_count = 0
+    built = []
+    start = time.perf_counter()
+    with start_process_pool(workers or min(len(weeks), os.cpu_count() or 1),
+                            initializer=set_batch_library, initargs=(meals_library,)) as executor:
+        results = executor.map(build_batch_week, weeks, [output_root] * len(weeks))
+        for week, (website_dir, errors) in zip(weeks, results):
+            print(f"{week.get('week_start')} - {week.get('week_end')}: {website_dir or 'fehlgeschlagen'}")
+            for error in errors:
+                print(f"  Fehler: {error}")
+            error_count += len(errors)
+            if website_dir:
+                built.append(website_dir)
+    if screenshots:
+        for error in screenshot_sites(built):
+            print(f"  Fehler: {error}")
+            error_count += 1
+    print(f"{len(weeks)} Woche(n) in {time.perf_counter() - start:.1f} s erstellt, {error_count} Fehler")
+    return error_count
+
+
+
+class MealPlanGenerator:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Essensplan Generator")
+        self.root.geometry("900x800")  # Made window taller
+        
+        # Variables
+        self.website_path = tk.StringVar()
+        self.week_start = tk.StringVar()
+        self.week_end = tk.StringVar()
+        self.breakfast_rows = tk.StringVar(value="1")
+        self.lunch_rows = tk.StringVar(value="1")
+        self.snacks_rows = tk.StringVar(value="1")
+        self.dessert_rows = tk.StringVar(value="/")
+        
+        # New settings variables
+        self.empty_cell_display = tk.StringVar(value="-")  # "-" or "nothing"
+        self.show_photos = tk.BooleanVar(value=True)
+        self.show_sources_box = tk.BooleanVar(value=True)  # Changed to True by default
+        self.source_pdf1_name = tk.StringVar(value=DEFAULT_SOURCE_NAMES[0])
+        self.source_pdf2_name = tk.StringVar(value=DEFAULT_SOURCE_NAMES[1])
+        self.file_operation = tk.StringVar(value="copy")  # "copy" or "cut"
+        self.rename_subfolder = tk.BooleanVar(value=False)
+        self.dedupe_media = tk.BooleanVar(value=True)  # Store identical PDFs/photos only once
+        self.optimize_photos = tk.BooleanVar(value=True)  # Resize and re-encode published photos
+        self.photo_max_dimension = tk.StringVar(value=str(PHOTO_MAX_DIMENSION))
+        self.photo_format = tk.StringVar(value="jpeg")  # "jpeg" or "webp"
+        self.inline_assets = tk.BooleanVar(value=False)  # Minified CSS inside index.html instead of styles.css
+        self.embed_thumbnails = tk.BooleanVar(value=False)  # Photos as data URIs, for a single-request page
+        self.precompress_assets = tk.BooleanVar(value=False)  # .gz/.br sidecars of index.html and styles.css
+        
+        # Will store dish assignments
+        self.dish_assignments = {}
+        self.week_plan = None  # WeekPlan edited on page 2, the Tk variables write into its slots
+        self.site_media = None  # SiteMedia of the last export, provides the final media file names
+        self.built_plan = None  # Copy of the WeekPlan the last export wrote, later form edits don't change it
+        self.total_dishes = 0
+        self.source_files = {"pdf1": tk.StringVar(), "pdf2": tk.StringVar()}
+        
+        # Meal library variables
+        self.meals_library = {}
+        self.meals_data_path = ""
+        self.meal_file_operation = tk.StringVar(value="copy")  # "copy" or "cut" for meal library files
+        self.current_selected_meal_id = None  # Track if current meal is from database
+        
+        # Thumbnails and clipboard images are processed off the Tk thread
+        self.image_decoder = ImageDecodeService(self.root)
+        self.screenshot_session = ScreenshotSession()  # Chrome starts with the first screenshot
+        self.screenshot_full_page = tk.BooleanVar(value=True)  # Size screenshots to the table
+        self.screenshot_native = tk.BooleanVar(value=True)  # Draw the plan with Pillow instead of a browser
+        
+        # Initialize week dates
+        self.set_current_week()
+        
+        # Initialize meal library and create pages
+        self.init_meal_library()
+        self.setup_meal_library_page()
+    
+    def set_current_week(self):
+        """Set current week Monday to Sunday"""
+        today = datetime.now()
+        monday = today - timedelta(days=today.weekday())
+        sunday = monday + timedelta(days=6)
+        self.week_start.set(monday.strftime("%d.%m.%y"))
+        self.week_end.set(sunday.strftime("%d.%m.%y"))
+    
+    def previous_week(self):
+        """Set previous week"""
+        try:
+            current_start = datetime.strptime(self.week_start.get(), "%d.%m.%y")
+            new_start = current_start - timedelta(days=7)
+            new_end = new_start + timedelta(days=6)
+            self.week_start.set(new_start.strftime("%d.%m.%y"))
+            self.week_end.set(new_end.strftime("%d.%m.%y"))
+        except ValueError:
+            self.set_current_week()
+    
+    def next_week(self):
+        """Set next week"""
+        try:
+            current_start = datetime.strptime(self.week_start.get(), "%d.%m.%y")
+            new_start = current_start + timedelta(days=7)
+            new_end = new_start + timedelta(days=6)
+            self.week_start.set(new_start.strftime("%d.%m.%y"))
+            self.week_end.set(new_end.strftime("%d.%m.%y"))
+        except ValueError:
+            self.set_current_week()
+    
+    def init_meal_library(self):
+        """Initialize meal library and create data directory"""
+        # Create meals data directory next to script
+        self.meals_data_path = default_meals_data_path()
+        
+        if not os.path.exists(self.meals_data_path):
+            os.makedirs(self.meals_data_path)
+        
+        # Thumbnails for the library grid are cached inside meals_data
+        self.thumbnail_cache = ThumbnailCache(os.path.join(self.meals_data_path, "thumbnails"))
+        
+        # Load existing meals (also loads the search index)
+        self.load_meals_library(lazy=LAZY_LIBRARY_LOAD)
+    
+    def load_meals_library(self, lazy=False):
+        """Load meals from library, in lazy mode only the first screen and the rest in the background"""
+        if getattr(self, 'meal_store', None) is not None:
+            self.close_meal_library()
+        self.meal_store = open_meal_store(self.meals_data_path)
+        index_file = os.path.join(self.meals_data_path, SEARCH_INDEX_FILE)
+        self.meals_library_loading = False
+        
+        head = self.meal_store.load_head(LAZY_HEAD_SIZE) if lazy else None
+        if head is None:
+            self.meals_library = self.meal_store.load()
+            self.show_library_load_error(self.meal_store.load_error)
+            self.search_index = MealSearchIndex(index_file)
+            self.search_index.load_or_build(self.meals_library)
+            return
+        
+        # Show the first meals right away, the small index covers them until the full one is ready
+        self.meals_library = head
+        self.search_index = MealSearchIndex(index_file)
+        self.search_index.build(head)
+        
+        self.meals_library_loading = True
+        self.library_changes_during_load = set()  # Meals saved or deleted locally while loading
+        self.library_load_queue = queue.Queue()
+        self.library_load_stop = threading.Event()
+        load_thread = threading.Thread(target=self.load_library_in_background,
+                                       args=(self.meal_store, index_file, self.thumbnail_cache,
+                                             self.library_load_queue, self.library_load_stop),
+                                       daemon=True)
+        load_thread.start()
+        self.root.after(LAZY_POLL_MS, lambda: self.poll_library_load(load_thread))
+    
+    def load_library_in_background(self, store, index_file, thumbnail_cache, results, stop):
+        """Read the full library and search index off the Tk thread, then prepare thumbnails"""
+        try:
+            meals_library = store.load()
+            search_index = MealSearchIndex(index_file)
+            search_index.load_or_build(meals_library)
+            results.put(("index", search_index, store.load_error))
+            
+            items = list(meals_library.items())
+            for start in range(0, len(items), LAZY_BATCH_SIZE):
+                results.put(("meals", items[start:start + LAZY_BATCH_SIZE]))
+            results.put(("done", list(meals_library)))
+            store.write_head(meals_library)
+        except Exception as e:
+            results.put(("error", e))
+            return
+        
+        # Generate missing thumbnails in display order, so they are ready when scrolled into view
+        for count, (meal_id, meal_data) in enumerate(items, 1):
+            if stop.is_set():
+                return
+            image_path = meal_data.get('image_path')
+            if image_path and os.path.exists(image_path):
+                try:
+                    thumbnail_cache.ensure_cached(image_path)
+                except Exception:
+                    pass  # Shown as "Bild nicht verfügbar" when the card is drawn
+            if count % (MEAL_GRID_COLUMNS * 4) == 0:
+                results.put(("thumbnails",))
+        results.put(("thumbnails",))
+    
+    def poll_library_load(self, load_thread):
+        """Merge meals streamed in by the background loader into the UI"""
+        refresh = None
+        try:
+            while True:
+                refresh = self.handle_library_load_message(self.library_load_queue.get_nowait()) or refresh
+        except queue.Empty:
+            pass
+        
+        if refresh == "meals":
+            self.refresh_meals_display()
+        elif refresh == "thumbnails" and hasattr(self, 'meals_canvas') and self.meals_canvas.winfo_exists():
+            self.refresh_visible_meal_cards()
+        # Keep polling until the loader (including thumbnail preparation) is finished
+        if load_thread.is_alive() or not self.library_load_queue.empty():
+            self.root.after(LAZY_POLL_MS, lambda: self.poll_library_load(load_thread))
+    
+    def handle_library_load_message(self, message):
+        """Apply one message from the background loader, returns what needs refreshing"""
+        kind = message[0]
+        if kind == "index":
+            _, search_index, load_error = message
+            # Meals changed locally while loading take precedence over the loaded index
+            for meal_id in self.library_changes_during_load:
+                if meal_id in self.meals_library:
+                    search_index.update(meal_id, self.meals_library[meal_id])
+                else:
+                    search_index.remove(meal_id)
+            self.search_index = search_index
+            self.show_library_load_error(load_error)
+            return "meals"
+        if kind == "meals":
+            for meal_id, meal_data in message[1]:
+                if meal_id not in self.library_changes_during_load:
+                    self.meals_library[meal_id] = meal_data
+            return "meals"
+        if kind == "done":
+            # Restore creation order, meals added while loading go last. Other meals only came from
+            # the head file and were deleted since (e.g. by a journal record), so they are dropped
+            ordered = {meal_id: self.meals_library[meal_id] for meal_id in message[1] if meal_id in self.meals_library}
+            for meal_id, meal_data in self.meals_library.items():
+                if meal_id in self.library_changes_during_load:
+                    ordered.setdefault(meal_id, meal_data)
+            self.meals_library.clear()
+            self.meals_library.update(ordered)
+            self.meals_library_loading = False
+            # Saves during the load only journaled, the whole library can be compacted now
+            try:
+                self.meal_store.compact_due(self.meals_library)
+            except OSError as e:
+                print(f"Warning: Could not compact meal library journal: {e}")
+            return "meals"
+        if kind == "error":
+            self.meals_library_loading = False
+            self.library_load_stop.set()
+            messagebox.showerror("Fehler", f"Fehler beim Laden der Gerichte: {str(message[1])}")
+            return "meals"
+        return "thumbnails"
+    
+    def wait_for_library(self):
+        """Block until the lazy loader delivered the whole library (needed before full saves)"""
+        while self.meals_library_loading:
+            self.handle_library_load_message(self.library_load_queue.get())
+    
+    def refresh_meals_display(self):
+        """Redraw the library grid if the library page is shown"""
+        if hasattr(self, 'meals_canvas') and self.meals_canvas.winfo_exists():
+            self.update_meals_display()
+    
+    def show_library_load_error(self, load_error):
+        """Warn about a library file that couldn't be read"""
+        if load_error:
+            messagebox.showwarning("Warnung", f"Die Gerichte-Datenbank konnte nicht gelesen werden:\n{load_error}")
+    
+    def save_meals_library(self, meal_id=None):
+        """Save meals to library, only the given meal if the backend supports single-row writes"""
+        try:
+            if meal_id is not None:
+                if self.meals_library_loading:
+                    self.library_changes_during_load.add(meal_id)
+                # The search index is persisted on exit, keeping single saves cheap
+                self.meal_store.save_meal(self.meals_library, meal_id, complete=not self.meals_library_loading)
+            else:
+                self.wait_for_library()
+                self.meal_store.save_all(self.meals_library)
+                self.search_index.save(self.meals_library)
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Fehler beim Speichern der Gerichte: {str(e)}")
+    
+    def close_meal_library(self):
+        """Persist pending search index changes and close the storage backend"""
+        self.wait_for_library()
+        if hasattr(self, 'library_load_stop'):
+            self.library_load_stop.set()
+        if self.search_index.dirty:
+            self.search_index.save(self.meals_library)
+        self.meal_store.close()
+    
+    def update_meal_file_paths(self, old_meals_path, new_meals_path):
+        """Update file paths in meals library when meals_data directory changes"""
+        if not self.meals_library:
+            return
+            
+        updated_count = 0
+        
+        for meal_id, meal_data in self.meals_library.items():
+            meal_updated = False
+            
+            # Update image path
+            if meal_data.get('image_path'):
+                old_image_path = meal_data['image_path']
+                # Find "meals_data" in the path and replace everything before it
+                if "meals_data" in old_image_path:
+                    # Find the position of "meals_data"
+                    meals_data_index = old_image_path.find("meals_data")
+                    # Get everything from "meals_data" onwards
+                    path_from_meals_data = old_image_path[meals_data_index:]
+                    # Create new path by combining new base path with path from meals_data
+                    new_base_path = os.path.dirname(new_meals_path)  # Get parent directory of meals_data
+                    new_image_path = os.path.join(new_base_path, path_from_meals_data)
+                    meal_data['image_path'] = new_image_path
+                    meal_updated = True
+            
+            # Update PDF path
+            if meal_data.get('pdf_path'):
+                old_pdf_path = meal_data['pdf_path']
+                # Find "meals_data" in the path and replace everything before it
+                if "meals_data" in old_pdf_path:
+                    # Find the position of "meals_data"
+                    meals_data_index = old_pdf_path.find("meals_data")
+                    # Get everything from "meals_data" onwards
+                    path_from_meals_data = old_pdf_path[meals_data_index:]
+                    # Create new path by combining new base path with path from meals_data
+                    new_base_path = os.path.dirname(new_meals_path)  # Get parent directory of meals_data
+                    new_pdf_path = os.path.join(new_base_path, path_from_meals_data)
+                    meal_data['pdf_path'] = new_pdf_path
+                    meal_updated = True
+            
+            if meal_updated:
+                updated_count += 1
+        
+        # Save updated library to new location
+        if updated_count > 0:
+            try:
+                new_store = open_meal_store(new_meals_path)
+                try:
+                    new_store.save_all(self.meals_library)
+                finally:
+                    new_store.close()
+                messagebox.showinfo("Pfade aktualisiert", 
+                                  f"Dateipfade von {updated_count} Gericht(en) wurden an den neuen Speicherort angepasst.")
+            except Exception as e:
+                messagebox.showerror("Fehler", f"Fehler beim Aktualisieren der Dateipfade: {str(e)}")
+    
+    def setup_meal_library_page(self):
+        """New start page for meal library management"""
+        # Clear window
+        for widget in self.root.winfo_children():
+            widget.destroy()
+            
+        main_frame = ttk.Frame(self.root, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configure grid weights
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(3, weight=1)
+        
+        # Title
+        title_label = ttk.Label(main_frame, text="Gerichte Bibliothek", 
+                               font=("Arial", 16, "bold"))
+        title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20))
+        
+        # Search and sort controls
+        control_frame = ttk.Frame(main_frame)
+        control_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
+        control_frame.columnconfigure(1, weight=1)
+        
+        # Search
+        ttk.Label(control_frame, text="Suchen:").grid(row=0, column=0, padx=(0, 5), sticky=tk.W)
+        self.search_var = tk.StringVar()
+        self.meal_search = IncrementalSearch(self.root, self.meal_search_candidates,
+                                             lambda search_term, meal_id, meal_data: self.search_index.matches(search_term, meal_id),
+                                             self.on_meal_search_results, min_refine_length=TRIGRAM_LENGTH)
+        self.search_var.trace('w', lambda *args: self.meal_search.schedule(self.get_search_term()))
+        search_entry = ttk.Entry(control_frame, textvariable=self.search_var, width=30)
+        search_entry.grid(row=0, column=1, padx=(0, 10), sticky=(tk.W, tk.E))
+        
+        # Sort options
+        ttk.Label(control_frame, text="Sortieren:").grid(row=0, column=2, padx=(0, 5), sticky=tk.W)
+        self.sort_var = tk.StringVar(value="erstellungsdatum")
+        sort_combo = ttk.Combobox(control_frame, textvariable=self.sort_var, 
+                                 values=["erstellungsdatum", "alphabet", "zuletzt_verwendet"], 
+                                 state="readonly", width=15)
+        sort_combo.grid(row=0, column=3, sticky=tk.W)
+        sort_combo.bind('<<ComboboxSelected>>', lambda *args: self.show_meal_results(self.meal_search.last_results or []))
+        
+        # Meals data folder location
+        ttk.Label(main_frame, text="Speicherort der Gerichte-Datenbank:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        meals_data_var = tk.StringVar(value=self.meals_data_path)
+        meals_data_entry = ttk.Entry(main_frame, textvariable=meals_data_var, width=50)
+        meals_data_entry.grid(row=2, column=1, padx=5, sticky=(tk.W, tk.E))
+        ttk.Button(main_frame, text="Durchsuchen", 
+                  command=lambda: self.browse_meals_data_directory(meals_data_var)).grid(row=2, column=2, padx=5)
+        
+        # Create virtualized card grid for meals with mouse wheel support
+        canvas = tk.Canvas(main_frame, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
+        
+        # Store references for updating display
+        self.meals_canvas = canvas
+        self.meal_card_pool = []  # Recycled card widgets not currently shown
+        self.visible_meal_cards = {}  # Index in displayed_meals -> card
+        self.displayed_meals = []
+        
+        # Bind mouse wheel scrolling
+        def on_mousewheel(event):
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        
+        def bind_to_mousewheel(event):
+            canvas.bind_all("<MouseWheel>", on_mousewheel)
+        
+        def unbind_from_mousewheel(event):
+            canvas.unbind_all("<MouseWheel>")
+        
+        self.meals_bind_to_mousewheel = bind_to_mousewheel
+        
+        # Bind mouse wheel events
+        canvas.bind("<Enter>", bind_to_mousewheel)
+        canvas.bind("<Leave>", unbind_from_mousewheel)
+        
+        # Render newly visible rows whenever the view moves or the canvas is resized
+        def on_canvas_scroll(first, last):
+            scrollbar.set(first, last)
+            self.render_visible_meal_cards()
+        
+        canvas.configure(yscrollcommand=on_canvas_scroll, yscrollincrement=20)
+        canvas.bind("<Configure>", lambda e: self.layout_meal_grid())
+        
+        canvas.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0))
+        scrollbar.grid(row=3, column=2, sticky=(tk.N, tk.S), pady=(10, 0))
+        
+        # Display meals
+        self.update_meals_display()
+        
+        # Add meal button
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=4, column=0, columnspan=3, pady=20)
+        
+        ttk.Button(button_frame, text="+ Neues Gericht hinzufügen",
+                  command=self.add_new_meal).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(button_frame, text="Weiter zum Essensplan", 
+                  command=self.setup_page1).pack(side=tk.RIGHT, padx=5)
+    
+    def browse_meals_data_directory(self, path_var):
+        """Browse for meals data directory"""
+        directory = filedialog.askdirectory(title="Gerichte-Datenbank Ordner auswählen", 
+                                          initialdir=self.meals_data_path)
+        if directory:
+            old_meals_data_path = self.meals_data_path
+            self.meals_data_path = directory
+            path_var.set(directory)
+            
+            # Update file paths in existing meals library before reloading
+            self.wait_for_library()
+            self.update_meal_file_paths(old_meals_data_path, directory)
+            
+            self.thumbnail_cache = ThumbnailCache(os.path.join(directory, "thumbnails"))
+            self.load_meals_library()  # Reload meals from new location
+            self.setup_meal_library_page()  # Refresh display
+    
+    def update_meals_display(self):
+        """Update the display of meals based on search and sort criteria"""
+        # Library content changed, so previous search results can't be refined
+        self.meal_search.invalidate()
+        self.meal_search.run(self.get_search_term())
+    
+    def get_search_term(self):
+        """Normalized (umlaut-folded) search term of the library page"""
+        return fold_search_text(self.search_var.get().strip())
+    
+    def meal_search_candidates(self, search_term):
+        """Meals that may match the search term, looked up in the search index"""
+        return [(meal_id, self.meals_library[meal_id])
+                for meal_id in self.search_index.candidates(search_term)
+                if meal_id in self.meals_library]
+    
+    def on_meal_search_results(self, search_term, results):
+        """Show finished search results, scrolling to the top for a new query"""
+        if search_term != getattr(self, 'displayed_search_term', None):
+            self.meals_canvas.yview_moveto(0)
+            self.displayed_search_term = search_term
+        self.show_meal_results(results)
+    
+    def show_meal_results(self, filtered_meals):
+        """Sort filtered meals and show them in the grid"""
+        canvas = self.meals_canvas
+        canvas.delete("meals_message")
+        
+        # Return all cards to the pool, their meal data may have changed
+        for index in list(self.visible_meal_cards):
+            self.release_meal_card(index)
+        
+        if not self.meals_library:
+            self.displayed_meals = []
+            self.show_meals_message("Noch keine Gerichte vorhanden. Füge dein erstes Gericht hinzu!")
+            return
+        
+        # Sort meals
+        sort_option = self.sort_var.get()
+        if sort_option == "alphabet":
+            # Sort by name alphabetically
+            sorted_meals = sorted(filtered_meals, key=lambda x: x[1]['name'].lower())
+        elif sort_option == "zuletzt_verwendet":
+            # Sort by last used (if available, otherwise by creation order)
+            sorted_meals = sorted(filtered_meals, 
+                                key=lambda x: x[1].get('last_used', ''), reverse=True)
+        else:  # erstellungsdatum (default)
+            # Keep original order from JSON (creation order)
+            sorted_meals = list(filtered_meals)
+        
+        self.displayed_meals = sorted_meals
+        
+        if not sorted_meals:
+            self.show_meals_message("Keine Gerichte gefunden.")
+            return
+        
+        self.layout_meal_grid()
+    
+    def show_meals_message(self, text):
+        """Show an info text in place of the meal grid"""
+        canvas = self.meals_canvas
+        canvas.configure(scrollregion=(0, 0, 0, 0))
+        canvas.yview_moveto(0)
+        canvas.create_text(max(canvas.winfo_width(), 1) // 2, 50, text=text, font=("Arial", 12),
+                           fill="gray", tags="meals_message")
+    
+    def layout_meal_grid(self):
+        """Update scroll region and card positions after data or size changes"""
+        canvas = self.meals_canvas
+        if not self.displayed_meals:
+            canvas.coords("meals_message", max(canvas.winfo_width(), 1) // 2, 50)
+            return
+        
+        total_rows = (len(self.displayed_meals) + MEAL_GRID_COLUMNS - 1) // MEAL_GRID_COLUMNS
+        canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), total_rows * MEAL_CARD_HEIGHT))
+        
+        # Column width depends on the canvas width, so reposition shown cards
+        for index, card in self.visible_meal_cards.items():
+            self.place_meal_card(card, index)
+        self.render_visible_meal_cards()
+    
+    def render_visible_meal_cards(self):
+        """Show cards only for rows inside the visible area (plus overscan)"""
+        canvas = self.meals_canvas
+        if not self.displayed_meals:
+            return
+        
+        top = canvas.canvasy(0)
+        first_row = max(0, int(top // MEAL_CARD_HEIGHT) - MEAL_GRID_OVERSCAN_ROWS)
+        last_row = int((top + canvas.winfo_height()) // MEAL_CARD_HEIGHT) + MEAL_GRID_OVERSCAN_ROWS
+        first_index = first_row * MEAL_GRID_COLUMNS
+        last_index = min(len(self.displayed_meals), (last_row + 1) * MEAL_GRID_COLUMNS)
+        
+        # Recycle cards that scrolled out of view
+        for index in list(self.visible_meal_cards):
+            if index < first_index or index >= last_index:
+                self.release_meal_card(index)
+        
+        for index in range(first_index, last_index):
+            if index not in self.visible_meal_cards:
+                card = self.meal_card_pool.pop() if self.meal_card_pool else self.create_meal_card()
+                meal_id, meal_data = self.displayed_meals[index]
+                self.fill_meal_card(card, meal_id, meal_data)
+                self.place_meal_card(card, index)
+                self.visible_meal_cards[index] = card
+    
+    def refresh_visible_meal_cards(self):
+        """Redraw cards currently shown, e.g. after thumbnails became available"""
+        for index in list(self.visible_meal_cards):
+            self.release_meal_card(index)
+        self.render_visible_meal_cards()
+    
+    def show_card_image(self, card, photo, text=""):
+        """Show a decoded thumbnail (or a text if decoding failed) in a card"""
+        card["image_token"] = None
+        card["image_label"].configure(image=photo or "", text=text)
+        card["image_label"].image = photo  # Keep a reference
+    
+    def cancel_card_image(self, card):
+        """Cancel a pending thumbnail decode for a card"""
+        if card.get("image_token") is not None:
+            self.image_decoder.cancel(card["image_token"])
+            card["image_token"] = None
+    
+    def release_meal_card(self, index):
+        """Hide a card and return it to the pool for reuse"""
+        card = self.visible_meal_cards.pop(index)
+        self.cancel_card_image(card)
+        self.meals_canvas.coords(card["item"], -10000, -10000)
+        self.meal_card_pool.append(card)
+    
+    def place_meal_card(self, card, index):
+        """Move a card to its grid cell"""
+        row, col = divmod(index, MEAL_GRID_COLUMNS)
+        col_width = max(self.meals_canvas.winfo_width(), MEAL_GRID_COLUMNS) // MEAL_GRID_COLUMNS
+        self.meals_canvas.coords(card["item"], col * col_width + 10, row * MEAL_CARD_HEIGHT + 10)
+        self.meals_canvas.itemconfigure(card["item"], width=max(col_width - 20, 1), height=MEAL_CARD_HEIGHT - 20)
+    
+    def create_meal_card(self):
+        """Create an empty meal card widget"""
+        canvas = self.meals_canvas
+        card_frame = ttk.LabelFrame(canvas, padding="10")
+        card_frame.pack_propagate(False)
+        
+        image_label = ttk.Label(card_frame, foreground="gray")
+        image_label.pack(pady=5)
+        info_label = ttk.Label(card_frame, font=("Arial", 9), foreground="gray")
+        info_label.pack(pady=2)
+        
+        # Buttons
+        btn_frame = ttk.Frame(card_frame)
+        btn_frame.pack(pady=5)
+        edit_button = ttk.Button(btn_frame, text="Bearbeiten")
+        edit_button.pack(side=tk.LEFT, padx=2)
+        delete_button = ttk.Button(btn_frame, text="Löschen")
+        delete_button.pack(side=tk.LEFT, padx=2)
+        
+        card_frame.bind("<Enter>", self.meals_bind_to_mousewheel)
+        item = canvas.create_window(-10000, -10000, window=card_frame, anchor="nw")
+        
+        return {
+            "item": item,
+            "image_token": None,  # Pending background decode
+            "frame": card_frame,
+            "image_label": image_label,
+            "info_label": info_label,
+            "edit_button": edit_button,
+            "delete_button": delete_button
+        }
+    
+    def fill_meal_card(self, card, meal_id, meal_data):
+        """Show the given meal in a (possibly recycled) card"""
+        card["frame"].configure(text=meal_data['name'])
+        
+        # Image display, decoded in the background unless the thumbnail is in memory
+        image_label = card["image_label"]
+        self.cancel_card_image(card)
+        image_path = meal_data.get('image_path')
+        if image_path and os.path.exists(image_path):
+            try:
+                key, photo = self.thumbnail_cache.cached_photo(image_path)
+            except OSError:
+                key, photo = None, None
+            if photo is not None:
+                self.show_card_image(card, photo)
+            else:
+                image_label.configure(image="", text="Bild wird geladen...")
+                image_label.image = None
+                card["image_token"] = self.image_decoder.submit(
+                    self.thumbnail_cache.load_thumbnail, image_path, key,
+                    callback=lambda img, c=card, k=key: self.show_card_image(c, self.thumbnail_cache.add_photo(k, img)),
+                    error_callback=lambda e, c=card: self.show_card_image(c, None, "Bild nicht verfügbar"))
+        else:
+            image_label.configure(image="", text="Kein Bild")
+            image_label.image = None
+        
+        # Additional info
+        info = meal_data.get('additional_info', '')
+        info_text = info[:50] + ("..." if len(info) > 50 else "")
+        card["info_label"].configure(text=info_text)
+        
+        card["edit_button"].configure(command=lambda m_id=meal_id: self.edit_meal(m_id))
+        card["delete_button"].configure(command=lambda m_id=meal_id: self.delete_meal(m_id))
+    
+    def add_new_meal(self):
+        """Open dialog to add new meal"""
+        self.meal_dialog(None)
+    
+    def edit_meal(self, meal_id):
+        """Open dialog to edit existing meal"""
+        self.meal_dialog(meal_id)
+    
+    def meal_dialog(self, meal_id=None):
+        """Dialog for adding/editing meals"""
+        is_edit = meal_id is not None
+        meal_data = self.meals_library.get(meal_id, {}) if is_edit else {}
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Gericht bearbeiten" if is_edit else "Neues Gericht hinzufügen")
+        dialog.geometry("500x600")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        main_frame = ttk.Frame(dialog, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Show Meal ID for editing
+        if is_edit:
+            id_frame = ttk.Frame(main_frame)
+            id_frame.pack(fill=tk.X, pady=(0, 15))
+            ttk.Label(id_frame, text="Meal ID:", font=("Arial", 9, "bold")).pack(side=tk.LEFT)
+            id_label = ttk.Label(id_frame, text=meal_id, font=("Arial", 9), foreground="gray")
+            id_label.pack(side=tk.LEFT, padx=(5, 0))
+            
+            # Add copy button for meal ID
+            def copy_meal_id():
+                dialog.clipboard_clear()
+                dialog.clipboard_append(meal_id)
+                messagebox.showinfo("Kopiert", "Meal ID wurde in die Zwischenablage kopiert!")
+            
+            ttk.Button(id_frame, text="📋 Kopieren", command=copy_meal_id).pack(side=tk.RIGHT)
+        
+        # Name
+        ttk.Label(main_frame, text="Name des Gerichts:").pack(anchor=tk.W, pady=(0, 5))
+        name_var = tk.StringVar(value=meal_data.get('name', ''))
+        name_entry = ttk.Entry(main_frame, textvariable=name_var, width=50)
+        name_entry.pack(fill=tk.X, pady=(0, 15))
+        
+        # Image
+        ttk.Label(main_frame, text="Bild des Gerichts:").pack(anchor=tk.W, pady=(0, 5))
+        image_path_var = tk.StringVar(value=meal_data.get('image_path', ''))
+        
+        image_frame = ttk.Frame(main_frame)
+        image_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        image_entry = ttk.Entry(image_frame, textvariable=image_path_var, width=40)
+        image_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        ttk.Button(image_frame, text="Durchsuchen", 
+                  command=lambda: self.browse_image(image_path_var)).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Button(image_frame, text="📋", 
+                  command=lambda: self.paste_image_from_clipboard_for_meal(image_path_var)).pack(side=tk.RIGHT, padx=(5, 0))
+        
+        # PDF Recipe
+        ttk.Label(main_frame, text="PDF Rezept:").pack(anchor=tk.W, pady=(0, 5))
+        pdf_path_var = tk.StringVar(value=meal_data.get('pdf_path', ''))
+        
+        pdf_frame = ttk.Frame(main_frame)
+        pdf_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        pdf_entry = ttk.Entry(pdf_frame, textvariable=pdf_path_var, width=40)
+        pdf_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        ttk.Button(pdf_frame, text="Durchsuchen", 
+                  command=lambda: self.browse_pdf_for_meal(pdf_path_var)).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Button(pdf_frame, text="📋", 
+                  command=lambda: self.paste_pdf_from_clipboard_for_meal(pdf_path_var)).pack(side=tk.RIGHT, padx=(5, 0))
+        
+        # File operation setting
+        ttk.Label(main_frame, text="Datei-Operation:").pack(anchor=tk.W, pady=(0, 5))
+        file_op_frame = ttk.Frame(main_frame)
+        file_op_frame.pack(anchor=tk.W, pady=(0, 15))
+        ttk.Radiobutton(file_op_frame, text="Kopieren", variable=self.meal_file_operation, value="copy").pack(side=tk.LEFT)
+        ttk.Radiobutton(file_op_frame, text="Ausschneiden", variable=self.meal_file_operation, value="cut").pack(side=tk.LEFT, padx=(20, 0))
+        
+        # Additional info
+        ttk.Label(main_frame, text="Zusätzliche Informationen:").pack(anchor=tk.W, pady=(0, 5))
+        info_text = tk.Text(main_frame, height=8, width=50)
+        info_text.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        
+        if meal_data.get('additional_info'):
+            info_text.insert('1.0', meal_data['additional_info'])
+        
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=10)
+        
+        def save_meal():
+            nonlocal meal_id  # Allow access to meal_id from outer scope
+            
+            name = name_var.get().strip()
+            if not name:
+                messagebox.showerror("Fehler", "Bitte geben Sie einen Namen für das Gericht ein.")
+                return
+            
+            # Check for changes
+            has_changes = False
+            changes_made = []
+            
+            # Check name change
+            if not is_edit or name != meal_data.get('name', ''):
+                has_changes = True
+                changes_made.append("Name")
+            
+            # Check additional info change
+            new_additional_info = info_text.get('1.0', 'end-1c').strip()
+            if not is_edit or new_additional_info != meal_data.get('additional_info', ''):
+                has_changes = True
+                changes_made.append("Zusätzliche Informationen")
+            
+            # Check image path change
+            current_image_path = image_path_var.get()
+            original_image_path = meal_data.get('image_path', '') if is_edit else ''
+            image_changed = current_image_path != original_image_path
+            if image_changed:
+                has_changes = True
+                changes_made.append("Bild")
+            
+            # Check PDF path change
+            current_pdf_path = pdf_path_var.get()
+            original_pdf_path = meal_data.get('pdf_path', '') if is_edit else ''
+            pdf_changed = current_pdf_path != original_pdf_path
+            if pdf_changed:
+                has_changes = True
+                changes_made.append("PDF")
+            
+            # If editing and no changes detected, show message
+            if is_edit and not has_changes:
+                messagebox.showinfo("Information", "Keine Änderungen erkannt. Das Gericht wurde nicht gespeichert.")
+                return
+            
+            # Create meal data
+            new_meal_data = {
+                'name': name,
+                'image_path': '',
+                'pdf_path': '',
+                'additional_info': new_additional_info
+            }
+            
+            # Keep creation date and usage statistics when editing
+            for key in ('created', 'last_used', 'use_count'):
+                if key in meal_data:
+                    new_meal_data[key] = meal_data[key]
+            
+            # Generate meal ID if new, otherwise use existing ID
+            if not is_edit:
+                meal_id = str(uuid.uuid4())
+                new_meal_data['created'] = datetime.now().isoformat(timespec="seconds")
+            # For editing, meal_id is already available from the function parameter
+            
+            # Create meal directory
+            meal_dir = os.path.join(self.meals_data_path, f"meal_{meal_id}")
+            if not os.path.exists(meal_dir):
+                os.makedirs(meal_dir)
+            
+            # Handle image file only if it has changed
+            if current_image_path and os.path.exists(current_image_path):
+                if image_changed:
+                    try:
+                        image_ext = os.path.splitext(current_image_path)[1]
+                        new_image_path = os.path.join(meal_dir, f"image{image_ext}")
+                        
+                        # Only copy/move if the source is different from destination
+                        if os.path.abspath(current_image_path) != os.path.abspath(new_image_path):
+                            if self.meal_file_operation.get() == "copy":
+                                shutil.copy2(current_image_path, new_image_path)
+                            else:  # cut
+                                shutil.move(current_image_path, new_image_path)
+                        
+                        new_meal_data['image_path'] = new_image_path
+                    except Exception as e:
+                        messagebox.showwarning("Warnung", f"Bild konnte nicht {'kopiert' if self.meal_file_operation.get() == 'copy' else 'verschoben'} werden: {str(e)}")
+                        # Keep the original path if copy/move failed
+                        new_meal_data['image_path'] = current_image_path
+                else:
+                    # No change, keep original path
+                    new_meal_data['image_path'] = current_image_path
+            elif is_edit:
+                # Keep existing image path if no new image provided
+                new_meal_data['image_path'] = original_image_path
+            
+            # Handle PDF file only if it has changed
+            if current_pdf_path and os.path.exists(current_pdf_path):
+                if pdf_changed:
+                    try:
+                        pdf_ext = os.path.splitext(current_pdf_path)[1]
+                        new_pdf_path = os.path.join(meal_dir, f"recipe{pdf_ext}")
+                        
+                        # Only copy/move if the source is different from destination
+                        if os.path.abspath(current_pdf_path) != os.path.abspath(new_pdf_path):
+                            if self.meal_file_operation.get() == "copy":
+                                shutil.copy2(current_pdf_path, new_pdf_path)
+                            else:  # cut
+                                shutil.move(current_pdf_path, new_pdf_path)
+                        
+                        new_meal_data['pdf_path'] = new_pdf_path
+                    except Exception as e:
+                        messagebox.showwarning("Warnung", f"PDF konnte nicht {'kopiert' if self.meal_file_operation.get() == 'copy' else 'verschoben'} werden: {str(e)}")
+                        # Keep the original path if copy/move failed
+                        new_meal_data['pdf_path'] = current_pdf_path
+                else:
+                    # No change, keep original path
+                    new_meal_data['pdf_path'] = current_pdf_path
+            elif is_edit:
+                # Keep existing PDF path if no new PDF provided
+                new_meal_data['pdf_path'] = original_pdf_path
+            
+            # Save to library
+            self.meals_library[meal_id] = new_meal_data
+            self.search_index.update(meal_id, new_meal_data)
+            self.save_meals_library(meal_id)
+            
+            # Prepare the grid thumbnail in the background
+            if new_meal_data['image_path'] and os.path.exists(new_meal_data['image_path']):
+                self.image_decoder.submit(self.thumbnail_cache.ensure_cached, new_meal_data['image_path'])
+            
+            # Clean up temporary files after successful save
+            self.cleanup_temp_meal_files()
+            
+            # Show success message with what was changed
+            if is_edit:
+                if changes_made:
+                    messagebox.showinfo("Erfolg", f"Gericht wurde erfolgreich aktualisiert!\nGeänderte Bereiche: {', '.join(changes_made)}")
+                else:
+                    messagebox.showinfo("Information", "Gericht wurde gespeichert (keine Änderungen erkannt).")
+            else:
+                messagebox.showinfo("Erfolg", "Neues Gericht wurde erfolgreich hinzugefügt!")
+            
+            dialog.destroy()
+            # Check if we have the attributes needed for updating display
+            if hasattr(self, 'meals_canvas') and self.meals_canvas.winfo_exists():
+                self.update_meals_display()  # Refresh display
+            else:
+                self.setup_meal_library_page()  # Fallback for full refresh
+        
+        def cancel_meal():
+            """Cancel and clean up temporary files"""
+            self.cleanup_temp_meal_files()
+            dialog.destroy()
+        
+        ttk.Button(button_frame, text="Speichern", command=save_meal).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Button(button_frame, text="Abbrechen", command=cancel_meal).pack(side=tk.RIGHT)
+        
+        # Focus on name entry
+        name_entry.focus_set()
+    
+    def cleanup_temp_meal_files(self):
+        """Clean up temporary files in meals_data/temp directory"""
+        temp_dir = os.path.join(self.meals_data_path, "temp")
+        if os.path.exists(temp_dir):
+            try:
+                for filename in os.listdir(temp_dir):
+                    if filename.startswith("temp_"):
+                        file_path = os.path.join(temp_dir, filename)
+                        try:
+                            os.remove(file_path)
+                        except:
+                            pass  # Ignore if file can't be deleted
+            except:
+                pass  # Ignore any directory access errors
+    
+    def update_file_operation_state(self):
+        """Update file operation radio buttons based on whether database meals are selected"""
+        has_database_meals = False
+        
+        # Check if any dish uses a meal from database
+        for slot in self.week_plan.slots.values():
+            # Check if paths are from meals_data folder (indicating database meal)
+            if ((slot.pdf and self.meals_data_path in slot.pdf) or 
+                (slot.photo and self.meals_data_path in slot.photo)):
+                has_database_meals = True
+                break
+        
+        if has_database_meals:
+            # Disable cut option and show warning
+            self.cut_radio.config(state='disabled')
+            if self.file_operation.get() == "cut":
+                self.file_operation.set("copy")  # Force to copy
+            self.file_op_warning.config(text="⚠️ Ausschneiden deaktiviert - Gerichte aus der Datenbank würden beschädigt werden!")
+        else:
+            # Enable cut option and clear warning
+            self.cut_radio.config(state='normal')
+            self.file_op_warning.config(text="")
+    
+    def browse_image(self, path_var):
+        """Browse for image file"""
+        filetypes = [
+            ("Bild Dateien", "*.jpg *.jpeg *.png *.gif *.bmp"),
+            ("Alle Dateien", "*.*")
+        ]
+        filename = filedialog.askopenfilename(title="Bild auswählen", filetypes=filetypes)
+        if filename:
+            path_var.set(filename)
+    
+    def browse_pdf_for_meal(self, path_var):
+        """Browse for PDF file for meal library"""
+        filetypes = [
+            ("PDF Dateien", "*.pdf"),
+            ("Alle Dateien", "*.*")
+        ]
+        filename = filedialog.askopenfilename(title="PDF auswählen", filetypes=filetypes)
+        if filename:
+            path_var.set(filename)
+    
+    def paste_pdf_from_clipboard_for_meal(self, path_var):
+        """Paste PDF from clipboard for meal library - creates temporary file"""
+        try:
+            # First, try to get file path from clipboard
+            clipboard_content = self.root.clipboard_get()
+            if clipboard_content and os.path.exists(clipboard_content) and clipboard_content.lower().endswith('.pdf'):
+                # Create temporary copy in meals_data folder
+                temp_dir = os.path.join(self.meals_data_path, "temp")
+                os.makedirs(temp_dir, exist_ok=True)
+                temp_filename = f"temp_pdf_{uuid.uuid4().hex[:8]}.pdf"
+                temp_path = os.path.join(temp_dir, temp_filename)
+                shutil.copy2(clipboard_content, temp_path)
+                path_var.set(temp_path)
+                messagebox.showinfo("Erfolg", "PDF aus Zwischenablage eingefügt!")
+                return
+            
+            # If no valid file path, check if there's actual file data in clipboard (not implemented for PDFs)
+            messagebox.showwarning("Warnung", "Kein gültiger PDF-Pfad in der Zwischenablage gefunden!\nBitte kopieren Sie den Dateipfad einer PDF-Datei.")
+            
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Fehler beim Einfügen aus Zwischenablage: {str(e)}")
+    
+    def paste_image_from_clipboard_for_meal(self, path_var):
+        """Paste image from clipboard for meal library - creates temporary file"""
+        def on_pasted(temp_path):
+            path_var.set(temp_path)
+            messagebox.showinfo("Erfolg", "Bild aus Zwischenablage eingefügt!")
+        
+        def on_error(e):
+            messagebox.showerror("Fehler", f"Fehler beim Einfügen aus Zwischenablage: {str(e)}")
+        
+        try:
+            temp_dir = os.path.join(self.meals_data_path, "temp")
+            
+            # First, try to get actual image data from clipboard
+            from PIL import ImageGrab
+            img = ImageGrab.grabclipboard()
+            if img:
+                # Encoding runs in the background, the path is set once the file exists
+                base_path = os.path.join(temp_dir, f"temp_image_{uuid.uuid4().hex[:8]}")
+                self.image_decoder.submit(save_clipboard_image, img, base_path,
+                                          callback=on_pasted, error_callback=on_error)
+                return
+            
+            # If no image data, try file path from clipboard
+            clipboard_content = self.root.clipboard_get()
+            valid_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp')
+            if clipboard_content and os.path.exists(clipboard_content) and clipboard_content.lower().endswith(valid_extensions):
+                # Create temporary copy in meals_data folder
+                os.makedirs(temp_dir, exist_ok=True)
+                file_ext = os.path.splitext(clipboard_content)[1]
+                temp_filename = f"temp_image_{uuid.uuid4().hex[:8]}{file_ext}"
+                temp_path = os.path.join(temp_dir, temp_filename)
+                self.image_decoder.submit(shutil.copy2, clipboard_content, temp_path,
+                                          callback=on_pasted, error_callback=on_error)
+                return
+            
+            messagebox.showwarning("Warnung", "Keine Bilddaten oder gültiger Bild-Pfad in der Zwischenablage gefunden!")
+            
+        except Exception as e:
+            on_error(e)
+    
+    def browse_pdf(self, dish_num, path_var):
+        """Browse for PDF file with dish number"""
+        filetypes = [
+            ("PDF Dateien", "*.pdf"),
+            ("Alle Dateien", "*.*")
+        ]
+        filename = filedialog.askopenfilename(title=f"PDF für Gericht {dish_num} auswählen", filetypes=filetypes)
+        if filename:
+            path_var.set(filename)
+    
+    def delete_meal(self, meal_id):
+        """Delete a meal from the library"""
+        meal_name = self.meals_library[meal_id]['name']
+        if messagebox.askyesno("Löschen bestätigen", 
+                              f"Möchten Sie das Gericht '{meal_name}' wirklich löschen?"):
+            # Delete meal directory
+            meal_dir = os.path.join(self.meals_data_path, f"meal_{meal_id}")
+            if os.path.exists(meal_dir):
+                try:
+                    shutil.rmtree(meal_dir)
+                except:
+                    pass
+            
+            # Remove from library
+            del self.meals_library[meal_id]
+            self.search_index.remove(meal_id)
+            self.save_meals_library(meal_id)
+            self.update_meals_display()  # Refresh display
+    
+    def setup_page1(self):
+        """Configuration page"""
+        # Clear window
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        
+        # Auto-create default folder if website_path is not set or empty
+        if not self.website_path.get():
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            date_range = f"{self.week_start.get()}-{self.week_end.get()}"
+            default_folder = os.path.join(script_dir, f"Essensplan {date_range}")
+            
+            if not os.path.exists(default_folder):
+                try:
+                    os.makedirs(default_folder)
+                except Exception as e:
+                    print(f"Could not create default folder: {e}")
+                    default_folder = script_dir
+            
+            self.website_path.set(default_folder)
+            
+        # Initialize form change tracking
+        self.form_changed = False
+        self.original_values = {
+            'website_path': self.website_path.get(),
+            'week_start': self.week_start.get(),
+            'week_end': self.week_end.get(),
+            'breakfast_rows': self.breakfast_rows.get(),
+            'lunch_rows': self.lunch_rows.get(),
+            'snacks_rows': self.snacks_rows.get(),
+            'dessert_rows': self.dessert_rows.get(),
+            'empty_cell_display': self.empty_cell_display.get(),
+            'show_photos': self.show_photos.get(),
+            'show_sources_box': self.show_sources_box.get(),
+            'source_pdf1_name': self.source_pdf1_name.get(),
+            'source_pdf2_name': self.source_pdf2_name.get(),
+            'rename_subfolder': self.rename_subfolder.get()
+        }
+            
+        main_frame = ttk.Frame(self.root, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Title
+        title_label = ttk.Label(main_frame, text="Essensplan Generator - Konfiguration", 
+                               font=("Arial", 16, "bold"))
+        title_label.grid(row=0, column=0, columnspan=4, pady=(0, 20))
+        
+        # Website path selection
+        ttk.Label(main_frame, text="Speicherort der Webseite:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        website_entry = ttk.Entry(main_frame, textvariable=self.website_path, width=50)
+        website_entry.grid(row=1, column=1, columnspan=2, padx=5, sticky=(tk.W, tk.E))
+        website_entry.bind('<KeyPress>', self.on_form_change)
+        ttk.Button(main_frame, text="Durchsuchen", 
+                  command=self.browse_directory).grid(row=1, column=3, padx=5)
+        
+        # Week date range
+        ttk.Label(main_frame, text="Wochenspanne:", 
+                 font=("Arial", 12, "bold")).grid(row=2, column=0, columnspan=4, pady=(20, 10))
+        
+        # Week navigation frame
+        week_frame = ttk.Frame(main_frame)
+        week_frame.grid(row=3, column=0, columnspan=4, pady=5)
+        
+        ttk.Button(week_frame, text="◄ Vorherige Woche", 
+                  command=self.previous_week).grid(row=0, column=0, padx=5)
+        
+        ttk.Label(week_frame, text="Von:").grid(row=0, column=1, sticky=tk.W, pady=5, padx=(20, 5))
+        ttk.Entry(week_frame, textvariable=self.week_start, width=12).grid(row=0, column=2, sticky=tk.W, padx=5)
+        ttk.Label(week_frame, text="Bis:").grid(row=0, column=3, sticky=tk.W, pady=5, padx=(20, 5))
+        ttk.Entry(week_frame, textvariable=self.week_end, width=12).grid(row=0, column=4, sticky=tk.W, padx=5)
+        
+        ttk.Button(week_frame, text="Nächste Woche ►", 
+                  command=self.next_week).grid(row=0, column=5, padx=(20, 5))
+        
+        # Category rows configuration
+        ttk.Label(main_frame, text="Anzahl Zeilen pro Kategorie:", 
+                 font=("Arial", 12, "bold")).grid(row=4, column=0, columnspan=4, pady=(20, 10))
+        
+        ttk.Label(main_frame, text="Frühstück:").grid(row=5, column=0, sticky=tk.W, pady=5)
+        breakfast_entry = ttk.Entry(main_frame, textvariable=self.breakfast_rows, width=10)
+        breakfast_entry.grid(row=5, column=1, sticky=tk.W, padx=5)
+        breakfast_entry.bind('<KeyPress>', self.on_form_change)
+        
+        ttk.Label(main_frame, text="Mittag-/Abendessen:").grid(row=6, column=0, sticky=tk.W, pady=5)
+        lunch_entry = ttk.Entry(main_frame, textvariable=self.lunch_rows, width=10)
+        lunch_entry.grid(row=6, column=1, sticky=tk.W, padx=5)
+        lunch_entry.bind('<KeyPress>', self.on_form_change)
+        
+        ttk.Label(main_frame, text="Snacks:").grid(row=7, column=0, sticky=tk.W, pady=5)
+        snacks_entry = ttk.Entry(main_frame, textvariable=self.snacks_rows, width=10)
+        snacks_entry.grid(row=7, column=1, sticky=tk.W, padx=5)
+        snacks_entry.bind('<KeyPress>', self.on_form_change)
+        
+        ttk.Label(main_frame, text="Nachtisch:").grid(row=8, column=0, sticky=tk.W, pady=5)
+        dessert_entry = ttk.Entry(main_frame, textvariable=self.dessert_rows, width=10)
+        dessert_entry.grid(row=8, column=1, sticky=tk.W, padx=5)
+        dessert_entry.bind('<KeyPress>', self.on_form_change)
+        
+        # Info label
+        info_label = ttk.Label(main_frame, text="Hinweis: Eingabe '/' bedeutet, dass die Kategorie nicht angezeigt wird",
+                              font=("Arial", 9), foreground="gray")
+        info_label.grid(row=9, column=0, columnspan=4, pady=10)
+        
+        # Settings section
+        ttk.Label(main_frame, text="Einstellungen:", 
+                 font=("Arial", 12, "bold")).grid(row=10, column=0, columnspan=4, pady=(20, 10))
+        
+        # Empty cell display
+        ttk.Label(main_frame, text="Anzeige für leere Zellen:").grid(row=11, column=0, sticky=tk.W, pady=5)
+        empty_frame = ttk.Frame(main_frame)
+        empty_frame.grid(row=11, column=1, columnspan=3, sticky=tk.W, padx=5)
+        ttk.Radiobutton(empty_frame, text='"-" anzeigen', variable=self.empty_cell_display, value="-").grid(row=0, column=0, sticky=tk.W)
+        ttk.Radiobutton(empty_frame, text="Gar nichts anzeigen", variable=self.empty_cell_display, value="nothing").grid(row=0, column=1, sticky=tk.W, padx=(20, 0))
+        
+        # Show photos
+        photos_checkbox = ttk.Checkbutton(main_frame, text="Fotos anzeigen", variable=self.show_photos, command=self.on_form_change)
+        photos_checkbox.grid(row=12, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Removed file operation setting from page 1 - moved to page 2
+        
+        # Rename subfolder option
+        rename_checkbox = ttk.Checkbutton(main_frame, text="Unterordner zu 'Essensplan [Zeitspanne]' umbenennen", 
+                       variable=self.rename_subfolder, command=self.on_form_change)
+        rename_checkbox.grid(row=13, column=0, columnspan=4, sticky=tk.W, pady=5)
+        
+        # Show sources box
+        sources_checkbox = ttk.Checkbutton(main_frame, text="Download Links anzeigen", variable=self.show_sources_box, 
+                                         command=lambda: [self.toggle_sources_options(), self.on_form_change()])
+        sources_checkbox.grid(row=14, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Source PDF names
+        self.sources_frame = ttk.LabelFrame(main_frame, text="Download Links Namen", padding="10")
+        self.sources_frame.grid(row=15, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=10)
+        
+        ttk.Label(self.sources_frame, text="PDF 1:").grid(row=0, column=0, sticky=tk.W, pady=2)
+        self.pdf1_entry = ttk.Entry(self.sources_frame, textvariable=self.source_pdf1_name, width=40)
+        self.pdf1_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+        self.pdf1_entry.bind('<KeyPress>', self.on_form_change)
+        
+        ttk.Label(self.sources_frame, text="PDF 2:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        self.pdf2_entry = ttk.Entry(self.sources_frame, textvariable=self.source_pdf2_name, width=40)
+        self.pdf2_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+        self.pdf2_entry.bind('<KeyPress>', self.on_form_change)
+        
+        self.sources_frame.columnconfigure(1, weight=1)
+        
+        # Notes Mode Button
+        ttk.Button(main_frame, text="Notizen-Modus öffnen", 
+                  command=self.open_notes_mode).grid(row=16, column=0, columnspan=2, pady=10, sticky=tk.W)
+        
+        # Back and Continue buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=17, column=0, columnspan=4, pady=20)
+        
+        ttk.Button(button_frame, text="← Zurück", 
+                  command=self.go_back_to_library_with_warning).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Weiter", command=self.validate_and_continue).pack(side=tk.RIGHT)
+        
+        # Configure grid weights
+        main_frame.columnconfigure(1, weight=1)
+        
+        # Initialize sources options state
+        self.toggle_sources_options()
+    
+    def open_notes_mode(self):
+        """Open notes planning window with adaptive layout"""
+        notes_window = tk.Toplevel(self.root)
+        notes_window.title("Notizen-Modus - Essensplan Planung")
+        notes_window.geometry("1400x800")  # Made larger to accommodate weekend visibility
+        
+        main_frame = ttk.Frame(notes_window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Create a paned window to separate table from instructions
+        paned_window = ttk.PanedWindow(main_frame, orient=tk.VERTICAL)
+        paned_window.pack(fill=tk.BOTH, expand=True)
+        
+        # Top frame for the table
+        table_frame = ttk.Frame(paned_window)
+        paned_window.add(table_frame, weight=4)
+        
+        ttk.Label(table_frame, text="Essensplan Notizen", font=("Arial", 14, "bold")).pack(pady=(0, 10))
+        
+        # Create a simple table for notes
+        canvas = tk.Canvas(table_frame)
+        scrollbar_v = ttk.Scrollbar(table_frame, orient="vertical", command=canvas.yview)
+        scrollbar_h = ttk.Scrollbar(table_frame, orient="horizontal", command=canvas.xview)
+        scrollable_frame = ttk.Frame(canvas)
+        
+        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar_v.set, xscrollcommand=scrollbar_h.set)
+        
+        # Table headers
+        days = ["", "Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
+        for i, day in enumerate(days):
+            label = ttk.Label(scrollable_frame, text=day, font=("Arial", 10, "bold"))
+            label.grid(row=0, column=i, padx=2, pady=2, sticky="ew")
+        
+        # Build categories based on current settings
+        categories = []
+        try:
+            if self.breakfast_rows.get() != "/":
+                for i in range(int(self.breakfast_rows.get())):
+                    categories.append(f"Frühstück {i+1}" if int(self.breakfast_rows.get()) > 1 else "Frühstück")
+            if self.lunch_rows.get() != "/":
+                for i in range(int(self.lunch_rows.get())):
+                    categories.append(f"Mittag-/Abendessen {i+1}" if int(self.lunch_rows.get()) > 1 else "Mittag-/Abendessen")
+            if self.snacks_rows.get() != "/":
+                for i in range(int(self.snacks_rows.get())):
+                    categories.append(f"Snacks {i+1}" if int(self.snacks_rows.get()) > 1 else "Snacks")
+            if self.dessert_rows.get() != "/":
+                for i in range(int(self.dessert_rows.get())):
+                    categories.append(f"Nachtisch {i+1}" if int(self.dessert_rows.get()) > 1 else "Nachtisch")
+        except ValueError:
+            # Fallback to default categories if values are invalid
+            categories = ["Frühstück", "Mittag-/Abendessen", "Snacks", "Nachtisch"]
+        
+        # Table rows with dish numbers - column-wise numbering
+        self.notes_entries = {}
+        self.notes_text_widgets = []  # For arrow key navigation
+        
+        for row_idx, category in enumerate(categories, 1):
+            ttk.Label(scrollable_frame, text=category, font=("Arial", 10, "bold")).grid(row=row_idx, column=0, padx=2, pady=2, sticky="w")
+            for col_idx in range(1, 8):  # Days 1-7
+                # Create frame for text widget with background number
+                cell_frame = tk.Frame(scrollable_frame, relief="solid", bd=1, bg="white")
+                cell_frame.grid(row=row_idx, column=col_idx, padx=2, pady=2, sticky="ew")
+                
+                # Calculate dish number column-wise (by day first, then by category)
+                day_idx = col_idx - 1  # 0-6 for Monday-Sunday
+                category_idx = row_idx - 1  # 0-based category index
+                total_categories = len(categories)
+                dish_counter = (day_idx * total_categories) + category_idx + 1
+                
+                # Create a text widget with placeholder background text
+                entry = tk.Text(cell_frame, width=15, height=3, bg="white", wrap="word")
+                entry.pack(fill="both", expand=True)
+                
+                # Add dish number as placeholder text in the background
+                entry.insert("1.0", f"[{dish_counter}]\n\n")
+                entry.tag_add("dish_number", "1.0", "1.end")
+                entry.tag_config("dish_number", foreground="#cccccc", font=("Arial", 8))
+                
+                # Bind events to maintain dish number display
+                def on_focus_in(event, widget=entry, number=dish_counter):
+                    # Keep the dish number visible but allow editing after it
+                    current_content = widget.get("1.0", "end-1c")
+                    if not current_content.startswith(f"[{number}]"):
+                        widget.delete("1.0", "end")
+                        widget.insert("1.0", f"[{number}]\n\n")
+                        widget.tag_add("dish_number", "1.0", "1.end")
+                        widget.tag_config("dish_number", foreground="#cccccc", font=("Arial", 8))
+                        widget.mark_set("insert", "2.0")
+                
+                def on_key_press(event, widget=entry, number=dish_counter):
+                    # Prevent editing of the dish number line
+                    if widget.index("insert").split('.')[0] == "1":
+                        if event.keysym not in ["Down", "Right", "End"]:
+                            widget.mark_set("insert", "2.0")
+                            return "break"
+                
+                entry.bind("<FocusIn>", on_focus_in)
+                entry.bind("<KeyPress>", on_key_press)
+                
+                # Store for navigation
+                self.notes_text_widgets.append(entry)
+                self.notes_entries[f"{category}_{col_idx}"] = entry
+        
+        # Add arrow key navigation
+        def navigate_cells(event):
+            widget = event.widget
+            if widget in self.notes_text_widgets:
+                current_idx = self.notes_text_widgets.index(widget)
+                total_widgets = len(self.notes_text_widgets)
+                cols = 7  # 7 days
+                
+                if event.keysym == "Up" and event.state & 0x4:  # Ctrl+Up
+                    new_idx = current_idx - cols if current_idx >= cols else current_idx
+                elif event.keysym == "Down" and event.state & 0x4:  # Ctrl+Down
+                    new_idx = current_idx + cols if current_idx + cols < total_widgets else current_idx
+                elif event.keysym == "Left" and event.state & 0x4:  # Ctrl+Left
+                    new_idx = current_idx - 1 if current_idx > 0 else current_idx
+                elif event.keysym == "Right" and event.state & 0x4:  # Ctrl+Right
+                    new_idx = current_idx + 1 if current_idx < total_widgets - 1 else current_idx
+                else:
+                    return
+                
+                self.notes_text_widgets[new_idx].focus_set()
+                return "break"
+        
+        # Bind navigation to all text widgets
+        for widget in self.notes_text_widgets:
+            widget.bind("<Control-Up>", navigate_cells)
+            widget.bind("<Control-Down>", navigate_cells)
+            widget.bind("<Control-Left>", navigate_cells)
+            widget.bind("<Control-Right>", navigate_cells)
+        
+        # Configure scrollable frame
+        for i in range(8):
+            scrollable_frame.columnconfigure(i, weight=1)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar_v.pack(side="right", fill="y")
+        scrollbar_h.pack(side="bottom", fill="x")
+        
+        # Bottom frame for instructions and controls
+        control_frame = ttk.Frame(paned_window)
+        paned_window.add(control_frame, weight=1)
+        
+        # Instructions
+        info_frame = ttk.Frame(control_frame)
+        info_frame.pack(fill=tk.X, pady=10)
+        ttk.Label(info_frame, text="Tipp: Verwende Strg + Pfeiltasten zur Navigation zwischen den Zellen", 
+                 font=("Arial", 10), foreground="gray").pack()
+        
+        # Close button
+        button_frame = ttk.Frame(control_frame)
+        button_frame.pack(pady=10)
+        ttk.Button(button_frame, text="Schließen", command=notes_window.destroy).pack()
+    
+    def toggle_sources_options(self):
+        """Enable/disable sources options based on checkbox state"""
+        if self.show_sources_box.get():
+            self.pdf1_entry.config(state='normal')
+            self.pdf2_entry.config(state='normal')
+        else:
+            self.pdf1_entry.config(state='disabled')
+            self.pdf2_entry.config(state='disabled')
+    
+    def browse_directory(self):
+        """Open directory selection dialog"""
+        directory = filedialog.askdirectory()
+        if directory:
+            self.website_path.set(directory)
+    
+    def validate_and_continue(self):
+        """Validate inputs and proceed to page 2"""
+        if not self.website_path.get():
+            messagebox.showerror("Fehler", "Bitte wählen Sie einen Speicherort aus!")
+            return
+            
+        if not self.week_start.get() or not self.week_end.get():
+            messagebox.showerror("Fehler", "Bitte geben Sie die Wochenspanne an!")
+            return
+            
+        # Calculate total dishes needed - column-wise numbering
+        try:
+            self.total_dishes = 0
+            categories = []
+            
+            if self.breakfast_rows.get() != "/":
+                breakfast_count = int(self.breakfast_rows.get()) * 7
+                self.total_dishes += breakfast_count
+                categories.append(("Frühstück", int(self.breakfast_rows.get())))
+                
+            if self.lunch_rows.get() != "/":
+                lunch_count = int(self.lunch_rows.get()) * 7
+                self.total_dishes += lunch_count
+                categories.append(("Mittag-/Abendessen", int(self.lunch_rows.get())))
+                
+            if self.snacks_rows.get() != "/":
+                snacks_count = int(self.snacks_rows.get()) * 7
+                self.total_dishes += snacks_count
+                categories.append(("Snacks", int(self.snacks_rows.get())))
+                
+            if self.dessert_rows.get() != "/":
+                dessert_count = int(self.dessert_rows.get()) * 7
+                self.total_dishes += dessert_count
+                categories.append(("Nachtisch", int(self.dessert_rows.get())))
+                
+            self.categories = categories
+            
+        except ValueError:
+            messagebox.showerror("Fehler", "Bitte geben Sie gültige Zahlen ein!")
+            return
+            
+        # Generate website structure
+        self.generate_website_structure()
+        
+        # Move to page 2
+        self.setup_page2()
+    
+    def generate_website_structure(self):
+        """Generate the HTML and CSS files with placeholders"""
+        website_dir = self.website_path.get()
+        
+        # Create directories
+        os.makedirs(os.path.join(website_dir, "media", "photos"), exist_ok=True)
+        os.makedirs(os.path.join(website_dir, "media", "pdfs"), exist_ok=True)
+        
+        # Initialize dish slots with default names
+        self.week_plan = WeekPlan.for_week(self.week_start.get(), self.week_end.get(), self.categories)
+        self.site_media = None
+        self.built_plan = None
+        
+        # Generate HTML
+        html_content = self.generate_html()
+        with open(os.path.join(website_dir, "index.html"), "w", encoding="utf-8") as f:
+            f.write(html_content)
+            
+        # Generate CSS
+        css_content = self.generate_css()
+        with open(os.path.join(website_dir, "styles.css"), "w", encoding="utf-8") as f:
+            f.write(css_content)
+            
+        messagebox.showinfo("Erfolg", "Webseiten-Struktur wurde erstellt!")
+    
+    def current_plan(self):
+        """Copy the page settings into the WeekPlan and return it with the staged media
+        
+        The dish slots are already up to date, their Tk variables write into them.
+        """
+        plan = self.week_plan
+        plan.week_start = self.week_start.get()
+        plan.week_end = self.week_end.get()
+        plan.empty_cell_display = self.empty_cell_display.get()
+        plan.show_photos = self.show_photos.get()
+        plan.show_sources_box = self.show_sources_box.get()
+        plan.source_names = (self.source_pdf1_name.get(), self.source_pdf2_name.get())
+        plan.source_files = {key: var.get() for key, var in self.source_files.items()}
+        plan.inline_css = minify_css(self.generate_css()) if self.inline_assets.get() else None
+        if self.site_media is not None:
+            return replace(plan, **self.site_media.plan_fields())
+        return plan
+    
+    def generate_html(self):
+        """Generate HTML content based on configuration"""
+        return MEAL_PLAN_TEMPLATE.render(self.current_plan())
+    
+    def generate_css(self):
+        """Generate CSS content"""
+        return site_css()
+    
+    def setup_page2(self):
+        """File assignment page"""
+        # Clear window
+        for widget in self.root.winfo_children():
+            widget.destroy()
+            
+        main_frame = ttk.Frame(self.root, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configure grid weights
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        
+        # Title
+        title_label = ttk.Label(main_frame, text="Datei-Zuordnung und Anpassungen", 
+                               font=("Arial", 16, "bold"))
+        title_label.grid(row=0, column=0, columnspan=6, pady=(0, 20))
+        
+        # Test website button
+        test_button = ttk.Button(main_frame, text="Webseite im Browser öffnen (Test)", 
+                                command=self.open_website)
+        test_button.grid(row=1, column=0, columnspan=6, pady=(0, 10))
+        
+        # Info about placeholder words
+        info_label = ttk.Label(main_frame, text="Hinweis: Eingabe '/' wird als Platzhalter erkannt und blendet PDF/Foto Links aus",
+                              font=("Arial", 9), foreground="gray", wraplength=800)
+        info_label.grid(row=2, column=0, columnspan=6, pady=(0, 20))
+        
+        # Create scrollable frame with mouse wheel support
+        canvas = tk.Canvas(main_frame)
+        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
+        scrollable_frame = ttk.Frame(canvas)
+        
+        # Bind mouse wheel scrolling to canvas and scrollable frame
+        def on_mousewheel(event):
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        
+        def bind_to_mousewheel(event):
+            canvas.bind_all("<MouseWheel>", on_mousewheel)
+        
+        def unbind_from_mousewheel(event):
+            canvas.unbind_all("<MouseWheel>")
+        
+        # Bind to both canvas and scrollable frame
+        canvas.bind('<Enter>', bind_to_mousewheel)
+        canvas.bind('<Leave>', unbind_from_mousewheel)
+        scrollable_frame.bind('<Enter>', bind_to_mousewheel)
+        scrollable_frame.bind('<Leave>', unbind_from_mousewheel)
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # Headers
+        ttk.Label(scrollable_frame, text="Gericht", font=("Arial", 10, "bold")).grid(row=0, column=0, padx=5, pady=5)
+        ttk.Label(scrollable_frame, text="Name", font=("Arial", 10, "bold")).grid(row=0, column=1, padx=5, pady=5)
+        ttk.Label(scrollable_frame, text="Leer", font=("Arial", 10, "bold")).grid(row=0, column=2, padx=5, pady=5)
+        ttk.Label(scrollable_frame, text="PDF Datei", font=("Arial", 10, "bold")).grid(row=0, column=3, padx=5, pady=5)
+        ttk.Label(scrollable_frame, text="Foto Datei", font=("Arial", 10, "bold")).grid(row=0, column=4, padx=5, pady=5)
+        
+        # Select All Empty checkbox
+        self.select_all_empty = tk.BooleanVar()
+        ttk.Checkbutton(scrollable_frame, text="Alle Leer", variable=self.select_all_empty,
+                       command=self.toggle_all_empty).grid(row=0, column=2, padx=5, pady=2, sticky="s")
+        
+        # Create file selection rows with column-wise dish numbering
+        self.file_entries = {}
+        self.name_entries = {}
+        self.empty_checkboxes = {}
+        self.input_widgets = {}
+        
+        total_categories = sum(row_count for _, row_count in self.categories)
+        row_counter = 1
+        
+        for day in range(7):
+            for category_idx, (category_name, row_count) in enumerate(self.categories):
+                for row in range(row_count):
+                    # Column-wise numbering: (day * total_categories) + category_row_index + 1
+                    category_row_index = sum(prev_row_count for _, prev_row_count in self.categories[:category_idx]) + row
+                    dish_counter = (day * total_categories) + category_row_index + 1
+                    # Dish number
+                    ttk.Label(scrollable_frame, text=f"Gericht {dish_counter}").grid(row=row_counter, column=0, padx=5, pady=2)
+                    
+                    slot = self.week_plan.slots[dish_counter]
+                    
+                    # Dish name with meal search
+                    name_var = tk.StringVar(value=slot.name)
+                    self.bind_slot_var(name_var, slot, "name")
+                    
+                    # Create frame for name entry and search button
+                    name_frame = ttk.Frame(scrollable_frame)
+                    name_frame.grid(row=row_counter, column=1, padx=5, pady=2, sticky=(tk.W, tk.E))
+                    
+                    name_entry = ttk.Entry(name_frame, textvariable=name_var, width=15)
+                    name_entry.grid(row=0, column=0, sticky=(tk.W, tk.E))
+                    name_frame.columnconfigure(0, weight=1)
+                    
+                    # Search button for pre-set meals
+                    search_button = ttk.Button(name_frame, text="🔍", width=3,
+                                             command=lambda i=dish_counter, var=name_var: self.search_meal(i, var))
+                    search_button.grid(row=0, column=1, padx=(2, 0))
+                    
+                    # Bind double-click to search as well
+                    name_entry.bind("<Double-Button-1>", lambda e, i=dish_counter, var=name_var: self.search_meal(i, var))
+                    
+                    self.name_entries[dish_counter] = name_var
+                    
+                    # Empty checkbox
+                    empty_var = tk.BooleanVar(value=slot.empty)
+                    self.bind_slot_var(empty_var, slot, "empty")
+                    empty_checkbox = ttk.Checkbutton(scrollable_frame, variable=empty_var,
+                                                   command=lambda i=dish_counter: self.toggle_empty_cell(i))
+                    empty_checkbox.grid(row=row_counter, column=2, padx=5, pady=2)
+                    self.empty_checkboxes[dish_counter] = empty_var
+                    
+                    # PDF file selection with clipboard support
+                    pdf_var = tk.StringVar(value=slot.pdf)
+                    self.bind_slot_var(pdf_var, slot, "pdf")
+                    pdf_frame = ttk.Frame(scrollable_frame)
+                    pdf_frame.grid(row=row_counter, column=3, padx=5, pady=2, sticky=(tk.W, tk.E))
+                    
+                    pdf_entry = ttk.Entry(pdf_frame, textvariable=pdf_var, width=25)
+                    pdf_entry.grid(row=0, column=0, sticky=(tk.W, tk.E))
+                    pdf_frame.columnconfigure(0, weight=1)
+                    
+                    pdf_button = ttk.Button(pdf_frame, text="...", width=3,
+                          command=lambda i=dish_counter, var=pdf_var: self.browse_pdf(i, var))
+                    pdf_button.grid(row=0, column=1, padx=(2, 0))
+                    
+                    # PDF Clipboard button 
+                    pdf_clipboard_button = ttk.Button(pdf_frame, text="📋", width=3,
+                          command=lambda i=dish_counter, var=pdf_var: self.paste_pdf_from_clipboard(i, var))
+                    pdf_clipboard_button.grid(row=0, column=2, padx=(2, 0))
+                    
+                    # Photo file selection with clipboard support
+                    photo_var = tk.StringVar(value=slot.photo)
+                    self.bind_slot_var(photo_var, slot, "photo")
+                    photo_frame = ttk.Frame(scrollable_frame)
+                    photo_frame.grid(row=row_counter, column=4, padx=5, pady=2, sticky=(tk.W, tk.E))
+                    
+                    photo_entry = ttk.Entry(photo_frame, textvariable=photo_var, width=25)
+                    photo_entry.grid(row=0, column=0, sticky=(tk.W, tk.E))
+                    photo_frame.columnconfigure(0, weight=1)
+                    
+                    photo_button = ttk.Button(photo_frame, text="...", width=3,
+                          command=lambda i=dish_counter, var=photo_var: self.browse_photo(i, var))
+                    photo_button.grid(row=0, column=1, padx=(2, 0))
+                    
+                    # Clipboard button for photos
+                    clipboard_button = ttk.Button(photo_frame, text="📋", width=3,
+                          command=lambda i=dish_counter, var=photo_var: self.paste_from_clipboard(i, var))
+                    clipboard_button.grid(row=0, column=2, padx=(2, 0))
+                    
+                    self.file_entries[dish_counter] = {"pdf": pdf_var, "photo": photo_var}
+                    
+                    # Store widget references for graying out
+                    self.input_widgets[dish_counter] = {
+                        "name_entry": name_entry,
+                        "search_button": search_button,
+                        "pdf_entry": pdf_entry,
+                        "pdf_button": pdf_button,
+                        "pdf_clipboard_button": pdf_clipboard_button,
+                        "photo_entry": photo_entry,
+                        "photo_button": photo_button,
+                        "clipboard_button": clipboard_button
+                    }
+                    
+                    # Apply initial gray state if needed
+                    if slot.empty:
+                        self.update_widget_state(dish_counter, disabled=True)
+                    
+                    row_counter += 1
+        
+        # Add file operation setting at the top of the settings section
+        settings_start_row = row_counter + 1
+        
+        # Settings header
+        ttk.Label(scrollable_frame, text="Einstellungen", font=("Arial", 12, "bold")).grid(row=settings_start_row, column=0, columnspan=5, pady=(20, 10))
+        
+        # File operation setting
+        ttk.Label(scrollable_frame, text="Datei-Operation:").grid(row=settings_start_row + 1, column=0, sticky=tk.W, pady=5)
+        file_op_frame = ttk.Frame(scrollable_frame)
+        file_op_frame.grid(row=settings_start_row + 1, column=1, columnspan=3, sticky=tk.W, padx=5)
+        self.copy_radio = ttk.Radiobutton(file_op_frame, text="Kopieren", variable=self.file_operation, value="copy")
+        self.copy_radio.grid(row=0, column=0, sticky=tk.W)
+        self.cut_radio = ttk.Radiobutton(file_op_frame, text="Ausschneiden", variable=self.file_operation, value="cut")
+        self.cut_radio.grid(row=0, column=1, sticky=tk.W, padx=(20, 0))
+        ttk.Checkbutton(file_op_frame, text="Gleiche Dateien nur einmal speichern",
+                        variable=self.dedupe_media).grid(row=0, column=2, sticky=tk.W, padx=(20, 0))
+        
+        # Photo optimization setting
+        photo_opt_frame = ttk.Frame(file_op_frame)
+        photo_opt_frame.grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+        ttk.Checkbutton(photo_opt_frame, text="Fotos verkleinern auf max.",
+                        variable=self.optimize_photos).pack(side=tk.LEFT)
+        ttk.Entry(photo_opt_frame, textvariable=self.photo_max_dimension, width=5).pack(side=tk.LEFT, padx=(5, 2))
+        ttk.Label(photo_opt_frame, text="Pixel als").pack(side=tk.LEFT)
+        ttk.Radiobutton(photo_opt_frame, text="JPEG", variable=self.photo_format, value="jpeg").pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Radiobutton(photo_opt_frame, text="WebP", variable=self.photo_format, value="webp").pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Single-file export setting
+        inline_frame = ttk.Frame(file_op_frame)
+        inline_frame.grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+        ttk.Checkbutton(inline_frame, text="CSS in HTML einbetten",
+                        variable=self.inline_assets).pack(side=tk.LEFT)
+        ttk.Checkbutton(inline_frame, text="Vorschaubilder einbetten (eine Datei)",
+                        variable=self.embed_thumbnails).pack(side=tk.LEFT, padx=(20, 0))
+        ttk.Checkbutton(inline_frame, text=".gz/.br-Dateien erzeugen",
+                        variable=self.precompress_assets).pack(side=tk.LEFT, padx=(20, 0))
+        
+        # Warning label for database meals
+        self.file_op_warning = ttk.Label(scrollable_frame, text="", foreground="red", font=("Arial", 9))
+        self.file_op_warning.grid(row=settings_start_row + 2, column=0, columnspan=4, sticky=tk.W, pady=2)
+        
+        # Add sources section if enabled
+        if self.show_sources_box.get():
+            sources_start_row = settings_start_row + 3
+            
+            # Sources header
+            ttk.Label(scrollable_frame, text="Download Links", font=("Arial", 12, "bold")).grid(row=sources_start_row, column=0, columnspan=5, pady=(20, 10))
+            
+            # Source PDF 1
+            ttk.Label(scrollable_frame, text=self.source_pdf1_name.get()).grid(row=sources_start_row + 1, column=0, columnspan=2, padx=5, pady=2, sticky=tk.W)
+            source1_frame = ttk.Frame(scrollable_frame)
+            source1_frame.grid(row=sources_start_row + 1, column=3, padx=5, pady=2, sticky=(tk.W, tk.E))
+            source1_entry = ttk.Entry(source1_frame, textvariable=self.source_files["pdf1"], width=25)
+            source1_entry.grid(row=0, column=0, sticky=(tk.W, tk.E))
+            source1_frame.columnconfigure(0, weight=1)
+            ttk.Button(source1_frame, text="...", width=3,
+                      command=lambda: self.browse_source_pdf("pdf1")).grid(row=0, column=1, padx=(2, 0))
+            
+            # Source PDF 2
+            ttk.Label(scrollable_frame, text=self.source_pdf2_name.get()).grid(row=sources_start_row + 2, column=0, columnspan=2, padx=5, pady=2, sticky=tk.W)
+            source2_frame = ttk.Frame(scrollable_frame)
+            source2_frame.grid(row=sources_start_row + 2, column=3, padx=5, pady=2, sticky=(tk.W, tk.E))
+            source2_entry = ttk.Entry(source2_frame, textvariable=self.source_files["pdf2"], width=25)
+            source2_entry.grid(row=0, column=0, sticky=(tk.W, tk.E))
+            source2_frame.columnconfigure(0, weight=1)
+            ttk.Button(source2_frame, text="...", width=3,
+                      command=lambda: self.browse_source_pdf("pdf2")).grid(row=0, column=1, padx=(2, 0))
+        
+        # Configure scrollable frame
+        scrollable_frame.columnconfigure(1, weight=1)
+        scrollable_frame.columnconfigure(3, weight=1)
+        scrollable_frame.columnconfigure(4, weight=1)
+        
+        canvas.grid(row=3, column=0, columnspan=5, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        scrollbar.grid(row=3, column=5, sticky=(tk.N, tk.S), pady=(0, 10))
+        main_frame.rowconfigure(3, weight=1)
+        
+        # Initial update of file operation state
+        self.update_file_operation_state()
+        
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=4, column=0, columnspan=6, pady=10)
+        
+        ttk.Button(button_frame, text="← Zurück", command=self.go_back_to_page1_with_warning).grid(row=0, column=0, padx=5)
+        ttk.Button(button_frame, text="Dateien kopieren und fertigstellen", 
+                  command=self.copy_files_and_finish).grid(row=0, column=1, padx=5)
+    
+    def paste_pdf_from_clipboard(self, dish_num, var):
+        """Paste PDF path from clipboard"""
+        try:
+            clipboard_content = self.root.clipboard_get()
+            if clipboard_content and (clipboard_content.lower().endswith('.pdf') or os.path.exists(clipboard_content)):
+                var.set(clipboard_content)
+                messagebox.showinfo("Erfolg", "PDF-Pfad aus Zwischenablage eingefügt!")
+            else:
+                messagebox.showwarning("Warnung", "Kein gültiger PDF-Pfad in der Zwischenablage gefunden!")
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Fehler beim Einfügen aus Zwischenablage: {str(e)}")
+    
+    def toggle_all_empty(self):
+        """Toggle all empty checkboxes"""
+        select_all = self.select_all_empty.get()
+        for dish_num, empty_var in self.empty_checkboxes.items():
+            empty_var.set(select_all)
+            self.update_widget_state(dish_num, disabled=select_all)
+    
+    def paste_from_clipboard(self, dish_num, var):
+        """Paste image from clipboard - supports PNG and JPEG formats"""
+        def on_pasted(temp_path):
+            var.set(temp_path)
+            messagebox.showinfo("Erfolg", "Bild aus Zwischenablage eingefügt!")
+        
+        def on_error(e):
+            messagebox.showerror("Fehler", f"Fehler beim Einfügen aus Zwischenablage: {str(e)}")
+        
+        try:
+            from PIL import ImageGrab
+            img = ImageGrab.grabclipboard()
+            if img:
+                # Saved as PNG (transparency) or JPEG in the background
+                base_path = os.path.join(self.website_path.get(), "media", "photos", f"temp_clipboard_{dish_num}")
+                self.image_decoder.submit(save_clipboard_image, img, base_path,
+                                          callback=on_pasted, error_callback=on_error)
+            else:
+                messagebox.showwarning("Warnung", "Keine Bilddaten in der Zwischenablage gefunden!")
+        except Exception as e:
+            on_error(e)
+    
+    def update_widget_state(self, dish_num, disabled=False):
+        """Enable or disable widgets for a dish based on empty cell state"""
+        widgets = self.input_widgets.get(dish_num, {})
+        state = 'disabled' if disabled else 'normal'
+        
+        for widget_name, widget in widgets.items():
+            if widget_name in ['name_entry', 'pdf_entry', 'photo_entry']:
+                widget.config(state=state)
+            elif widget_name in ['pdf_button', 'photo_button', 'clipboard_button', 'pdf_clipboard_button', 'search_button']:
+                widget.config(state=state)
+    
+    def search_meal(self, dish_num, name_var):
+        """Open search dialog for pre-set meals"""
+        if not self.meals_library:
+            messagebox.showinfo("Info", "Noch keine Gerichte in der Bibliothek vorhanden.")
+            return
+        
+        # Create search dialog
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Gericht auswählen")
+        dialog.geometry("600x500")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        main_frame = ttk.Frame(dialog, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Search entry
+        ttk.Label(main_frame, text="Suche nach Gericht:").pack(anchor=tk.W, pady=(0, 5))
+        search_var = tk.StringVar()
+        search_entry = ttk.Entry(main_frame, textvariable=search_var, width=50)
+        search_entry.pack(fill=tk.X, pady=(0, 15))
+        
+        # Results listbox
+        ttk.Label(main_frame, text="Verfügbare Gerichte:").pack(anchor=tk.W, pady=(0, 5))
+        
+        # Create frame for listbox and scrollbar
+        list_frame = ttk.Frame(main_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        
+        listbox = tk.Listbox(list_frame, height=15)
+        scrollbar_list = ttk.Scrollbar(list_frame, orient="vertical", command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar_list.set)
+        
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar_list.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Store meal data for quick access
+        meal_items = []
+        
+        def show_results(search_term, results):
+            """Replace listbox content with the ranked results, best match selected"""
+            listbox.delete(0, tk.END)
+            meal_items[:] = results
+            if results:
+                listbox.insert(tk.END, *(meal_data['name'] for _, meal_data in results))
+                move_selection(0)
+        
+        def move_selection(index):
+            """Select a result by index, keeping it visible"""
+            if not meal_items:
+                return
+            index = max(0, min(index, len(meal_items) - 1))
+            listbox.selection_clear(0, tk.END)
+            listbox.selection_set(index)
+            listbox.activate(index)
+            listbox.see(index)
+        
+        # Ranked fuzzy results can't be refined from a previous result set
+        search = IncrementalSearch(dialog, lambda search_term: self.search_index.rank(search_term, self.meals_library),
+                                   None, show_results, refine=False)
+        
+        # Bind search as you type (debounced)
+        search_var.trace('w', lambda *args: search.schedule(fold_search_text(search_var.get().strip())))
+        
+        # Stop pending searches when the dialog closes
+        dialog.bind("<Destroy>", lambda e: search.cancel() if e.widget is dialog else None)
+        
+        # Initial population
+        search.run("")
+        
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=10)
+        
+        def select_meal():
+            """Select the highlighted meal and apply it to the dish"""
+            # Apply a pending search first so Enter always picks the current best match
+            if search.after_id is not None:
+                search.run(fold_search_text(search_var.get().strip()))
+            
+            selection = listbox.curselection()
+            if not selection:
+                messagebox.showwarning("Warnung", "Bitte wählen Sie ein Gericht aus.")
+                return
+            
+            meal_id, meal_data = meal_items[selection[0]]
+            
+            # Set dish name
+            name_var.set(meal_data['name'])
+            
+            # Auto-set PDF and photo if available
+            if meal_data.get('pdf_path') and os.path.exists(meal_data['pdf_path']):
+                if dish_num in self.file_entries:
+                    self.file_entries[dish_num]['pdf'].set(meal_data['pdf_path'])
+            
+            if meal_data.get('image_path') and os.path.exists(meal_data['image_path']):
+                if dish_num in self.file_entries:
+                    self.file_entries[dish_num]['photo'].set(meal_data['image_path'])
+            
+            # Remember usage for ranking and the "zuletzt_verwendet" sort
+            meal_data['last_used'] = datetime.now().isoformat(timespec="seconds")
+            meal_data['use_count'] = meal_data.get('use_count', 0) + 1
+            self.save_meals_library(meal_id)
+            
+            # Update file operation state after selecting database meal
+            self.update_file_operation_state()
+            
+            dialog.destroy()
+        
+        # Double-click to select
+        listbox.bind("<Double-Button-1>", lambda e: select_meal())
+        
+        # Keyboard selection: Enter picks the highlighted (best) match, arrows move the highlight
+        def on_arrow(delta):
+            selection = listbox.curselection()
+            move_selection((selection[0] if selection else -1) + delta)
+            return "break"
+        
+        search_entry.bind("<Return>", lambda e: select_meal())
+        search_entry.bind("<Down>", lambda e: on_arrow(1))
+        search_entry.bind("<Up>", lambda e: on_arrow(-1))
+        listbox.bind("<Return>", lambda e: select_meal())
+        dialog.bind("<Escape>", lambda e: dialog.destroy())
+        
+        ttk.Button(button_frame, text="Auswählen", command=select_meal).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Button(button_frame, text="Abbrechen", command=dialog.destroy).pack(side=tk.RIGHT)
+        
+        # Focus on search entry
+        search_entry.focus_set()
+    
+    def toggle_empty_cell(self, dish_num):
+        """Toggle empty cell state and update widget appearance"""
+        self.update_widget_state(dish_num, disabled=self.week_plan.slots[dish_num].empty)
+    
+    def bind_slot_var(self, var, slot, attribute):
+        """Keep a DishSlot attribute in sync with the Tk variable of its widget"""
+        var.trace('w', lambda *args: setattr(slot, attribute, var.get()))
+    
+    def open_website(self):
+        """Open the generated website in the default browser"""
+        website_dir = self.website_path.get()
+        html_path = os.path.join(website_dir, "index.html")
+        
+        if os.path.exists(html_path):
+            webbrowser.open(f"file://{os.path.abspath(html_path)}")
+        else:
+            messagebox.showerror("Fehler", "Website-Datei nicht gefunden!")
+    
+    def open_project_folder(self, folder_path):
+        """Open the project folder in the file explorer"""
+        try:
+            if platform.system() == "Windows":
+                os.startfile(folder_path)
+            elif platform.system() == "Darwin":  # macOS
+                subprocess.run(["open", folder_path])
+            else:  # Linux
+                subprocess.run(["xdg-open", folder_path])
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Ordner konnte nicht geöffnet werden: {str(e)}")
+    
+    def browse_pdf(self, dish_num, var):
+        """Browse for PDF file"""
+        filename = filedialog.askopenfilename(
+            title=f"PDF für Gericht {dish_num} auswählen",
+            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+        )
+        if filename:
+            var.set(filename)
+    
+    def browse_photo(self, dish_num, var):
+        """Browse for photo file"""
+        filename = filedialog.askopenfilename(
+            title=f"Foto für Gericht {dish_num} auswählen",
+            filetypes=[("Image files", "*.jpg *.jpeg *.png *.gif *.bmp"), ("All files", "*.*")]
+        )
+        if filename:
+            var.set(filename)
+    
+    def browse_source_pdf(self, pdf_key):
+        """Browse for source PDF file"""
+        filename = filedialog.askopenfilename(
+            title=f"Download Link PDF auswählen",
+            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+        )
+        if filename:
+            self.source_files[pdf_key].set(filename)
+    
+    def create_zip_file(self, website_dir, on_done):
+        """Create ZIP file of the project in the background, on_done(zip_path, error) is called when finished"""
+        zip_filename = f"Essensplan_{self.week_start.get().replace('.', '_')}-{self.week_end.get().replace('.', '_')}.zip"
+        zip_path = os.path.join(website_dir, zip_filename)  # Save in same directory as website
+        # Skip earlier exports and the build manifest
+        skip = {file for file in os.listdir(website_dir) if file.lower().endswith(".zip")} | {BUILD_MANIFEST_FILE}
+        
+        progress_dialog = tk.Toplevel(self.root)
+        progress_dialog.title("ZIP erstellen")
+        progress_dialog.geometry("400x120")
+        progress_dialog.resizable(False, False)
+        progress_dialog.transient(self.root)
+        progress_dialog.grab_set()
+        progress_dialog.protocol("WM_DELETE_WINDOW", lambda: None)  # Wait for the ZIP to be written
+        
+        frame = ttk.Frame(progress_dialog, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+        status_label = ttk.Label(frame, text="Dateien werden gesammelt...")
+        status_label.pack(anchor=tk.W, pady=(0, 10))
+        progress_bar = ttk.Progressbar(frame, mode="determinate")
+        progress_bar.pack(fill=tk.X)
+        
+        def on_progress(done, total, name):
+            progress_bar.configure(maximum=total, value=done)
+            status_label.configure(text=f"{done} von {total} Dateien ({name})")
+        
+        def finished(result, error):
+            progress_dialog.destroy()
+            on_done(zip_path, error)
+        
+        BackgroundTask(self.root, lambda progress: write_site_zip(website_dir, zip_path, skip, progress),
+                       on_progress, finished).start()
+    
+    def copy_files_and_finish(self):
+        """Copy and rename files to website directory"""
+        website_dir = self.website_path.get()
+        
+        # Handle subfolder renaming
+        if self.rename_subfolder.get():
+            parent_dir = os.path.dirname(website_dir)
+            new_folder_name = f"Essensplan {self.week_start.get()} - {self.week_end.get()}"
+            new_website_dir = os.path.join(parent_dir, new_folder_name)
+            
+            if website_dir != new_website_dir:
+                try:
+                    os.rename(website_dir, new_website_dir)
+                    website_dir = new_website_dir
+                    self.website_path.set(website_dir)
+                except Exception as e:
+                    messagebox.showwarning("Warnung", f"Ordner konnte nicht umbenannt werden: {str(e)}")
+        
+        try:
+            # Photo optimization settings
+            photo_options = None
+            if self.optimize_photos.get():
+                try:
+                    max_dimension = int(self.photo_max_dimension.get())
+                    if max_dimension <= 0:
+                        raise ValueError
+                except ValueError:
+                    messagebox.showerror("Fehler", "Bitte geben Sie eine gültige maximale Fotogröße in Pixeln ein!")
+                    return
+                photo_options = {"max_dimension": max_dimension, "format": self.photo_format.get(),
+                                 "widths": [width for width in PHOTO_SRCSET_WIDTHS if width < max_dimension]}
+            
+            # File names are resolved while collecting and staging, index.html is written once afterwards
+            self.site_media = SiteMedia(website_dir, move=self.file_operation.get() != "copy",
+                                        dedupe=self.dedupe_media.get(), photo_options=photo_options,
+                                        embed_photos=self.embed_thumbnails.get() and self.show_photos.get())
+            self.site_media.add_plan(self.current_plan())
+            
+            self.stage_files_with_progress(self.site_media, website_dir)
+        
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Fehler beim Kopieren der Dateien: {str(e)}")
+    
+    def stage_files_with_progress(self, media, website_dir):
+        """Copy changed files in the background behind a modal progress dialog, then finish up"""
+        jobs = media.jobs
+        progress_dialog = tk.Toplevel(self.root)
+        progress_dialog.title("Dateien kopieren")
+        progress_dialog.geometry("400x120")
+        progress_dialog.resizable(False, False)
+        progress_dialog.transient(self.root)
+        progress_dialog.grab_set()
+        progress_dialog.protocol("WM_DELETE_WINDOW", lambda: None)  # Wait for the copy to finish
+        
+        frame = ttk.Frame(progress_dialog, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+        status_label = ttk.Label(frame, text=f"0 von {len(jobs)} Dateien kopiert")
+        status_label.pack(anchor=tk.W, pady=(0, 10))
+        progress_bar = ttk.Progressbar(frame, maximum=max(len(jobs), 1), mode="determinate")
+        progress_bar.pack(fill=tk.X)
+        
+        def on_progress(done, total, job, error):
+            progress_bar["value"] = done
+            status_label.configure(text=f"{done} von {total} Dateien kopiert ({job['label']})")
+        
+        photo_pool = start_process_pool(PHOTO_WORKERS) if media.needs_photo_pool() else None
+        
+        def on_done(errors):
+            progress_dialog.destroy()
+            if photo_pool is not None:
+                photo_pool.shutdown(wait=False)
+            media.finish(errors)
+            
+            # Write HTML with updated names, empty cells and final file names
+            report = None
+            plan = self.current_plan()
+            self.built_plan = replace(plan, slots={n: replace(slot) for n, slot in plan.slots.items()})
+            try:
+                report = write_site_pages(website_dir, self.built_plan)
+            except OSError as e:
+                messagebox.showerror("Fehler", f"Fehler beim Schreiben der HTML-Datei: {str(e)}")
+            
+            # Precompressed sidecars for static hosting
+            precompressed_paths = [os.path.join(website_dir, name) for name in PRECOMPRESSED_FILES]
+            try:
+                if self.precompress_assets.get():
+                    precompress_files(precompressed_paths, media.manifest)
+                else:
+                    remove_precompressed(media.manifest, precompressed_paths)
+            except Exception as e:
+                messagebox.showwarning("Warnung", f"Komprimierte Dateien konnten nicht aktualisiert werden: {str(e)}")
+            media.manifest.save()
+            
+            # Clean up temporary files in copy mode
+            if self.file_operation.get() == "copy":
+                self.cleanup_temp_files(website_dir)
+            
+            if errors:
+                details = "\n".join(f"• {job['label']}: {error}" for job, error in errors[:10])
+                if len(errors) > 10:
+                    details += f"\n… und {len(errors) - 10} weitere"
+                messagebox.showwarning("Warnung", f"{len(errors)} Datei(en) konnten nicht kopiert werden:\n{details}")
+            
+            # Custom success dialog - no automatic ZIP creation
+            self.show_success_dialog(website_dir, report)
+        
+        FileCopyBatch(self.root, jobs, on_progress, on_done, manifest=media.manifest, photo_pool=photo_pool).start()
+    
+    def show_success_dialog(self, website_dir, report=None):
+        """Show custom success dialog with all options"""
+        success_dialog = tk.Toplevel(self.root)
+        success_dialog.title("Erfolg")
+        success_dialog.geometry("600x340" if report else "600x300")  # Made larger to accommodate more buttons
+        success_dialog.resizable(False, False)
+        
+        # Center the dialog
+        success_dialog.transient(self.root)
+        success_dialog.grab_set()
+        
+        # Success message
+        message_frame = ttk.Frame(success_dialog, padding="20")
+        message_frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(message_frame, text="✓ Essensplan wurde erfolgreich erstellt!", 
+                 font=("Arial", 12, "bold"), foreground="green").pack(pady=(0, 10))
+        
+        ttk.Label(message_frame, text=f"Speicherort: {website_dir}", 
+                 font=("Arial", 9), wraplength=550).pack(pady=(0, 10 if report else 20))
+        
+        # Size/time report of single-file exports
+        if report:
+            ttk.Label(message_frame, text=report, font=("Arial", 9), foreground="gray",
+                      wraplength=550).pack(pady=(0, 10))
+        
+        # Buttons frame - organized in two rows
+        button_frame = ttk.Frame(message_frame)
+        button_frame.pack(pady=10)
+        
+        # First row of buttons
+        first_row = ttk.Frame(button_frame)
+        first_row.pack(pady=(0, 10))
+        
+        # Netlify button
+        def open_netlify():
+            webbrowser.open("https://app.netlify.com/drop")
+        
+        ttk.Button(first_row, text="Netlify öffnen", 
+                  command=open_netlify).pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Open project folder button
+        ttk.Button(first_row, text="Projektordner öffnen", 
+                  command=lambda: self.open_project_folder(website_dir)).pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Open website button
+        ttk.Button(first_row, text="Website öffnen", 
+                  command=self.open_website).pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Screenshot button
+        ttk.Button(first_row, text="Screenshot", 
+                  command=lambda: self.show_screenshot_dialog(website_dir)).pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Second row of buttons
+        second_row = ttk.Frame(button_frame)
+        second_row.pack()
+        
+        # Create ZIP in same folder button
+        def zip_created(zip_path_in_folder, error):
+            if success_dialog.winfo_exists():
+                success_dialog.grab_set()  # The progress dialog took the grab
+            if error is not None:
+                messagebox.showerror("Fehler", f"Fehler beim Erstellen der ZIP-Datei: {str(error)}")
+            else:
+                messagebox.showinfo("ZIP erstellt", f"ZIP-Datei wurde im Projektordner erstellt:\n{os.path.basename(zip_path_in_folder)}")
+        
+        def create_zip_in_folder():
+            try:
+                self.create_zip_file(website_dir, zip_created)
+            except Exception as e:
+                messagebox.showerror("Fehler", f"Fehler beim Erstellen der ZIP-Datei: {str(e)}")
+        
+        ttk.Button(second_row, text="ZIP im Projektordner erstellen", 
+                  command=create_zip_in_folder).pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Copy week name button  
+        def copy_week_name():
+            try:
+                # Convert date format to week name format
+                start_date = datetime.strptime(self.week_start.get(), "%d.%m.%y")
+                end_date = datetime.strptime(self.week_end.get(), "%d.%m.%y")
+                
+                # Format dates as required: dd-mm-yy
+                start_formatted = start_date.strftime("%d-%m-%y")
+                end_formatted = end_date.strftime("%d-%m-%y")
+                
+                # Create week name in the format: woche-14-07-25bis20-07-25
+                week_name = f"woche-{start_formatted}bis{end_formatted}"
+                
+                # Copy to clipboard
+                self.root.clipboard_clear()
+                self.root.clipboard_append(week_name)
+                
+                messagebox.showinfo("Erfolg", f"Wochenname '{week_name}' in Zwischenablage kopiert!")
+                
+            except Exception as e:
+                messagebox.showerror("Fehler", f"Fehler beim Erstellen des Wochennamens: {str(e)}")
+        
+        ttk.Button(second_row, text="Wochenname kopieren", 
+                  command=copy_week_name).pack(side=tk.LEFT, padx=(0, 10))
+        
+        # OK button
+        def close_dialog():
+            success_dialog.destroy()
+            self.root.quit()
+        
+        ttk.Button(second_row, text="OK", 
+                  command=close_dialog).pack(side=tk.LEFT)
+        
+        # Center the window
+        success_dialog.update_idletasks()
+        x = (success_dialog.winfo_screenwidth() // 2) - (success_dialog.winfo_width() // 2)
+        y = (success_dialog.winfo_screenheight() // 2) - (success_dialog.winfo_height() // 2)
+        success_dialog.geometry(f"+{x}+{y}")
+    
+    def cleanup_temp_files(self, website_dir):
+        """Clean up temporary clipboard files"""
+        try:
+            photos_dir = os.path.join(website_dir, "media", "photos")
+            if os.path.exists(photos_dir):
+                for filename in os.listdir(photos_dir):
+                    if filename.startswith("temp_clipboard_"):
+                        temp_file = os.path.join(photos_dir, filename)
+                        try:
+                            os.remove(temp_file)
+                        except OSError:
+                            pass  # File might already be moved/deleted
+        except Exception as e:
+            print(f"Warning: Could not clean up temp files: {e}")
+    
+    def show_screenshot_dialog(self, website_dir):
+        """Show screenshot options dialog"""
+        screenshot_dialog = tk.Toplevel(self.root)
+        screenshot_dialog.title("Screenshot Optionen")
+        screenshot_dialog.geometry("400x260")
+        screenshot_dialog.resizable(False, False)
+        
+        # Center the dialog
+        screenshot_dialog.transient(self.root)
+        screenshot_dialog.grab_set()
+        
+        main_frame = ttk.Frame(screenshot_dialog, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(main_frame, text="Screenshot der HTML-Seite erstellen:", 
+                 font=("Arial", 12, "bold")).pack(pady=(0, 10))
+        
+        ttk.Checkbutton(main_frame, text="Ohne Browser zeichnen (schnell)",
+                       variable=self.screenshot_native).pack(anchor=tk.W)
+        ttk.Checkbutton(main_frame, text="Ganze Seite (an Tabelle angepasst)",
+                       variable=self.screenshot_full_page).pack(anchor=tk.W, pady=(0, 10))
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(pady=10)
+        
+        def screenshot_to_clipboard():
+            try:
+                self.take_website_screenshot(website_dir, to_clipboard=True, full_page=self.screenshot_full_page.get(),
+                                             native=self.screenshot_native.get())
+                screenshot_dialog.destroy()
+                messagebox.showinfo("Erfolg", "Screenshot wurde in die Zwischenablage kopiert!")
+            except Exception as e:
+                messagebox.showerror("Fehler", f"Screenshot-Fehler: {str(e)}")
+        
+        def screenshot_to_file():
+            try:
+                save_path = filedialog.asksaveasfilename(
+                    title="Screenshot speichern als",
+                    defaultextension=".png",
+                    filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg"), ("All files", "*.*")]
+                )
+                if save_path:
+                    self.take_website_screenshot(website_dir, save_path=save_path,
+                                                 full_page=self.screenshot_full_page.get(),
+                                                 native=self.screenshot_native.get())
+                    screenshot_dialog.destroy()
+                    messagebox.showinfo("Erfolg", f"Screenshot wurde gespeichert: {save_path}")
+            except Exception as e:
+                messagebox.showerror("Fehler", f"Screenshot-Fehler: {str(e)}")
+        
+        ttk.Button(button_frame, text="In Zwischenablage", 
+                  command=screenshot_to_clipboard).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Button(button_frame, text="Als Datei speichern", 
+                  command=screenshot_to_file).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Button(button_frame, text="Abbrechen", 
+                  command=screenshot_dialog.destroy).pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Center the window
+        screenshot_dialog.update_idletasks()
+        x = (screenshot_dialog.winfo_screenwidth() // 2) - (screenshot_dialog.winfo_width() // 2)
+        y = (screenshot_dialog.winfo_screenheight() // 2) - (screenshot_dialog.winfo_height() // 2)
+        screenshot_dialog.geometry(f"+{x}+{y}")
+    
+    def take_website_screenshot(self, website_dir, to_clipboard=False, save_path=None, full_page=False, native=False):
+        """Take screenshot of the website, drawn with Pillow or with the shared browser session"""
+        try:
+            html_path = os.path.join(website_dir, "index.html")
+            if not os.path.exists(html_path):
+                raise Exception("HTML-Datei nicht gefunden!")
+            
+            if native:
+                # Draw the plan of the built page, not the form as it is now
+                plan = self.built_plan if self.built_plan is not None else self.current_plan()
+                img = render_plan_image(plan, website_dir)
+                if to_clipboard:
+                    copy_image_to_clipboard(img)
+                elif save_path:
+                    save_plan_image(img, save_path)
+                return
+            
+            try:
+                png = self.screenshot_session.capture(html_path, full_page)
+            except ImportError:
+                messagebox.showerror("Fehler", "Selenium ist nicht installiert.\nInstallieren Sie es mit: pip install selenium webdriver-manager\n"
+                                     "oder wählen Sie \"Ohne Browser zeichnen\".")
+                return
+            
+            if to_clipboard:
+                copy_image_to_clipboard(Image.open(io.BytesIO(png)))
+            elif save_path:
+                save_screenshot(png, save_path)
+                
+        except Exception as e:
+            raise Exception(f"Screenshot konnte nicht erstellt werden: {str(e)}")
+    
+    def on_form_change(self, event=None):
+        """Track when form fields change"""
+        self.form_changed = True
+    
+    def has_form_changes(self):
+        """Check if any form values have changed"""
+        if not hasattr(self, 'original_values'):
+            return False
+        
+        current_values = {
+            'website_path': self.website_path.get(),
+            'week_start': self.week_start.get(),
+            'week_end': self.week_end.get(),
+            'breakfast_rows': self.breakfast_rows.get(),
+            'lunch_rows': self.lunch_rows.get(),
+            'snacks_rows': self.snacks_rows.get(),
+            'dessert_rows': self.dessert_rows.get(),
+            'empty_cell_display': self.empty_cell_display.get(),
+            'show_photos': self.show_photos.get(),
+            'show_sources_box': self.show_sources_box.get(),
+            'source_pdf1_name': self.source_pdf1_name.get(),
+            'source_pdf2_name': self.source_pdf2_name.get(),
+            'rename_subfolder': self.rename_subfolder.get()
+        }
+        
+        return current_values != self.original_values
+    
+    def go_back_to_library_with_warning(self):
+        """Go back to meal library page with unsaved changes warning"""
+        if self.has_form_changes():
+            if messagebox.askyesno("Ungespeicherte Änderungen", 
+                                 "Sie haben ungespeicherte Änderungen. Sind Sie sicher, dass Sie zurück gehen möchten? Alle Änderungen gehen verloren."):
+                self.setup_meal_library_page()
+        else:
+            self.setup_meal_library_page()
+    
+    def go_back_to_page1_with_warning(self):
+        """Go back to page1 with unsaved changes warning for page2"""
+        if hasattr(self, 'file_entries') and self.file_entries:
+            # Check if any file assignments have been made
+            has_assignments = False
+            for dish_num, slot in self.week_plan.slots.items():
+                name_changed = slot.name != f"Gericht {dish_num}"
+                
+                if slot.photo or slot.pdf or name_changed:
+                    has_assignments = True
+                    break
+            
+            if has_assignments:
+                if messagebox.askyesno("Ungespeicherte Änderungen", 
+                                     "Sie haben ungespeicherte Datei-Zuordnungen. Sind Sie sicher, dass Sie zurück gehen möchten? Alle Änderungen gehen verloren."):
+                    self.setup_page1()
+            else:
+                self.setup_page1()
+        else:
+            self.setup_page1()
+
+def preload_modules(root, names=PRELOAD_MODULES):
+    """Import the deferred modules in the background of the Tk loop, one per callback"""
+    if names:
+        importlib.import_module(names[0])
+        root.after(PRELOAD_INTERVAL_MS, preload_modules, root, names[1:])
+
+
+def profile_startup(top=15):
+    """Report where startup time goes: compiling, imports (like python -X importtime), first window,
+    deferred modules
+    
+    The started script is compiled on every start, imported modules only if their cached .pyc is outdated.
+    """
+    module_path = os.path.abspath(__file__)
+    script_dir = os.path.dirname(module_path)
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    launcher = os.path.abspath(sys.argv[0])
+    compiled = [(launcher, "bei jedem Start")]
+    if launcher != module_path:
+        compiled.append((module_path, "nur ohne aktuelle .pyc"))
+    for path, when in compiled:
+        with open(path, "rb") as f:
+            source = f.read()
+        start = time.perf_counter()
+        compile(source, path, "exec")
+        print(f"Kompilieren von {os.path.basename(path)} ({when}): {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    # Measure a normal start, where the bytecode of the module is already cached
+    subprocess.run([sys.executable, "-c", f"import {module_name}"], cwd=script_dir, capture_output=True)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+                            cwd=script_dir, capture_output=True, text=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        imports.append((int(cumulative), int(own), name.rstrip()))
+    module_times = next(((cumulative, own) for cumulative, own, name in imports if name.strip() == module_name),
+                        None)
+    if module_times is None:
+        print(f"Import-Zeiten konnten nicht gemessen werden:\n{result.stderr}")
+    else:
+        total, own = module_times
+        print(f"Import von {module_name}: {total / 1000:.1f} ms (davon {own / 1000:.1f} ms im Modul selbst)")
+        print(f"{'kumuliert':>10} {'selbst':>9}  Modul")
+        for cumulative, own, name in sorted(imports, reverse=True)[1:top + 1]:
+            print(f"{cumulative / 1000:8.1f} ms {own / 1000:6.1f} ms  {name}")
+    
+    start = time.perf_counter()
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Kein Fenster möglich ({e}), Fenster-Zeit wird nicht gemessen")
+        root = None
+    if root is not None:
+        app = MealPlanGenerator(root)
+        root.update()
+        print(f"Erstes Fenster: {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    print("Nachgeladene Module:")
+    for name in PRELOAD_MODULES:
+        if name in sys.modules:
+            print(f"  {name}: bereits beim Start geladen")
+            continue
+        start = time.perf_counter()
+        importlib.import_module(name)
+        print(f"  {name}: {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    if root is not None:
+        app.image_decoder.shutdown()
+        app.screenshot_session.close()
+        app.close_meal_library()
+        root.destroy()
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"muss mindestens 1 sein: {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Essensplan Generator")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Import- und Startzeiten bis zum ersten Fenster ausgeben und beenden")
+    parser.add_argument("--build", metavar="PLAN.json",
+                        help="Webseiten aller Wochen aus einer Plan-Datei ohne Oberfläche erstellen")
+    parser.add_argument("--screenshots", action="store_true",
+                        help="Mit --build: ganzseitigen Screenshot jeder Woche neben dem Webseiten-Ordner speichern")
+    parser.add_argument("--images", action="store_true",
+                        help="Mit --build: Bild jeder Woche ohne Browser zeichnen und als \"<Ordner> Bild.png\" "
+                             "neben dem Webseiten-Ordner speichern")
+    parser.add_argument("--jobs", type=positive_int, default=None, metavar="N",
+                        help="Anzahl paralleler Prozesse für --build (Standard: eine pro Woche, höchstens CPU-Anzahl)")
+    args = parser.parse_args()
+    if args.build:
+        sys.exit(1 if build_plan_file(args.build, args.jobs, args.screenshots, args.images) else 0)
+    if args.profile_startup:
+        profile_startup()
+        return
+    
+    root = tk.Tk()
+    app = MealPlanGenerator(root)
+    root.after(PRELOAD_DELAY_MS, preload_modules, root)
+    root.mainloop()
+    app.image_decoder.shutdown()
+    app.screenshot_session.close()
+    app.close_meal_library()
+
+if __name__ == "__main__":
+    main()